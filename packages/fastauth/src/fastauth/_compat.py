@@ -1,6 +1,8 @@
 import importlib
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def _has_package(package_name: str) -> bool:
     try:
         importlib.import_module(package_name)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 from datetime import datetime, timezone
 
 from cuid2 import cuid_wrapper
@@ -27,6 +28,12 @@ class MemoryUserAdapter(UserAdapter):
         self._passwords: dict[str, str | None] = {}
         self._email_index: dict[str, str] = {}
 
+    def clear(self) -> None:
+        """Remove all stored users, passwords, and email index entries."""
+        self._users.clear()
+        self._passwords.clear()
+        self._email_index.clear()
+
     async def create_user(
         self, email: str, hashed_password: str | None = None, **kwargs: object
     ) -> UserData:
@@ -89,7 +96,6 @@ class MemoryUserAdapter(UserAdapter):
             del self._email_index[old_email]
             self._email_index[kwargs["email"]] = user_id  # type: ignore[index]
 
-        self._users[user_id] = user
         return user
 
     async def delete_user(self, user_id: str, soft: bool = True) -> None:
@@ -99,7 +105,6 @@ class MemoryUserAdapter(UserAdapter):
 
         if soft:
             user["is_active"] = False
-            self._users[user_id] = user
         else:
             del self._email_index[normalize_email(user["email"])]
             del self._users[user_id]
@@ -119,49 +124,65 @@ class MemoryTokenAdapter:
 
     def __init__(self) -> None:
         self._tokens: dict[str, TokenData] = {}
+        self._user_index: dict[str, set[str]] = {}
+
+    def clear(self) -> None:
+        """Remove all stored tokens."""
+        self._tokens.clear()
+        self._user_index.clear()
+
+    def _remove(self, token: str) -> TokenData | None:
+        stored = self._tokens.pop(token, None)
+        if stored is not None:
+            user_tokens = self._user_index.get(stored["user_id"])
+            if user_tokens is not None:
+                user_tokens.discard(token)
+                if not user_tokens:
+                    del self._user_index[stored["user_id"]]
+        return stored
 
     async def create_token(self, token: TokenData) -> TokenData:
-        self._tokens[token["token"]] = token
+        key = token["token"]
+        # Drop any previous row so its user index entry does not go stale.
+        self._remove(key)
+        self._tokens[key] = token
+        self._user_index.setdefault(token["user_id"], set()).add(key)
         return token
 
-    async def get_token(self, token: str, token_type: str) -> TokenData | None:
+    def _valid(self, token: str, token_type: str) -> TokenData | None:
         stored = self._tokens.get(token)
-        if stored is None:
-            return None
-        if stored["token_type"] != token_type:
+        if stored is None or stored["token_type"] != token_type:
             return None
         if stored["expires_at"] < datetime.now(timezone.utc):
-            del self._tokens[token]
+            self._remove(token)
             return None
         return stored
 
+    async def get_token(self, token: str, token_type: str) -> TokenData | None:
+        return self._valid(token, token_type)
+
     async def delete_token(self, token: str) -> None:
-        self._tokens.pop(token, None)
+        self._remove(token)
 
     async def consume_token(self, token: str, token_type: str) -> TokenData | None:
-        stored = self._tokens.get(token)
-        if stored is None:
-            return None
-        if stored["token_type"] != token_type:
-            return None
-        if stored["expires_at"] < datetime.now(timezone.utc):
-            self._tokens.pop(token, None)
+        if self._valid(token, token_type) is None:
             return None
         # Type and expiry match — atomically remove and return the row.
-        self._tokens.pop(token, None)
-        return stored
+        return self._remove(token)
 
     async def delete_user_tokens(
         self, user_id: str, token_type: str | None = None
     ) -> None:
+        user_tokens = self._user_index.get(user_id)
+        if not user_tokens:
+            return
         to_delete = [
             key
-            for key, t in self._tokens.items()
-            if t["user_id"] == user_id
-            and (token_type is None or t["token_type"] == token_type)
+            for key in user_tokens
+            if token_type is None or self._tokens[key]["token_type"] == token_type
         ]
         for key in to_delete:
-            del self._tokens[key]
+            self._remove(key)
 
 
 class MemorySessionAdapter:
@@ -169,44 +190,74 @@ class MemorySessionAdapter:
 
     def __init__(self) -> None:
         self._sessions: dict[str, SessionData] = {}
+        self._user_index: dict[str, set[str]] = {}
+        # Min-heap of (expires_at, session_id). Entries for deleted or
+        # re-created sessions are left in place and skipped when popped; the
+        # heap is rebuilt once they outnumber the live sessions.
+        self._expiry_heap: list[tuple[datetime, str]] = []
+
+    def clear(self) -> None:
+        """Remove all stored sessions."""
+        self._sessions.clear()
+        self._user_index.clear()
+        self._expiry_heap.clear()
+
+    def _remove(self, session_id: str) -> None:
+        session = self._sessions.pop(session_id, None)
+        if session is not None:
+            user_sessions = self._user_index.get(session["user_id"])
+            if user_sessions is not None:
+                user_sessions.discard(session_id)
+                if not user_sessions:
+                    del self._user_index[session["user_id"]]
 
     async def create_session(self, session: SessionData) -> SessionData:
+        self._remove(session["id"])
         self._sessions[session["id"]] = session
+        self._user_index.setdefault(session["user_id"], set()).add(session["id"])
+        heapq.heappush(self._expiry_heap, (session["expires_at"], session["id"]))
+        if len(self._expiry_heap) > 2 * len(self._sessions):
+            self._compact_expiry_heap()
         return session
 
+    def _compact_expiry_heap(self) -> None:
+        self._expiry_heap = [
+            (s["expires_at"], sid) for sid, s in self._sessions.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+
     async def get_session(self, session_id: str) -> SessionData | None:
         session = self._sessions.get(session_id)
         if not session:
             return None
         if session["expires_at"] < datetime.now(timezone.utc):
-            del self._sessions[session_id]
+            self._remove(session_id)
             return None
         return session
 
     async def delete_session(self, session_id: str) -> None:
-        self._sessions.pop(session_id, None)
+        self._remove(session_id)
 
     async def delete_user_sessions(self, user_id: str) -> None:
-        to_delete = [
-            sid for sid, s in self._sessions.items() if s["user_id"] == user_id
-        ]
-        for sid in to_delete:
+        for sid in self._user_index.pop(user_id, set()):
             del self._sessions[sid]
 
     async def list_user_sessions(self, user_id: str) -> list[SessionData]:
         now = datetime.now(timezone.utc)
-        return [
-            s
-            for s in self._sessions.values()
-            if s["user_id"] == user_id and s["expires_at"] > now
-        ]
+        sessions = (self._sessions[sid] for sid in self._user_index.get(user_id, ()))
+        return [s for s in sessions if s["expires_at"] > now]
 
     async def cleanup_expired(self) -> int:
         now = datetime.now(timezone.utc)
-        expired = [sid for sid, s in self._sessions.items() if s["expires_at"] < now]
-        for sid in expired:
-            del self._sessions[sid]
-        return len(expired)
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now:
+            expires_at, sid = heapq.heappop(heap)
+            session = self._sessions.get(sid)
+            if session is not None and session["expires_at"] == expires_at:
+                self._remove(sid)
+                removed += 1
+        return removed
 
 
 class MemoryRoleAdapter:
@@ -215,6 +266,13 @@ class MemoryRoleAdapter:
     def __init__(self) -> None:
         self._roles: dict[str, RoleData] = {}
         self._user_roles: dict[str, set[str]] = {}
+        self._role_members: dict[str, set[str]] = {}
+
+    def clear(self) -> None:
+        """Remove all roles and role assignments."""
+        self._roles.clear()
+        self._user_roles.clear()
+        self._role_members.clear()
 
     async def create_role(
         self, name: str, permissions: list[str] | None = None
@@ -234,8 +292,8 @@ class MemoryRoleAdapter:
 
     async def delete_role(self, name: str) -> None:
         self._roles.pop(name, None)
-        for user_roles in self._user_roles.values():
-            user_roles.discard(name)
+        for user_id in self._role_members.pop(name, set()):
+            self._user_roles[user_id].discard(name)
 
     async def add_permissions(self, role_name: str, permissions: list[str]) -> None:
         role = self._roles.get(role_name)
@@ -252,25 +310,23 @@ class MemoryRoleAdapter:
             role["permissions"] = list(existing)
 
     async def assign_role(self, user_id: str, role_name: str) -> None:
-        if user_id not in self._user_roles:
-            self._user_roles[user_id] = set()
-        self._user_roles[user_id].add(role_name)
+        self._user_roles.setdefault(user_id, set()).add(role_name)
+        self._role_members.setdefault(role_name, set()).add(user_id)
 
     async def revoke_role(self, user_id: str, role_name: str) -> None:
         if user_id in self._user_roles:
             self._user_roles[user_id].discard(role_name)
+        if role_name in self._role_members:
+            self._role_members[role_name].discard(user_id)
 
     async def get_user_roles(self, user_id: str) -> list[str]:
         return list(self._user_roles.get(user_id, set()))
 
     async def get_user_permissions(self, user_id: str) -> set[str]:
         roles = self._user_roles.get(user_id, set())
-        permissions: set[str] = set()
-        for role_name in roles:
-            role = self._roles.get(role_name)
-            if role:
-                permissions.update(role["permissions"])
-        return permissions
+        return set().union(
+            *(self._roles[name]["permissions"] for name in roles if name in self._roles)
+        )
 
 
 class MemoryOAuthAccountAdapter:
@@ -278,10 +334,18 @@ class MemoryOAuthAccountAdapter:
 
     def __init__(self) -> None:
         self._accounts: dict[tuple[str, str], OAuthAccountData] = {}
+        self._user_index: dict[str, list[tuple[str, str]]] = {}
+
+    def clear(self) -> None:
+        """Remove all linked OAuth accounts."""
+        self._accounts.clear()
+        self._user_index.clear()
 
     async def create_oauth_account(self, account: OAuthAccountData) -> OAuthAccountData:
         key = (account["provider"], account["provider_account_id"])
+        self._remove(key)
         self._accounts[key] = account
+        self._user_index.setdefault(account["user_id"], []).append(key)
         return account
 
     async def get_oauth_account(
@@ -290,12 +354,20 @@ class MemoryOAuthAccountAdapter:
         return self._accounts.get((provider, provider_account_id))
 
     async def get_user_oauth_accounts(self, user_id: str) -> list[OAuthAccountData]:
-        return [a for a in self._accounts.values() if a["user_id"] == user_id]
+        keys = self._user_index.get(user_id, [])
+        return [self._accounts[key] for key in keys]
 
     async def delete_oauth_account(
         self, provider: str, provider_account_id: str
     ) -> None:
-        self._accounts.pop((provider, provider_account_id), None)
+        self._remove((provider, provider_account_id))
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        account = self._accounts.pop(key, None)
+        if account:
+            keys = self._user_index.get(account["user_id"], [])
+            if key in keys:
+                keys.remove(key)
 
 
 class MemoryPasskeyAdapter:
@@ -305,6 +377,11 @@ class MemoryPasskeyAdapter:
         self._passkeys: dict[str, PasskeyData] = {}
         self._user_index: dict[str, list[str]] = {}
 
+    def clear(self) -> None:
+        """Remove all stored passkeys."""
+        self._passkeys.clear()
+        self._user_index.clear()
+
     async def create_passkey(
         self,
         user_id: str,
@@ -314,8 +391,6 @@ class MemoryPasskeyAdapter:
         aaguid: str,
         name: str,
     ) -> PasskeyData:
-        from datetime import datetime, timezone
-
         now = datetime.now(timezone.utc).isoformat()
         passkey: PasskeyData = {
             "id": credential_id,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -60,13 +60,19 @@ class SQLAlchemyAdapter:
     """
 
     def __init__(
-        self, engine_url: str | None = None, engine: AsyncEngine | None = None
+        self,
+        engine_url: str | None = None,
+        engine: AsyncEngine | None = None,
+        **engine_kwargs: Any,
     ) -> None:
         """Initialize the adapter with a connection URL or an existing engine.
 
         Args:
             engine_url: SQLAlchemy async connection string.
             engine: A pre-created :class:`~sqlalchemy.ext.asyncio.AsyncEngine`.
+            **engine_kwargs: Extra arguments forwarded to
+                :func:`~sqlalchemy.ext.asyncio.create_async_engine` when
+                *engine_url* is used, e.g. ``pool_size`` or ``pool_recycle``.
 
         Raises:
             ValueError: If neither *engine_url* nor *engine* is provided.
@@ -74,22 +80,28 @@ class SQLAlchemyAdapter:
         if engine:
             self._engine = engine
         elif engine_url:
-            self._engine = create_async_engine(engine_url)
+            self._engine = create_async_engine(engine_url, **engine_kwargs)
         else:
             raise ValueError("Provide either engine_url or engine")
 
         self._session_factory = async_sessionmaker(
             self._engine, class_=AsyncSession, expire_on_commit=False
         )
+        self._tables_created = False
 
     async def create_tables(self) -> None:
         """Create all FastAuth database tables if they do not already exist.
 
         Safe to call on every startup — uses ``CREATE TABLE IF NOT EXISTS``
-        semantics via SQLAlchemy's ``create_all``.
+        semantics via SQLAlchemy's ``create_all``. Once the tables have been
+        created, later calls on the same adapter return without touching the
+        database.
         """
+        if self._tables_created:
+            return
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+        self._tables_created = True
 
     async def drop_tables(self) -> None:
         """Drop all FastAuth database tables.
@@ -99,6 +111,7 @@ class SQLAlchemyAdapter:
         """
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
+        self._tables_created = False
 
     @property
     def user(self) -> SQLAlchemyUserAdapter:
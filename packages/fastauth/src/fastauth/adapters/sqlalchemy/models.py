@@ -84,10 +84,15 @@ role_permissions = Table(
 
 class SessionModel(Base):
     __tablename__ = "fastauth_sessions"
+    # Keyed by a random string, so SQLite can store rows in the primary-key
+    # B-tree directly. The option is ignored by other dialects.
+    __table_args__ = {"sqlite_with_rowid": False}
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("fastauth_users.id"))
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    user_id: Mapped[str] = mapped_column(
+        String, ForeignKey("fastauth_users.id"), index=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
     ip_address: Mapped[str | None] = mapped_column(String, nullable=True)
     user_agent: Mapped[str | None] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -97,6 +102,7 @@ class SessionModel(Base):
 
 class TokenModel(Base):
     __tablename__ = "fastauth_tokens"
+    __table_args__ = {"sqlite_with_rowid": False}
 
     token: Mapped[str] = mapped_column(String, primary_key=True)
     user_id: Mapped[str] = mapped_column(
@@ -121,7 +127,9 @@ class OAuthAccountModel(Base):
     id: Mapped[str] = mapped_column(String, primary_key=True)
     provider: Mapped[str] = mapped_column(String)
     provider_account_id: Mapped[str] = mapped_column(String)
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("fastauth_users.id"))
+    user_id: Mapped[str] = mapped_column(
+        String, ForeignKey("fastauth_users.id"), index=True
+    )
     access_token: Mapped[str | None] = mapped_column(Text, nullable=True)
     refresh_token: Mapped[str | None] = mapped_column(Text, nullable=True)
     expires_at: Mapped[datetime | None] = mapped_column(
@@ -25,13 +25,32 @@ class SQLAlchemyRoleAdapter:
             await session.flush()
 
             perms = permissions or []
-            for perm in perms:
+            if perms:
                 await session.execute(
-                    insert(role_permissions).values(role_name=name, permission=perm)
+                    insert(role_permissions),
+                    [{"role_name": name, "permission": perm} for perm in perms],
                 )
             await session.commit()
             return {"name": name, "permissions": perms}
 
+    async def create_roles(self, roles: list[RoleData]) -> list[RoleData]:
+        """Create several roles and their permissions in two executemany INSERTs."""
+        if not roles:
+            return roles
+        async with self._session_factory() as session:
+            await session.execute(
+                insert(RoleModel), [{"name": role["name"]} for role in roles]
+            )
+            rows = [
+                {"role_name": role["name"], "permission": perm}
+                for role in roles
+                for perm in role["permissions"]
+            ]
+            if rows:
+                await session.execute(insert(role_permissions), rows)
+            await session.commit()
+        return roles
+
     async def get_role(self, name: str) -> RoleData | None:
         async with self._session_factory() as session:
             result = await session.execute(
@@ -51,19 +70,20 @@ class SQLAlchemyRoleAdapter:
 
     async def list_roles(self) -> list[RoleData]:
         async with self._session_factory() as session:
-            result = await session.execute(select(RoleModel))
-            roles = result.scalars().all()
-
-            role_list: list[RoleData] = []
-            for role in roles:
-                perm_result = await session.execute(
-                    select(role_permissions.c.permission).where(
-                        role_permissions.c.role_name == role.name
-                    )
+            result = await session.execute(
+                select(RoleModel.name, role_permissions.c.permission).outerjoin(
+                    role_permissions, RoleModel.name == role_permissions.c.role_name
                 )
-                perms = [row[0] for row in perm_result.fetchall()]
-                role_list.append({"name": role.name, "permissions": perms})
-            return role_list
+            )
+            perms_by_role: dict[str, list[str]] = {}
+            for name, perm in result.fetchall():
+                perms = perms_by_role.setdefault(name, [])
+                if perm is not None:
+                    perms.append(perm)
+            return [
+                {"name": name, "permissions": perms}
+                for name, perms in perms_by_role.items()
+            ]
 
     async def delete_role(self, name: str) -> None:
         async with self._session_factory() as session:
@@ -77,24 +97,25 @@ class SQLAlchemyRoleAdapter:
             await session.commit()
 
     async def add_permissions(self, role_name: str, permissions: list[str]) -> None:
+        if not permissions:
+            return
         async with self._session_factory() as session:
-            for perm in permissions:
-                await session.execute(
-                    insert(role_permissions).values(
-                        role_name=role_name, permission=perm
-                    )
-                )
+            await session.execute(
+                insert(role_permissions),
+                [{"role_name": role_name, "permission": perm} for perm in permissions],
+            )
             await session.commit()
 
     async def remove_permissions(self, role_name: str, permissions: list[str]) -> None:
+        if not permissions:
+            return
         async with self._session_factory() as session:
-            for perm in permissions:
-                await session.execute(
-                    delete(role_permissions).where(
-                        role_permissions.c.role_name == role_name,
-                        role_permissions.c.permission == perm,
-                    )
+            await session.execute(
+                delete(role_permissions).where(
+                    role_permissions.c.role_name == role_name,
+                    role_permissions.c.permission.in_(permissions),
                 )
+            )
             await session.commit()
 
     async def assign_role(self, user_id: str, role_name: str) -> None:
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, insert, select
 
 from fastauth.adapters.sqlalchemy.models import SessionModel
 from fastauth.types import SessionData
@@ -37,6 +37,27 @@ class SQLAlchemySessionAdapter:
             await db.commit()
             return session
 
+    async def create_sessions(self, sessions: list[SessionData]) -> list[SessionData]:
+        """Insert several sessions in a single executemany round-trip."""
+        if not sessions:
+            return sessions
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": session["id"],
+                "user_id": session["user_id"],
+                "expires_at": session["expires_at"],
+                "ip_address": session.get("ip_address"),
+                "user_agent": session.get("user_agent"),
+                "created_at": now,
+            }
+            for session in sessions
+        ]
+        async with self._session_factory() as db:
+            await db.execute(insert(SessionModel), rows)
+            await db.commit()
+        return sessions
+
     async def get_session(self, session_id: str) -> SessionData | None:
         async with self._session_factory() as db:
             now = datetime.now(timezone.utc)
@@ -76,12 +97,8 @@ class SQLAlchemySessionAdapter:
     async def cleanup_expired(self) -> int:
         async with self._session_factory() as db:
             now = datetime.now(timezone.utc)
-            count_result = await db.execute(
-                select(func.count())
-                .select_from(SessionModel)
-                .where(SessionModel.expires_at <= now)
+            result = await db.execute(
+                delete(SessionModel).where(SessionModel.expires_at <= now)
             )
-            count = count_result.scalar() or 0
-            await db.execute(delete(SessionModel).where(SessionModel.expires_at <= now))
             await db.commit()
-            return count
+            return result.rowcount or 0
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 
 from fastauth.adapters.sqlalchemy.models import TokenModel
 from fastauth.types import TokenData
@@ -38,6 +38,31 @@ class SQLAlchemyTokenAdapter:
             await session.commit()
             return token
 
+    async def create_tokens(self, tokens: list[TokenData]) -> list[TokenData]:
+        """Insert several tokens in a single executemany round-trip.
+
+        Unlike :meth:`create_token` this is a plain ``INSERT``; an existing
+        token value raises an integrity error instead of being overwritten.
+        """
+        if not tokens:
+            return tokens
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "token": token["token"],
+                "user_id": token["user_id"],
+                "token_type": token["token_type"],
+                "expires_at": token["expires_at"],
+                "created_at": now,
+                "raw_data": token["raw_data"] if "raw_data" in token else None,
+            }
+            for token in tokens
+        ]
+        async with self._session_factory() as session:
+            await session.execute(insert(TokenModel), rows)
+            await session.commit()
+        return tokens
+
     async def get_token(self, token: str, token_type: str) -> TokenData | None:
         async with self._session_factory() as session:
             now = datetime.now(timezone.utc)
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from cuid2 import cuid_wrapper
-from sqlalchemy import func, select, update
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.exc import IntegrityError
 
 from fastauth.adapters.sqlalchemy.models import UserModel
@@ -66,6 +66,56 @@ class SQLAlchemyUserAdapter:
             await session.refresh(user)
             return _to_user_data(user)
 
+    async def create_users(self, users: list[dict[str, Any]]) -> list[UserData]:
+        """Create several users in a single executemany round-trip.
+
+        Each item takes the same fields as :meth:`create_user` (``email`` plus
+        optional ``hashed_password``, ``name``, ``image``, ``email_verified``
+        and ``is_active``). The batch is all-or-nothing: if any normalized
+        email is already taken, nothing is inserted.
+
+        Raises:
+            UserAlreadyExistsError: If an email is already registered or
+                appears twice in *users*.
+        """
+        if not users:
+            return []
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": generate_id(),
+                "email": normalize_email(user["email"]),
+                "hashed_password": user.get("hashed_password"),
+                "name": user.get("name"),
+                "image": user.get("image"),
+                "email_verified": bool(user.get("email_verified", False)),
+                "is_active": user.get("is_active", True),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for user in users
+        ]
+        async with self._session_factory() as session:
+            try:
+                await session.execute(insert(UserModel), rows)
+                await session.commit()
+            except IntegrityError as e:
+                await session.rollback()
+                raise UserAlreadyExistsError(
+                    "One or more users in the batch already exist"
+                ) from e
+        return [
+            {
+                "id": row["id"],
+                "email": row["email"],
+                "name": row["name"],
+                "image": row["image"],
+                "email_verified": row["email_verified"],
+                "is_active": row["is_active"],
+            }
+            for row in rows
+        ]
+
     async def get_user_by_id(self, user_id: str) -> UserData | None:
         async with self._session_factory() as session:
             result = await session.execute(
@@ -32,6 +32,17 @@ def enforce_cookie_csrf(request: Request) -> None:
         )
 
 
+def _decode_cached(auth: Any, token_str: str) -> dict[str, Any]:
+    cache = auth.token_cache
+    if cache is None:
+        return decode_token(token_str, auth.config, auth.jwks_manager)
+    claims = cache.get(token_str)
+    if claims is None:
+        claims = decode_token(token_str, auth.config, auth.jwks_manager)
+        cache.put(token_str, claims)
+    return claims
+
+
 async def get_fastauth(request: Request):
     return request.app.state.fastauth
 
@@ -51,7 +62,7 @@ async def get_current_user(
         return None
 
     try:
-        claims = decode_token(token_str, auth.config, auth.jwks_manager)
+        claims = _decode_cached(auth, token_str)
         if claims.get("type") != "access":
             return None
         user = await auth.config.adapter.get_user_by_id(claims["sub"])
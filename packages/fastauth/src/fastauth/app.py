@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from fastauth.core.emails import EmailDispatcher
     from fastauth.core.jwks import JWKSManager
     from fastauth.core.protocols import RoleAdapter, SessionAdapter
+    from fastauth.core.tokens import VerifiedTokenCache
 
 
 class FastAuth:
@@ -48,6 +49,12 @@ class FastAuth:
         self.role_adapter: RoleAdapter | None = None
         self.jwks_manager: JWKSManager | None = None
         self.email_dispatcher: EmailDispatcher | None = None
+        self.token_cache: VerifiedTokenCache | None = None
+
+        if config.jwt.verified_token_cache_size > 0:
+            from fastauth.core.tokens import VerifiedTokenCache
+
+            self.token_cache = VerifiedTokenCache(config.jwt.verified_token_cache_size)
 
         if config.email_transport:
             from fastauth.core.emails import EmailDispatcher
@@ -56,6 +63,7 @@ class FastAuth:
                 transport=config.email_transport,
                 base_url=config.base_url,
                 template_dir=config.email_template_dir,
+                auto_reload=config.email_template_auto_reload,
             )
 
     def mount(self, app: object) -> None:
@@ -146,3 +154,23 @@ class FastAuth:
 
             self.jwks_manager = JWKSManager(self.config.jwt)
             await self.jwks_manager.initialize()
+
+    async def shutdown(self) -> None:
+        """Release network resources held by the email transport and providers.
+
+        Call it in the application lifespan shutdown handler so pooled
+        connections (e.g. :class:`~fastauth.email_transports.smtp.SMTPTransport`
+        and the HTTP clients of the OAuth providers) are closed cleanly.
+
+        Example:
+            ```python
+            @asynccontextmanager
+            async def lifespan(app: FastAPI):
+                yield
+                await auth.shutdown()
+            ```
+        """
+        for resource in (self.config.email_transport, *self.config.providers):
+            close = getattr(resource, "close", None)
+            if close is not None:
+                await close()
@@ -71,6 +71,10 @@ class JWTConfig:
             ``jwks_enabled=True``. ``None`` disables auto-rotation.
         private_key: PEM-encoded RSA private key (required for RS256/RS512).
         public_key: PEM-encoded RSA public key (required for RS256/RS512).
+        verified_token_cache_size: Number of verified access tokens whose claims
+            are cached so repeat requests skip signature verification. ``0``
+            (the default) disables the cache. Cached tokens stay valid until
+            their ``exp`` even if their signing key is rotated out.
     """
 
     algorithm: str = "HS256"
@@ -83,6 +87,7 @@ class JWTConfig:
     key_rotation_interval: int | None = None
     private_key: str | None = None
     public_key: str | None = None
+    verified_token_cache_size: int = 0
 
 
 @dataclass
@@ -117,6 +122,9 @@ class FastAuthConfig:
             templates not present in this directory fall back to the built-in ones.
             See the :ref:`custom email templates <custom-email-templates>` guide for
             the expected filenames and available template variables.
+        email_template_auto_reload: Re-check template files on disk before each
+            send and recompile edited ones. Off by default, so compiled templates
+            are served from memory; turn it on while editing templates.
         hooks: An :class:`~fastauth.core.protocols.EventHooks` subclass for
             lifecycle callbacks (``on_signup``, ``modify_jwt``, etc.).
         oauth_adapter: Adapter for persisting linked OAuth accounts.
@@ -169,6 +177,7 @@ class FastAuthConfig:
     session_backend: SessionBackend | None = None
     email_transport: EmailTransport | None = None
     email_template_dir: str | Path | None = None
+    email_template_auto_reload: bool = False
     hooks: EventHooks | None = None
     oauth_adapter: OAuthAccountAdapter | None = None
     oauth_state_store: SessionBackend | None = None
@@ -10,15 +10,17 @@ if TYPE_CHECKING:
     from fastauth.types import UserData
 
 
-def _create_env(template_dir: str | Path | None = None) -> Environment:
+def _create_env(
+    template_dir: str | Path | None = None, auto_reload: bool = False
+) -> Environment:
     from jinja2 import ChoiceLoader, Environment, FileSystemLoader, PackageLoader
 
     package_loader = PackageLoader("fastauth", "templates")
     if template_dir is not None:
-        loader = ChoiceLoader([FileSystemLoader(str(template_dir)), package_loader])
+        loader = ChoiceLoader([FileSystemLoader(template_dir), package_loader])
     else:
         loader = package_loader
-    return Environment(loader=loader, autoescape=True)
+    return Environment(loader=loader, autoescape=True, auto_reload=auto_reload)
 
 
 class EmailDispatcher:
@@ -27,6 +29,7 @@ class EmailDispatcher:
         transport: EmailTransport | None,
         base_url: str,
         template_dir: str | Path | None = None,
+        auto_reload: bool = False,
     ) -> None:
         self.transport = transport
         self.base_url = base_url.rstrip("/")
@@ -35,7 +38,9 @@ class EmailDispatcher:
             from fastauth._compat import require
 
             require("jinja2", "email")
-            self._env = _create_env(template_dir)
+            # Built once per dispatcher; its compiled-template cache is reused
+            # by every send.
+            self._env = _create_env(template_dir, auto_reload)
 
     async def send_verification_email(
         self,
@@ -14,6 +14,7 @@ class JWKSManager:
     def __init__(self, config: JWTConfig) -> None:
         self._config = config
         self._keys: list[tuple[RSAKey, str, float]] = []  # (key, kid, created_at)
+        self._keys_by_kid: dict[str, RSAKey] = {}
         self._current_kid: str | None = None
 
     async def initialize(self) -> None:
@@ -32,6 +33,7 @@ class JWKSManager:
         key_dict["kid"] = kid
         key = RSAKey.import_key(key_dict)
         self._keys.append((key, kid, time.time()))
+        self._keys_by_kid[kid] = key
         self._current_kid = kid
 
     async def rotate(self) -> None:
@@ -42,6 +44,7 @@ class JWKSManager:
         key = RSAKey.import_key(key_dict)
 
         self._keys.append((key, kid, time.time()))
+        self._keys_by_kid[kid] = key
         self._current_kid = kid
         self._prune_old_keys()
 
@@ -56,12 +59,12 @@ class JWKSManager:
             for k, kid, ts in self._keys
             if ts > cutoff or kid == self._current_kid
         ]
+        self._keys_by_kid = {kid: k for k, kid, _ in self._keys}
 
     def get_signing_key(self) -> RSAKey:
-        for key, kid, _ in self._keys:
-            if kid == self._current_kid:
-                return key
-        raise RuntimeError("No signing key available")
+        if self._current_kid is None or self._current_kid not in self._keys_by_kid:
+            raise RuntimeError("No signing key available")
+        return self._keys_by_kid[self._current_kid]
 
     def get_signing_kid(self) -> str:
         if not self._current_kid:
@@ -80,3 +83,6 @@ class JWKSManager:
 
     def get_verification_keys(self) -> list[RSAKey]:
         return [key for key, _, _ in self._keys]
+
+    def get_verification_key(self, kid: str) -> RSAKey | None:
+        return self._keys_by_kid.get(kid)
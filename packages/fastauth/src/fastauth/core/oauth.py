@@ -19,6 +19,12 @@ if TYPE_CHECKING:
     from fastauth.types import UserData
 
 
+def _code_challenge(code_verifier: str) -> str:
+    """Derive the PKCE S256 code challenge for *code_verifier*."""
+    challenge_bytes = hashlib.sha256(code_verifier.encode()).digest()
+    return base64.urlsafe_b64encode(challenge_bytes).decode().rstrip("=")
+
+
 async def initiate_oauth_flow(
     provider: OAuthProvider,
     redirect_uri: str,
@@ -26,9 +32,7 @@ async def initiate_oauth_flow(
 ) -> tuple[str, str]:
     state = secrets.token_urlsafe(32)
     code_verifier = secrets.token_urlsafe(64)
-
-    challenge_bytes = hashlib.sha256(code_verifier.encode()).digest()
-    code_challenge = base64.urlsafe_b64encode(challenge_bytes).decode().rstrip("=")
+    code_challenge = _code_challenge(code_verifier)
 
     await state_store.write(
         f"oauth_state:{state}",
@@ -57,9 +61,7 @@ async def initiate_link_flow(
 ) -> tuple[str, str]:
     state = secrets.token_urlsafe(32)
     code_verifier = secrets.token_urlsafe(64)
-
-    challenge_bytes = hashlib.sha256(code_verifier.encode()).digest()
-    code_challenge = base64.urlsafe_b64encode(challenge_bytes).decode().rstrip("=")
+    code_challenge = _code_challenge(code_verifier)
 
     await state_store.write(
         f"oauth_state:{state}",
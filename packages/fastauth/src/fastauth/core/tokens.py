@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import json
+import time
+from base64 import urlsafe_b64decode
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable
 
 from cuid2 import cuid_wrapper
@@ -20,6 +25,13 @@ if TYPE_CHECKING:
 cuid_generator: Callable[[], str] = cuid_wrapper()
 
 
+@lru_cache(maxsize=8)
+def _oct_key(secret: str) -> OctKey:
+    # Importing the HMAC key validates and wraps the secret; do it once per
+    # secret instead of on every sign/verify.
+    return OctKey.import_key(secret)
+
+
 def _get_signing_key_and_header(
     config: FastAuthConfig,
     jwks_manager: JWKSManager | None = None,
@@ -31,7 +43,7 @@ def _get_signing_key_and_header(
             "kid": jwks_manager.get_signing_kid(),
         }
         return key, header
-    key = OctKey.import_key(config.secret)
+    key = _oct_key(config.secret)
     header = {"alg": config.jwt.algorithm}
     return key, header
 
@@ -46,28 +58,23 @@ def _get_decode_key(
             return keys[0]
         # For multiple keys, try each one
         return keys
-    return OctKey.import_key(config.secret)
+    return _oct_key(config.secret)
 
 
-def create_access_token(
-    user: UserData,
-    config: FastAuthConfig,
-    jwks_manager: JWKSManager | None = None,
+def _unverified_kid(token: str) -> str | None:
+    # Only used to pick a verification key; the signature is still checked.
+    segment = token.split(".", 1)[0]
+    try:
+        header = json.loads(urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except ValueError:
+        return None
+    kid = header.get("kid") if isinstance(header, dict) else None
+    return kid if isinstance(kid, str) else None
+
+
+def _encode(
+    claims: jwt.Claims, key: Any, header: dict[str, str], config: FastAuthConfig
 ) -> str:
-    key, header = _get_signing_key_and_header(config, jwks_manager)
-    now = datetime.now(timezone.utc)
-    claims: jwt.Claims = {
-        "sub": user["id"],
-        "jti": cuid_generator(),
-        "iss": config.jwt.issuer,
-        "aud": config.jwt.audience,
-        "iat": int(now.timestamp()),
-        "exp": int((now + timedelta(seconds=config.jwt.access_token_ttl)).timestamp()),
-        "type": "access",
-        "email": user["email"],
-        "name": user["name"],
-        "email_verified": user["email_verified"],
-    }
     return jwt.encode(
         header=header,
         claims=claims,
@@ -76,6 +83,15 @@ def create_access_token(
     )
 
 
+def create_access_token(
+    user: UserData,
+    config: FastAuthConfig,
+    jwks_manager: JWKSManager | None = None,
+) -> str:
+    key, header = _get_signing_key_and_header(config, jwks_manager)
+    return _encode(_build_access_claims(user, config), key, header, config)
+
+
 def create_refresh_token(
     user: UserData,
     config: FastAuthConfig,
@@ -83,30 +99,8 @@ def create_refresh_token(
     refresh_ttl_override: int | None = None,
 ) -> str:
     key, header = _get_signing_key_and_header(config, jwks_manager)
-    now = datetime.now(timezone.utc)
-    ttl = (
-        refresh_ttl_override
-        if refresh_ttl_override is not None
-        else config.jwt.refresh_token_ttl
-    )
-    claims: jwt.Claims = {
-        "sub": user["id"],
-        "jti": cuid_generator(),
-        "iss": config.jwt.issuer,
-        "aud": config.jwt.audience,
-        "iat": int(now.timestamp()),
-        "exp": int((now + timedelta(seconds=ttl)).timestamp()),
-        "type": "refresh",
-        "email": user["email"],
-        "name": user["name"],
-        "email_verified": user["email_verified"],
-    }
-    return jwt.encode(
-        header=header,
-        claims=claims,
-        key=key,
-        algorithms=[config.jwt.algorithm],
-    )
+    claims = _build_refresh_claims(user, config, refresh_ttl_override)
+    return _encode(claims, key, header, config)
 
 
 def create_token_pair(
@@ -115,56 +109,61 @@ def create_token_pair(
     jwks_manager: JWKSManager | None = None,
     refresh_ttl_override: int | None = None,
 ) -> TokenPair:
-    access = create_access_token(user, config, jwks_manager)
-    refresh = create_refresh_token(user, config, jwks_manager, refresh_ttl_override)
+    # Both tokens share one signing-key lookup and one timestamp.
+    key, header = _get_signing_key_and_header(config, jwks_manager)
+    now = datetime.now(timezone.utc)
+    access_claims = _build_access_claims(user, config, now)
+    refresh_claims = _build_refresh_claims(user, config, refresh_ttl_override, now)
 
     return {
-        "access_token": access,
-        "refresh_token": refresh,
+        "access_token": _encode(access_claims, key, header, config),
+        "refresh_token": _encode(refresh_claims, key, header, config),
         "token_type": "bearer",
         "expires_in": config.jwt.access_token_ttl,
     }
 
 
-def _build_access_claims(user: UserData, config: FastAuthConfig) -> jwt.Claims:
-    now = datetime.now(timezone.utc)
+def _build_claims(
+    user: UserData,
+    config: FastAuthConfig,
+    token_type: str,
+    ttl: int,
+    now: datetime | None,
+) -> jwt.Claims:
+    if now is None:
+        now = datetime.now(timezone.utc)
     return {
         "sub": user["id"],
         "jti": cuid_generator(),
         "iss": config.jwt.issuer,
         "aud": config.jwt.audience,
         "iat": int(now.timestamp()),
-        "exp": int((now + timedelta(seconds=config.jwt.access_token_ttl)).timestamp()),
-        "type": "access",
+        "exp": int((now + timedelta(seconds=ttl)).timestamp()),
+        "type": token_type,
         "email": user["email"],
         "name": user["name"],
         "email_verified": user["email_verified"],
     }
 
 
+def _build_access_claims(
+    user: UserData, config: FastAuthConfig, now: datetime | None = None
+) -> jwt.Claims:
+    return _build_claims(user, config, "access", config.jwt.access_token_ttl, now)
+
+
 def _build_refresh_claims(
     user: UserData,
     config: FastAuthConfig,
     refresh_ttl_override: int | None = None,
+    now: datetime | None = None,
 ) -> jwt.Claims:
-    now = datetime.now(timezone.utc)
     ttl = (
         refresh_ttl_override
         if refresh_ttl_override is not None
         else config.jwt.refresh_token_ttl
     )
-    return {
-        "sub": user["id"],
-        "jti": cuid_generator(),
-        "iss": config.jwt.issuer,
-        "aud": config.jwt.audience,
-        "iat": int(now.timestamp()),
-        "exp": int((now + timedelta(seconds=ttl)).timestamp()),
-        "type": "refresh",
-        "email": user["email"],
-        "name": user["name"],
-        "email_verified": user["email_verified"],
-    }
+    return _build_claims(user, config, "refresh", ttl, now)
 
 
 async def async_create_access_token(
@@ -178,12 +177,7 @@ async def async_create_access_token(
     claims = _build_access_claims(user, config)
     if modify_jwt is not None:
         claims = await modify_jwt(claims, user)
-    return jwt.encode(
-        header=header,
-        claims=claims,
-        key=key,
-        algorithms=[config.jwt.algorithm],
-    )
+    return _encode(claims, key, header, config)
 
 
 async def async_create_refresh_token(
@@ -198,12 +192,7 @@ async def async_create_refresh_token(
     claims = _build_refresh_claims(user, config, refresh_ttl_override)
     if modify_jwt is not None:
         claims = await modify_jwt(claims, user)
-    return jwt.encode(
-        header=header,
-        claims=claims,
-        key=key,
-        algorithms=[config.jwt.algorithm],
-    )
+    return _encode(claims, key, header, config)
 
 
 async def async_create_token_pair(
@@ -227,13 +216,21 @@ async def async_create_token_pair(
 
 
 def _build_claims_registry(config: FastAuthConfig) -> jwt.JWTClaimsRegistry:
+    return _claims_registry(config.jwt.issuer, config.jwt.audience is not None)
+
+
+@lru_cache(maxsize=8)
+def _claims_registry(issuer: str | None, has_audience: bool) -> jwt.JWTClaimsRegistry:
+    # The registry only holds the claim options, so one instance per
+    # (issuer, audience) shape is reused for every decode. It is built without
+    # a fixed ``now``, so joserfc reads the clock on each validate() call.
     options: dict[str, Any] = {
         "exp": {"essential": True},
         "sub": {"essential": True},
     }
-    if config.jwt.issuer is not None:
-        options["iss"] = {"essential": True, "value": config.jwt.issuer}
-    if config.jwt.audience is not None:
+    if issuer is not None:
+        options["iss"] = {"essential": True, "value": issuer}
+    if has_audience:
         options["aud"] = {"essential": True}
     return jwt.JWTClaimsRegistry(**options)
 
@@ -262,6 +259,14 @@ def decode_token(
     jwks_manager: JWKSManager | None = None,
 ) -> dict[str, Any]:
     decode_key = _get_decode_key(config, jwks_manager)
+    registry = _build_claims_registry(config)
+
+    # Tokens signed by the manager name their key; skip straight to it.
+    if isinstance(decode_key, list) and jwks_manager is not None:
+        kid = _unverified_kid(token)
+        key = jwks_manager.get_verification_key(kid) if kid else None
+        if key is not None:
+            decode_key = key
 
     # For RS* with multiple keys, try each one
     if isinstance(decode_key, list):
@@ -269,7 +274,7 @@ def decode_token(
         for key in decode_key:
             try:
                 data = jwt.decode(token, key, algorithms=[config.jwt.algorithm])
-                _build_claims_registry(config).validate(data.claims)
+                registry.validate(data.claims)
                 _validate_iss_aud(data.claims, config)
                 return data.claims
             except JoseError as e:
@@ -280,8 +285,39 @@ def decode_token(
 
     try:
         data = jwt.decode(token, decode_key, algorithms=[config.jwt.algorithm])
-        _build_claims_registry(config).validate(data.claims)
+        registry.validate(data.claims)
         _validate_iss_aud(data.claims, config)
         return data.claims
     except JoseError as e:
         raise InvalidTokenError("Invalid token") from e
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of claims for tokens that already passed :func:`decode_token`.
+
+    Keyed by the raw token string. An entry is dropped as soon as its ``exp``
+    has passed, so a cached token never outlives the token itself.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        claims = self._entries.get(token)
+        if claims is None:
+            return None
+        if claims["exp"] <= time.time():
+            del self._entries[token]
+            return None
+        self._entries.move_to_end(token)
+        return claims
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        self._entries[token] = claims
+        self._entries.move_to_end(token)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
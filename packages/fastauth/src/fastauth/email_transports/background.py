@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastauth.core.protocols import EmailTransport
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundTransport:
+    """Wrap another transport so sends run as background tasks.
+
+    ``send`` returns as soon as the message is scheduled, so auth endpoints no
+    longer wait on the wrapped transport's network round-trips. Failures are
+    logged rather than raised. Call :meth:`drain` (e.g. in the application
+    lifespan shutdown) to wait for in-flight sends, or :meth:`close` to also
+    close the wrapped transport.
+    """
+
+    def __init__(self, transport: EmailTransport) -> None:
+        self.transport = transport
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def send(
+        self,
+        to: str,
+        subject: str,
+        body_html: str,
+        body_text: str | None = None,
+    ) -> None:
+        task = asyncio.create_task(self._send(to, subject, body_html, body_text))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        """Wait for every scheduled send to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def close(self) -> None:
+        """Drain pending sends, then close the wrapped transport if it can be."""
+        await self.drain()
+        close = getattr(self.transport, "close", None)
+        if close is not None:
+            await close()
+
+    async def _send(
+        self,
+        to: str,
+        subject: str,
+        body_html: str,
+        body_text: str | None,
+    ) -> None:
+        try:
+            await self.transport.send(
+                to=to,
+                subject=subject,
+                body_html=body_html,
+                body_text=body_text,
+            )
+        except Exception:
+            logger.exception("Background email to %s failed", to)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+_RULE = "=" * 60
+
 
 class ConsoleTransport:
     """Email transport that prints to stdout (development only)."""
@@ -11,12 +13,6 @@ class ConsoleTransport:
         body_html: str,
         body_text: str | None = None,
     ) -> None:
-        print(f"\n{'=' * 60}")
-        print(f"To: {to}")
-        print(f"Subject: {subject}")
-        print(f"{'=' * 60}")
-        if body_text:
-            print(body_text)
-        else:
-            print(body_html)
-        print(f"{'=' * 60}\n")
+        # One print keeps concurrent sends from interleaving their lines.
+        body = body_text or body_html
+        print(f"\n{_RULE}\nTo: {to}\nSubject: {subject}\n{_RULE}\n{body}\n{_RULE}\n")
@@ -1,13 +1,43 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import Any, Literal
 
 from fastauth._compat import require
 
+SendStatus = Literal["sent", "failed", "skipped"]
+
+#: ``(to, subject, body_html)`` or ``(to, subject, body_html, body_text)``.
+BatchItem = tuple[str, str, str] | tuple[str, str, str, str | None]
+
+
+@dataclass
+class _Connection:
+    client: Any
+    sent: int = 0
+    last_used: float = 0.0
+
 
 class SMTPTransport:
-    """SMTP email transport using aiosmtplib."""
+    """SMTP email transport using aiosmtplib.
+
+    Up to ``max_connections`` SMTP connections are kept open and reused across
+    messages so each email does not pay for a fresh TCP handshake, TLS
+    negotiation and AUTH. Concurrent sends each take their own connection;
+    beyond that limit they wait for one to be returned. A connection is
+    health-checked with ``NOOP`` before reuse and recycled after
+    ``max_messages`` sends or ``max_idle`` seconds without traffic. It is only
+    dropped on connection-level errors, not when the server rejects a message.
+
+    The pool belongs to the event loop that filled it. If the transport is
+    used from a new loop (for example a second ``asyncio.run``), connections
+    left over from the old loop are closed and a fresh pool is started.
+    """
 
     def __init__(
         self,
@@ -17,6 +47,9 @@ class SMTPTransport:
         password: str,
         from_email: str,
         use_tls: bool = True,
+        max_messages: int = 100,
+        max_idle: float = 100.0,
+        max_connections: int = 4,
     ) -> None:
         require("aiosmtplib", "email")
         self.host = host
@@ -25,6 +58,12 @@ class SMTPTransport:
         self.password = password
         self.from_email = from_email
         self.use_tls = use_tls
+        self.max_messages = max_messages
+        self.max_idle = max_idle
+        self.max_connections = max_connections
+        self._idle: list[_Connection] = []
+        self._slots = asyncio.Semaphore(max_connections)
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     async def send(
         self,
@@ -33,8 +72,84 @@ class SMTPTransport:
         body_html: str,
         body_text: str | None = None,
     ) -> None:
-        import aiosmtplib
+        msg = self._build_message(to, subject, body_html, body_text)
+        async with self._bind_loop():
+            conn = await self._acquire()
+            try:
+                await conn.client.send_message(msg)
+            except BaseException as exc:
+                self._release(conn, exc)
+                raise
+            conn.sent += 1
+            self._release(conn)
 
+    async def send_batch(
+        self,
+        items: Iterable[BatchItem],
+        max_failures: int | None = None,
+    ) -> list[tuple[str, SendStatus]]:
+        """Send ``(to, subject, body_html[, body_text])`` items over one SMTP session.
+
+        Returns a ``(recipient, status)`` pair per item so callers only retry
+        the failures. Every item is attempted unless ``max_failures`` is set;
+        once that many sends have failed, the remaining items are marked
+        ``skipped`` without being sent.
+        """
+        messages = [(item[0], self._build_message(*item)) for item in items]
+        results: list[tuple[str, SendStatus]] = []
+        failures = 0
+
+        async with self._bind_loop():
+            conn: _Connection | None = None
+            try:
+                for to, msg in messages:
+                    if max_failures is not None and failures >= max_failures:
+                        results.append((to, "skipped"))
+                        continue
+                    if conn is not None and conn.sent >= self.max_messages:
+                        await self._discard(conn)
+                        conn = None
+                    try:
+                        if conn is None:
+                            conn = await self._acquire()
+                        await conn.client.send_message(msg)
+                    except Exception as exc:
+                        if conn is not None and _is_connection_error(exc):
+                            self._release(conn, exc)
+                            conn = None
+                        failures += 1
+                        results.append((to, "failed"))
+                        continue
+                    conn.sent += 1
+                    results.append((to, "sent"))
+            except BaseException as exc:
+                if conn is not None:
+                    self._release(conn, exc)
+                raise
+            if conn is not None:
+                self._release(conn)
+        return results
+
+    async def close(self) -> None:
+        """Quit the pooled SMTP connections once in-flight sends finish."""
+        slots = self._bind_loop()
+        for _ in range(self.max_connections):
+            await slots.acquire()
+        try:
+            idle, self._idle = self._idle, []
+            for conn in idle:
+                await self._discard(conn)
+        finally:
+            for _ in range(self.max_connections):
+                slots.release()
+
+    def _build_message(
+        self,
+        to: str,
+        subject: str,
+        body_html: str,
+        body_text: str | None = None,
+    ) -> MIMEMultipart:
         msg = MIMEMultipart("alternative")
         msg["From"] = self.from_email
         msg["To"] = to
@@ -43,12 +158,78 @@ class SMTPTransport:
         if body_text:
             msg.attach(MIMEText(body_text, "plain"))
         msg.attach(MIMEText(body_html, "html"))
+        return msg
+
+    def _bind_loop(self) -> asyncio.Semaphore:
+        # Sockets and the semaphore's waiters are tied to the loop they were
+        # created on, so a new loop gets its own pool.
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            stale, self._idle = self._idle, []
+            for conn in stale:
+                _close_quietly(conn.client)
+            self._slots = asyncio.Semaphore(self.max_connections)
+            self._loop = loop
+        return self._slots
 
-        await aiosmtplib.send(
-            msg,
+    async def _acquire(self) -> _Connection:
+        import aiosmtplib
+
+        while self._idle:
+            conn = self._idle.pop()
+            if await self._is_reusable(conn):
+                return conn
+            await self._discard(conn)
+        client = aiosmtplib.SMTP(
             hostname=self.host,
             port=self.port,
             username=self.username,
             password=self.password,
             use_tls=self.use_tls,
         )
+        await client.connect()
+        return _Connection(client)
+
+    def _release(self, conn: _Connection, error: BaseException | None = None) -> None:
+        # A rejected message leaves the session usable; a dropped socket or a
+        # cancelled send does not, so that connection is closed instead.
+        if error is not None and (
+            not isinstance(error, Exception) or _is_connection_error(error)
+        ):
+            _close_quietly(conn.client)
+            return
+        conn.last_used = time.monotonic()
+        self._idle.append(conn)
+
+    async def _is_reusable(self, conn: _Connection) -> bool:
+        if conn.sent >= self.max_messages:
+            return False
+        if time.monotonic() - conn.last_used >= self.max_idle:
+            return False
+        if not conn.client.is_connected:
+            return False
+        try:
+            response = await conn.client.noop()
+        except Exception:
+            return False
+        return response.code == 250
+
+    async def _discard(self, conn: _Connection) -> None:
+        try:
+            await conn.client.quit()
+        except Exception:
+            _close_quietly(conn.client)
+
+
+def _close_quietly(client: Any) -> None:
+    # close() schedules work on the client's loop, which may already be gone.
+    try:
+        client.close()
+    except Exception:
+        pass
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    from aiosmtplib import SMTPServerDisconnected
+
+    return isinstance(error, (SMTPServerDisconnected, OSError))
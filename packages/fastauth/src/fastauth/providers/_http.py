@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class HTTPClientProvider:
+    """Base for providers whose HTTP calls share one ``httpx.AsyncClient``.
+
+    Keep-alive connections are reused across logins. Pass ``http_client`` to
+    supply your own, or call :meth:`close` on shutdown to release the one
+    created lazily. A lazily created client belongs to the event loop it was
+    first used on; a call from another loop gets a new client.
+    """
+
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        self._http_client = http_client
+        self._owns_client = http_client is None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or (
+            self._owns_client and loop is not self._client_loop
+        ):
+            import httpx
+
+            # A client left over from a finished loop cannot be closed from
+            # this one; it is dropped and its sockets go with it.
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+            self._client_loop = loop
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the HTTP client if this provider created it."""
+        if not self._owns_client or self._http_client is None:
+            return
+        client, self._http_client = self._http_client, None
+        if self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
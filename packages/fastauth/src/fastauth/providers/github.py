@@ -1,15 +1,23 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode
 
 from fastauth._compat import require
 from fastauth.exceptions import ProviderError
+from fastauth.providers._http import HTTPClientProvider
 from fastauth.types import UserData
 
+if TYPE_CHECKING:
+    import httpx
 
-class GitHubProvider:
-    """GitHub OAuth 2.0 provider."""
+
+class GitHubProvider(HTTPClientProvider):
+    """GitHub OAuth 2.0 provider.
+
+    HTTP calls to GitHub share one ``httpx.AsyncClient``; see
+    :class:`~fastauth.providers._http.HTTPClientProvider`.
+    """
 
     id = "github"
     name = "GitHub"
@@ -25,78 +33,84 @@ class GitHubProvider:
         client_id: str,
         client_secret: str,
         scopes: list[str] | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         require("httpx", "oauth")
+        super().__init__(http_client)
         self.client_id = client_id
         self.client_secret = client_secret
         self.scopes = scopes or ["user:email"]
+        self._prefix_key: tuple[str, tuple[str, ...]] | None = None
+        self._prefix = ""
+
+    def _authorization_url_prefix(self) -> str:
+        # The static part of the query is encoded once and rebuilt only when
+        # client_id or scopes change.
+        key = (self.client_id, tuple(self.scopes))
+        if key != self._prefix_key:
+            query = urlencode(
+                {"client_id": self.client_id, "scope": " ".join(self.scopes)}
+            )
+            self._prefix = f"{self.AUTHORIZATION_URL}?{query}"
+            self._prefix_key = key
+        return self._prefix
 
     async def get_authorization_url(
         self, state: str, redirect_uri: str, **kwargs: Any
     ) -> str:
-        params = {
-            "client_id": self.client_id,
-            "redirect_uri": redirect_uri,
-            "scope": " ".join(self.scopes),
-            "state": state,
-        }
-        return f"{self.AUTHORIZATION_URL}?{urlencode(params)}"
+        params = {"redirect_uri": redirect_uri, "state": state}
+        return f"{self._authorization_url_prefix()}&{urlencode(params)}"
 
     async def exchange_code(
         self, code: str, redirect_uri: str, **kwargs: Any
     ) -> dict[str, Any]:
-        import httpx
-
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            resp = await client.post(
-                self.TOKEN_URL,
-                data={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "code": code,
-                    "redirect_uri": redirect_uri,
-                },
-                headers={"Accept": "application/json"},
-            )
-            if resp.status_code != 200:
-                raise ProviderError(f"GitHub token exchange failed: {resp.text}")
-            data = resp.json()
-            if "error" in data:
-                raise ProviderError(f"GitHub token exchange failed: {data['error']}")
-            return data
+        resp = await self._get_client().post(
+            self.TOKEN_URL,
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "code": code,
+                "redirect_uri": redirect_uri,
+            },
+            headers={"Accept": "application/json"},
+        )
+        if resp.status_code != 200:
+            raise ProviderError(f"GitHub token exchange failed: {resp.text}")
+        data = resp.json()
+        if "error" in data:
+            raise ProviderError(f"GitHub token exchange failed: {data['error']}")
+        return data
 
     async def get_user_info(self, access_token: str) -> UserData:
-        import httpx
-
+        client = self._get_client()
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Accept": "application/json",
         }
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            resp = await client.get(self.USER_URL, headers=headers)
-            if resp.status_code != 200:
-                raise ProviderError(f"GitHub user info failed: {resp.text}")
-            data = resp.json()
-
-            email = data.get("email")
-            email_verified = False
-            if email:
-                email_verified = await self._fetch_email_verification(
-                    client, access_token, email
-                )
-            else:
-                email, email_verified = await self._fetch_primary_email(
-                    client, access_token
-                )
-
-            return {
-                "id": str(data["id"]),
-                "email": email,
-                "name": data.get("name") or data.get("login"),
-                "image": data.get("avatar_url"),
-                "email_verified": email_verified,
-                "is_active": True,
-            }
+        resp = await client.get(self.USER_URL, headers=headers)
+        if resp.status_code != 200:
+            raise ProviderError(f"GitHub user info failed: {resp.text}")
+        data = resp.json()
+
+        email = data.get("email")
+        email_verified = False
+        if email:
+            email_verified = await self._fetch_email_verification(
+                client, access_token, email
+            )
+        else:
+            email, email_verified = await self._fetch_primary_email(
+                client, access_token
+            )
+
+        return {
+            "id": str(data["id"]),
+            "email": email,
+            "name": data.get("name") or data.get("login"),
+            "image": data.get("avatar_url"),
+            "email_verified": email_verified,
+            "is_active": True,
+        }
 
     async def _fetch_primary_email(
         self, client: Any, access_token: str
@@ -111,15 +125,13 @@ class GitHubProvider:
         if resp.status_code != 200:
             raise ProviderError("Failed to fetch GitHub emails")
         emails = resp.json()
-        for entry in emails:
-            if entry.get("primary") and entry.get("verified"):
-                return entry["email"], True
-        for entry in emails:
-            if entry.get("primary"):
-                return entry["email"], bool(entry.get("verified", False))
-        if emails:
-            return emails[0]["email"], bool(emails[0].get("verified", False))
-        raise ProviderError("No email found on GitHub account")
+        if not emails:
+            raise ProviderError("No email found on GitHub account")
+        primary = [e for e in emails if e.get("primary")]
+        entry = next((e for e in primary if e.get("verified")), None)
+        if entry is None:
+            entry = primary[0] if primary else emails[0]
+        return entry["email"], bool(entry.get("verified", False))
 
     async def _fetch_email_verification(
         self, client: Any, access_token: str, email: str
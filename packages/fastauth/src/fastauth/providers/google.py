@@ -1,15 +1,23 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode
 
 from fastauth._compat import require
 from fastauth.exceptions import ProviderError
+from fastauth.providers._http import HTTPClientProvider
 from fastauth.types import UserData
 
+if TYPE_CHECKING:
+    import httpx
 
-class GoogleProvider:
-    """Google OAuth 2.0 / OIDC provider."""
+
+class GoogleProvider(HTTPClientProvider):
+    """Google OAuth 2.0 / OIDC provider.
+
+    HTTP calls to Google share one ``httpx.AsyncClient``; see
+    :class:`~fastauth.providers._http.HTTPClientProvider`.
+    """
 
     id = "google"
     name = "Google"
@@ -24,36 +32,48 @@ class GoogleProvider:
         client_id: str,
         client_secret: str,
         scopes: list[str] | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         require("httpx", "oauth")
+        super().__init__(http_client)
         self.client_id = client_id
         self.client_secret = client_secret
         self.scopes = scopes or ["openid", "email", "profile"]
+        self._prefix_key: tuple[str, tuple[str, ...]] | None = None
+        self._prefix = ""
+
+    def _authorization_url_prefix(self) -> str:
+        # The static part of the query is encoded once and rebuilt only when
+        # client_id or scopes change.
+        key = (self.client_id, tuple(self.scopes))
+        if key != self._prefix_key:
+            query = urlencode(
+                {
+                    "client_id": self.client_id,
+                    "response_type": "code",
+                    "scope": " ".join(self.scopes),
+                    "access_type": "offline",
+                    "prompt": "consent",
+                }
+            )
+            self._prefix = f"{self.AUTHORIZATION_URL}?{query}"
+            self._prefix_key = key
+        return self._prefix
 
     async def get_authorization_url(
         self, state: str, redirect_uri: str, **kwargs: Any
     ) -> str:
-        params: dict[str, str] = {
-            "client_id": self.client_id,
-            "redirect_uri": redirect_uri,
-            "response_type": "code",
-            "scope": " ".join(self.scopes),
-            "state": state,
-            "access_type": "offline",
-            "prompt": "consent",
-        }
+        params: dict[str, str] = {"redirect_uri": redirect_uri, "state": state}
         if "code_challenge" in kwargs:
             params["code_challenge"] = kwargs["code_challenge"]
             params["code_challenge_method"] = kwargs.get(
                 "code_challenge_method", "S256"
             )
-        return f"{self.AUTHORIZATION_URL}?{urlencode(params)}"
+        return f"{self._authorization_url_prefix()}&{urlencode(params)}"
 
     async def exchange_code(
         self, code: str, redirect_uri: str, **kwargs: Any
     ) -> dict[str, Any]:
-        import httpx
-
         data: dict[str, Any] = {
             "client_id": self.client_id,
             "client_secret": self.client_secret,
@@ -64,45 +84,38 @@ class GoogleProvider:
         if kwargs.get("code_verifier"):
             data["code_verifier"] = kwargs["code_verifier"]
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            resp = await client.post(self.TOKEN_URL, data=data)
-            if resp.status_code != 200:
-                raise ProviderError(f"Google token exchange failed: {resp.text}")
-            return resp.json()
+        resp = await self._get_client().post(self.TOKEN_URL, data=data)
+        if resp.status_code != 200:
+            raise ProviderError(f"Google token exchange failed: {resp.text}")
+        return resp.json()
 
     async def get_user_info(self, access_token: str) -> UserData:
-        import httpx
-
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            resp = await client.get(
-                self.USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            if resp.status_code != 200:
-                raise ProviderError(f"Google user info failed: {resp.text}")
-            data = resp.json()
-            return {
-                "id": data["sub"],
-                "email": data["email"],
-                "name": data.get("name"),
-                "image": data.get("picture"),
-                "email_verified": data.get("email_verified", False),
-                "is_active": True,
-            }
+        resp = await self._get_client().get(
+            self.USERINFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        if resp.status_code != 200:
+            raise ProviderError(f"Google user info failed: {resp.text}")
+        data = resp.json()
+        return {
+            "id": data["sub"],
+            "email": data["email"],
+            "name": data.get("name"),
+            "image": data.get("picture"),
+            "email_verified": data.get("email_verified", False),
+            "is_active": True,
+        }
 
     async def refresh_access_token(self, refresh_token: str) -> dict[str, Any] | None:
-        import httpx
-
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            resp = await client.post(
-                self.TOKEN_URL,
-                data={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "refresh_token": refresh_token,
-                    "grant_type": "refresh_token",
-                },
-            )
-            if resp.status_code != 200:
-                return None
-            return resp.json()
+        resp = await self._get_client().post(
+            self.TOKEN_URL,
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": refresh_token,
+                "grant_type": "refresh_token",
+            },
+        )
+        if resp.status_code != 200:
+            return None
+        return resp.json()
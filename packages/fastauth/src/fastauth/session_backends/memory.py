@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import time
 from typing import Any
 
@@ -9,6 +10,22 @@ class MemorySessionBackend:
 
     def __init__(self) -> None:
         self._store: dict[str, tuple[dict[str, Any], float]] = {}
+        # Min-heap of (expires_at, session_id). Entries for deleted or
+        # overwritten keys are left in place and skipped when popped.
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    def clear(self) -> None:
+        """Remove all stored entries."""
+        self._store.clear()
+        self._expiry_heap.clear()
+
+    def _evict_expired(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, session_id = heapq.heappop(heap)
+            entry = self._store.get(session_id)
+            if entry is not None and entry[1] == expires_at:
+                del self._store[session_id]
 
     async def read(self, session_id: str) -> dict[str, Any] | None:
         entry = self._store.get(session_id)
@@ -21,7 +38,11 @@ class MemorySessionBackend:
         return data
 
     async def write(self, session_id: str, data: dict[str, Any], ttl: int) -> None:
-        self._store[session_id] = (data, time.time() + ttl)
+        now = time.time()
+        self._evict_expired(now)
+        expires_at = now + ttl
+        self._store[session_id] = (data, expires_at)
+        heapq.heappush(self._expiry_heap, (expires_at, session_id))
 
     async def delete(self, session_id: str) -> None:
         self._store.pop(session_id, None)
@@ -1,11 +1,154 @@
+import asyncio
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
+from secrets import compare_digest
+from typing import Any
+
 import pytest
+import pytest_asyncio
 from fastapi import Depends, FastAPI
 from fastauth import FastAuth
 from fastauth.adapters.memory import MemoryTokenAdapter, MemoryUserAdapter
 from fastauth.api.deps import require_auth
 from fastauth.config import FastAuthConfig, JWTConfig
+from fastauth.core import credentials
+from fastauth.core.one_time_tokens import generate_one_time_token, hash_one_time_token
 from fastauth.providers.credentials import CredentialsProvider
 from httpx import ASGITransport, AsyncClient
+from joserfc.jwk import RSAKey
+from pytest_asyncio import is_async_test
+
+FAST_HASH_PREFIX = "test$"
+
+_real_verify_password = credentials.verify_password
+
+# Every module that binds the hashing helpers by name at import time.
+_HASH_PASSWORD_TARGETS = (
+    "fastauth.core.credentials.hash_password",
+    "fastauth.api.auth.hash_password",
+    "fastauth.api.account.hash_password",
+)
+_VERIFY_PASSWORD_TARGETS = (
+    "fastauth.core.credentials.verify_password",
+    "fastauth.api.account.verify_password",
+    "fastauth.providers.credentials.verify_password",
+)
+
+
+# Providers and transports keep loop-bound state (HTTP clients, SMTP
+# connections, semaphores), so their tests each get a fresh event loop instead
+# of the session-wide one; a shared loop would hide cross-loop bugs.
+_PER_TEST_LOOP_PACKAGES = ("test_providers", "test_email_transports")
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if is_async_test(item) and item.path.parent.name in _PER_TEST_LOOP_PACKAGES:
+            item.add_marker(pytest.mark.asyncio(loop_scope="function"), append=False)
+
+
+def _fast_hash_password(password: str) -> str:
+    return f"{FAST_HASH_PREFIX}{password}"
+
+
+def _fast_verify_password(plain: str, hashed: str) -> bool:
+    if hashed.startswith(FAST_HASH_PREFIX):
+        return compare_digest(hashed, _fast_hash_password(plain))
+    # Hashes produced by a real hasher bound before patching still verify.
+    return _real_verify_password(plain, hashed)
+
+
+@pytest.fixture(autouse=True)
+def fast_hashing(request, monkeypatch):
+    """Swap Argon2 for a trivial reversible hasher unless the test is marked
+    with ``@pytest.mark.real_hashing``."""
+    if request.node.get_closest_marker("real_hashing"):
+        return
+    for target in _HASH_PASSWORD_TARGETS:
+        monkeypatch.setattr(target, _fast_hash_password)
+    for target in _VERIFY_PASSWORD_TARGETS:
+        monkeypatch.setattr(target, _fast_verify_password)
+
+
+@pytest.fixture(scope="session")
+def rsa_pem_keys() -> tuple[str, str]:
+    """A ``(private_pem, public_pem)`` RSA pair shared by the whole run.
+
+    2048-bit key generation is slow, so RS256 tests load this pair through
+    ``JWTConfig(private_key=..., public_key=...)`` instead of generating one.
+    """
+    key = RSAKey.generate_key(2048)
+    return key.as_pem(private=True).decode(), key.as_pem(private=False).decode()
+
+
+class _ModuleShared:
+    """Objects built once per test module and reset once per test.
+
+    ``shared(target)`` returns the module's instance for *target*: an
+    ``AsyncClient`` bound to it when *target* is a FastAPI app (cookies are
+    cleared), otherwise ``target()`` (its ``clear()`` is called). Module-scoped
+    fixtures that only need the instance use :meth:`get`, which never resets.
+    """
+
+    def __init__(self, stack: AsyncExitStack) -> None:
+        self._stack = stack
+        self._instances: dict[Any, Any] = {}
+        self._reset: set[Any] = set()
+
+    def get(self, target: Any) -> Any:
+        if target not in self._instances:
+            if isinstance(target, FastAPI):
+                instance = AsyncClient(
+                    transport=ASGITransport(app=target), base_url="http://test"
+                )
+                self._stack.push_async_callback(instance.aclose)
+            else:
+                instance = target()
+            self._instances[target] = instance
+        return self._instances[target]
+
+    def __call__(self, target: Any) -> Any:
+        instance = self.get(target)
+        if target not in self._reset:
+            if isinstance(instance, AsyncClient):
+                instance.cookies.clear()
+            else:
+                instance.clear()
+            self._reset.add(target)
+        return instance
+
+    def begin_test(self) -> None:
+        self._reset.clear()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def module_shared():
+    async with AsyncExitStack() as stack:
+        yield _ModuleShared(stack)
+
+
+@pytest.fixture
+def shared(module_shared):
+    module_shared.begin_test()
+    return module_shared
+
+
+@pytest.fixture
+def run_in_new_loop():
+    """Run a coroutine on a fresh event loop, like ``asyncio.run``.
+
+    Unlike ``asyncio.run`` it leaves the thread's current event loop alone, so
+    sync tests that still call ``asyncio.get_event_loop()`` are unaffected.
+    """
+
+    def run(coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    return run
 
 
 @pytest.fixture
@@ -18,6 +161,25 @@ def memory_token_adapter():
     return MemoryTokenAdapter()
 
 
+async def _issue_one_time_token(token_adapter, user_id: str, token_type: str) -> str:
+    """Store a one-time token the way the auth router does and return it raw."""
+    token = generate_one_time_token()
+    await token_adapter.create_token(
+        {
+            "token": hash_one_time_token(token),
+            "user_id": user_id,
+            "token_type": token_type,
+            "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
+        }
+    )
+    return token
+
+
+@pytest.fixture
+def issue_token():
+    return _issue_one_time_token
+
+
 @pytest.fixture
 def config(memory_user_adapter):
     return FastAuthConfig(
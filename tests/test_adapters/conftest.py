@@ -0,0 +1,23 @@
+import pytest_asyncio
+from fastauth.adapters.sqlalchemy import SQLAlchemyAdapter
+from fastauth.adapters.sqlalchemy.models import Base
+from sqlalchemy import delete
+
+
+@pytest_asyncio.fixture(scope="module")
+async def sqlalchemy_adapter():
+    # One in-memory engine per module: the schema is created once and each
+    # test only pays for clearing the rows it wrote. ``:memory:`` databases
+    # are private to the process, so pytest-xdist workers never share one.
+    a = SQLAlchemyAdapter(engine_url="sqlite+aiosqlite:///:memory:")
+    await a.create_tables()
+    yield a
+    await a.drop_tables()
+
+
+@pytest_asyncio.fixture
+async def adapter(sqlalchemy_adapter):
+    yield sqlalchemy_adapter
+    async with sqlalchemy_adapter._engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(delete(table))
@@ -245,6 +245,32 @@ async def test_delete_user_tokens(memory_token_adapter):
     assert (await memory_token_adapter.get_token("tok_xyz", "verification")) is None
 
 
+async def test_delete_user_tokens_after_token_reassigned(memory_token_adapter):
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    await memory_token_adapter.create_token(
+        {
+            "token": "tok_shared",
+            "user_id": "u1",
+            "token_type": "login_attempt",
+            "expires_at": expires_at,
+        }
+    )
+    await memory_token_adapter.create_token(
+        {
+            "token": "tok_shared",
+            "user_id": "u2",
+            "token_type": "login_attempt",
+            "expires_at": expires_at,
+        }
+    )
+
+    await memory_token_adapter.delete_user_tokens("u1")
+    assert await memory_token_adapter.get_token("tok_shared", "login_attempt")
+
+    await memory_token_adapter.delete_user_tokens("u2")
+    assert await memory_token_adapter.get_token("tok_shared", "login_attempt") is None
+
+
 async def test_consume_token_returns_and_deletes(memory_token_adapter):
     await memory_token_adapter.create_token(
         {
@@ -296,3 +322,15 @@ async def test_consume_token_expired_returns_none(memory_token_adapter):
 
     consumed = await memory_token_adapter.consume_token("tok_expired", "refresh_jti")
     assert consumed is None
+
+
+async def test_clear_user_adapter(memory_user_adapter):
+    user = await memory_user_adapter.create_user(
+        email="a@b.com", hashed_password="hash123#"
+    )
+    memory_user_adapter.clear()
+
+    assert await memory_user_adapter.get_user_by_id(user["id"]) is None
+    assert await memory_user_adapter.get_user_by_email("a@b.com") is None
+    assert await memory_user_adapter.get_hashed_password(user["id"]) is None
+    await memory_user_adapter.create_user(email="a@b.com")
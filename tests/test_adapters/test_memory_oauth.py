@@ -1,7 +1,21 @@
+import uuid
+
+import pytest
 from fastauth.adapters.memory import MemoryOAuthAccountAdapter
 from fastauth.types import OAuthAccountData
 
 
+@pytest.fixture(scope="module")
+def adapter():
+    # Shared across the module; each test works on its own uuid-keyed rows.
+    return MemoryOAuthAccountAdapter()
+
+
+@pytest.fixture
+def user_id():
+    return str(uuid.uuid4())
+
+
 def _make_account(
     provider: str = "google",
     provider_account_id: str = "123",
@@ -17,41 +31,65 @@ def _make_account(
     )
 
 
-async def test_create_and_get():
-    adapter = MemoryOAuthAccountAdapter()
-    account = _make_account()
+async def test_create_and_get(adapter, user_id):
+    account = _make_account(provider_account_id=user_id, user_id=user_id)
     result = await adapter.create_oauth_account(account)
     assert result["provider"] == "google"
 
-    fetched = await adapter.get_oauth_account("google", "123")
+    fetched = await adapter.get_oauth_account("google", user_id)
     assert fetched is not None
-    assert fetched["user_id"] == "u1"
+    assert fetched["user_id"] == user_id
 
 
-async def test_get_nonexistent():
-    adapter = MemoryOAuthAccountAdapter()
-    assert await adapter.get_oauth_account("google", "missing") is None
+async def test_get_nonexistent(adapter, user_id):
+    assert await adapter.get_oauth_account("google", user_id) is None
 
 
-async def test_get_user_accounts():
-    adapter = MemoryOAuthAccountAdapter()
-    await adapter.create_oauth_account(_make_account("google", "g1", "u1"))
-    await adapter.create_oauth_account(_make_account("github", "gh1", "u1"))
-    await adapter.create_oauth_account(_make_account("google", "g2", "u2"))
+async def test_get_user_accounts(adapter, user_id):
+    other_user_id = str(uuid.uuid4())
+    await adapter.create_oauth_account(_make_account("google", f"g-{user_id}", user_id))
+    await adapter.create_oauth_account(
+        _make_account("github", f"gh-{user_id}", user_id)
+    )
+    await adapter.create_oauth_account(
+        _make_account("google", f"g-{other_user_id}", other_user_id)
+    )
 
-    accounts = await adapter.get_user_oauth_accounts("u1")
+    accounts = await adapter.get_user_oauth_accounts(user_id)
     assert len(accounts) == 2
     providers = {a["provider"] for a in accounts}
     assert providers == {"google", "github"}
 
 
-async def test_delete():
-    adapter = MemoryOAuthAccountAdapter()
-    await adapter.create_oauth_account(_make_account())
-    await adapter.delete_oauth_account("google", "123")
-    assert await adapter.get_oauth_account("google", "123") is None
+async def test_delete(adapter, user_id):
+    await adapter.create_oauth_account(_make_account(provider_account_id=user_id))
+    await adapter.delete_oauth_account("google", user_id)
+    assert await adapter.get_oauth_account("google", user_id) is None
+
+
+async def test_delete_nonexistent(adapter, user_id):
+    await adapter.delete_oauth_account("google", user_id)  # no error
+
+
+async def test_relink_moves_account_between_users(adapter, user_id):
+    other_user_id = str(uuid.uuid4())
+    await adapter.create_oauth_account(_make_account("google", user_id, user_id))
+    await adapter.create_oauth_account(_make_account("google", user_id, other_user_id))
 
+    assert await adapter.get_user_oauth_accounts(user_id) == []
+    accounts = await adapter.get_user_oauth_accounts(other_user_id)
+    assert [a["user_id"] for a in accounts] == [other_user_id]
 
-async def test_delete_nonexistent():
+
+async def test_delete_removes_from_user_accounts(adapter, user_id):
+    await adapter.create_oauth_account(_make_account("google", user_id, user_id))
+    await adapter.delete_oauth_account("google", user_id)
+    assert await adapter.get_user_oauth_accounts(user_id) == []
+
+
+async def test_clear():
     adapter = MemoryOAuthAccountAdapter()
-    await adapter.delete_oauth_account("google", "missing")  # no error
+    await adapter.create_oauth_account(_make_account())
+    adapter.clear()
+    assert await adapter.get_oauth_account("google", "123") is None
+    assert await adapter.get_user_oauth_accounts("u1") == []
@@ -3,8 +3,8 @@ from fastauth.adapters.memory import MemoryPasskeyAdapter
 
 
 @pytest.fixture
-def adapter():
-    return MemoryPasskeyAdapter()
+def adapter(shared):
+    return shared(MemoryPasskeyAdapter)
 
 
 async def test_create_passkey(adapter):
@@ -1,8 +1,13 @@
+import pytest
 from fastauth.adapters.memory import MemoryRoleAdapter
 
 
-async def test_create_and_get_role():
-    adapter = MemoryRoleAdapter()
+@pytest.fixture
+def adapter(shared):
+    return shared(MemoryRoleAdapter)
+
+
+async def test_create_and_get_role(adapter):
     role = await adapter.create_role("admin", ["users:read", "users:delete"])
     assert role["name"] == "admin"
     assert role["permissions"] == ["users:read", "users:delete"]
@@ -12,13 +17,11 @@ async def test_create_and_get_role():
     assert fetched["name"] == "admin"
 
 
-async def test_get_nonexistent_role():
-    adapter = MemoryRoleAdapter()
+async def test_get_nonexistent_role(adapter):
     assert await adapter.get_role("missing") is None
 
 
-async def test_list_roles():
-    adapter = MemoryRoleAdapter()
+async def test_list_roles(adapter):
     await adapter.create_role("admin")
     await adapter.create_role("user")
     roles = await adapter.list_roles()
@@ -27,8 +30,7 @@ async def test_list_roles():
     assert names == {"admin", "user"}
 
 
-async def test_delete_role():
-    adapter = MemoryRoleAdapter()
+async def test_delete_role(adapter):
     await adapter.create_role("admin")
     await adapter.assign_role("u1", "admin")
 
@@ -37,8 +39,7 @@ async def test_delete_role():
     assert "admin" not in await adapter.get_user_roles("u1")
 
 
-async def test_add_and_remove_permissions():
-    adapter = MemoryRoleAdapter()
+async def test_add_and_remove_permissions(adapter):
     await adapter.create_role("editor", ["posts:read"])
     await adapter.add_permissions("editor", ["posts:write", "posts:delete"])
 
@@ -54,8 +55,7 @@ async def test_add_and_remove_permissions():
     assert "posts:delete" not in role["permissions"]
 
 
-async def test_assign_and_get_user_roles():
-    adapter = MemoryRoleAdapter()
+async def test_assign_and_get_user_roles(adapter):
     await adapter.create_role("admin")
     await adapter.create_role("editor")
 
@@ -66,8 +66,7 @@ async def test_assign_and_get_user_roles():
     assert set(roles) == {"admin", "editor"}
 
 
-async def test_revoke_role():
-    adapter = MemoryRoleAdapter()
+async def test_revoke_role(adapter):
     await adapter.create_role("admin")
     await adapter.assign_role("u1", "admin")
     await adapter.revoke_role("u1", "admin")
@@ -76,8 +75,7 @@ async def test_revoke_role():
     assert "admin" not in roles
 
 
-async def test_get_user_permissions():
-    adapter = MemoryRoleAdapter()
+async def test_get_user_permissions(adapter):
     await adapter.create_role("admin", ["users:read", "users:delete"])
     await adapter.create_role("editor", ["posts:read", "posts:write"])
 
@@ -93,7 +91,19 @@ async def test_get_user_permissions():
     }
 
 
-async def test_get_user_permissions_no_roles():
-    adapter = MemoryRoleAdapter()
+async def test_get_user_permissions_no_roles(adapter):
     perms = await adapter.get_user_permissions("u1")
     assert perms == set()
+
+
+async def test_delete_role_only_touches_members(adapter):
+    await adapter.create_role("admin")
+    await adapter.create_role("editor")
+    await adapter.assign_role("u1", "admin")
+    await adapter.assign_role("u2", "editor")
+    await adapter.revoke_role("u1", "admin")
+    await adapter.assign_role("u1", "admin")
+
+    await adapter.delete_role("admin")
+    assert await adapter.get_user_roles("u1") == []
+    assert await adapter.get_user_roles("u2") == ["editor"]
@@ -1,9 +1,15 @@
 from datetime import datetime, timedelta, timezone
 
+import pytest
 from fastauth.adapters.memory import MemorySessionAdapter
 from fastauth.types import SessionData
 
 
+@pytest.fixture
+def adapter(shared):
+    return shared(MemorySessionAdapter)
+
+
 def _make_session(sid: str = "s1", user_id: str = "u1", hours: int = 1) -> SessionData:
     return SessionData(
         id=sid,
@@ -14,8 +20,7 @@ def _make_session(sid: str = "s1", user_id: str = "u1", hours: int = 1) -> Sessi
     )
 
 
-async def test_create_and_get():
-    adapter = MemorySessionAdapter()
+async def test_create_and_get(adapter):
     session = _make_session()
     result = await adapter.create_session(session)
     assert result["id"] == "s1"
@@ -25,27 +30,23 @@ async def test_create_and_get():
     assert fetched["user_id"] == "u1"
 
 
-async def test_get_nonexistent():
-    adapter = MemorySessionAdapter()
+async def test_get_nonexistent(adapter):
     assert await adapter.get_session("missing") is None
 
 
-async def test_get_expired():
-    adapter = MemorySessionAdapter()
+async def test_get_expired(adapter):
     session = _make_session(hours=-1)
     await adapter.create_session(session)
     assert await adapter.get_session("s1") is None
 
 
-async def test_delete():
-    adapter = MemorySessionAdapter()
+async def test_delete(adapter):
     await adapter.create_session(_make_session())
     await adapter.delete_session("s1")
     assert await adapter.get_session("s1") is None
 
 
-async def test_delete_user_sessions():
-    adapter = MemorySessionAdapter()
+async def test_delete_user_sessions(adapter):
     await adapter.create_session(_make_session("s1", "u1"))
     await adapter.create_session(_make_session("s2", "u1"))
     await adapter.create_session(_make_session("s3", "u2"))
@@ -57,8 +58,7 @@ async def test_delete_user_sessions():
     assert await adapter.get_session("s3") is not None
 
 
-async def test_cleanup_expired():
-    adapter = MemorySessionAdapter()
+async def test_cleanup_expired(adapter):
     await adapter.create_session(_make_session("s1", "u1", hours=1))
     await adapter.create_session(_make_session("s2", "u1", hours=-1))
     await adapter.create_session(_make_session("s3", "u2", hours=-2))
@@ -68,8 +68,7 @@ async def test_cleanup_expired():
     assert await adapter.get_session("s1") is not None
 
 
-async def test_list_user_sessions():
-    adapter = MemorySessionAdapter()
+async def test_list_user_sessions(adapter):
     await adapter.create_session(_make_session("s1", "u1"))
     await adapter.create_session(_make_session("s2", "u1"))
     await adapter.create_session(_make_session("s3", "u2"))
@@ -79,17 +78,55 @@ async def test_list_user_sessions():
     assert {s["id"] for s in sessions} == {"s1", "s2"}
 
 
-async def test_list_user_sessions_empty():
-    adapter = MemorySessionAdapter()
+async def test_list_user_sessions_empty(adapter):
     sessions = await adapter.list_user_sessions("u1")
     assert sessions == []
 
 
-async def test_list_user_sessions_excludes_expired():
-    adapter = MemorySessionAdapter()
+async def test_list_user_sessions_excludes_expired(adapter):
     await adapter.create_session(_make_session("s1", "u1", hours=1))
     await adapter.create_session(_make_session("s2", "u1", hours=-1))
 
     sessions = await adapter.list_user_sessions("u1")
     assert len(sessions) == 1
     assert sessions[0]["id"] == "s1"
+
+
+async def test_recreate_session_for_other_user(adapter):
+    await adapter.create_session(_make_session("s1", "u1"))
+    await adapter.create_session(_make_session("s1", "u2"))
+
+    assert await adapter.list_user_sessions("u1") == []
+    await adapter.delete_user_sessions("u1")
+    assert await adapter.get_session("s1") is not None
+
+
+async def test_delete_user_sessions_after_cleanup(adapter):
+    await adapter.create_session(_make_session("s1", "u1", hours=-1))
+    await adapter.create_session(_make_session("s2", "u1"))
+    await adapter.cleanup_expired()
+
+    await adapter.delete_user_sessions("u1")
+    assert await adapter.list_user_sessions("u1") == []
+
+
+async def test_cleanup_expired_skips_deleted_and_recreated(adapter):
+    await adapter.create_session(_make_session("s1", "u1", hours=-1))
+    await adapter.create_session(_make_session("s2", "u1", hours=-1))
+    await adapter.delete_session("s1")
+    await adapter.create_session(_make_session("s2", "u1", hours=1))
+
+    assert await adapter.cleanup_expired() == 0
+    assert await adapter.get_session("s2") is not None
+
+
+async def test_expiry_heap_stays_bounded_under_churn(adapter):
+    await adapter.create_session(_make_session("keep", "u1"))
+    for i in range(100):
+        await adapter.create_session(_make_session(f"s{i}", "u2"))
+        await adapter.delete_session(f"s{i}")
+    await adapter.create_session(_make_session("again", "u3"))
+    await adapter.delete_user_sessions("u3")
+
+    assert len(adapter._expiry_heap) <= 2 * len(adapter._sessions) + 2
+    assert await adapter.get_session("keep") is not None
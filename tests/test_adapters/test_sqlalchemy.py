@@ -1,16 +1,17 @@
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
 from fastauth.adapters.sqlalchemy import SQLAlchemyAdapter
+from fastauth.adapters.sqlalchemy.models import Base
 from fastauth.exceptions import UserAlreadyExistsError, UserNotFoundError
+from sqlalchemy import inspect
 
 
-@pytest.fixture
-async def adapter():
-    a = SQLAlchemyAdapter(engine_url="sqlite+aiosqlite:///:memory:")
-    await a.create_tables()
-    yield a
-    await a.drop_tables()
+async def _make_users(adapter, *emails, **fields):
+    return await adapter.user.create_users(
+        [{"email": email, **fields} for email in emails]
+    )
 
 
 async def test_create_user(adapter):
@@ -39,37 +40,22 @@ async def test_create_duplicate_user_case_variant_raises(adapter):
         await adapter.user.create_user(" alice@example.com ")
 
 
-async def test_get_user_by_id(adapter):
-    created = await adapter.user.create_user("alice@example.com")
-    found = await adapter.user.get_user_by_id(created["id"])
-    assert found is not None
-    assert found["email"] == "alice@example.com"
+async def test_get_user(adapter):
+    created = await adapter.user.create_user("Alice@Example.COM")
+    lookups = [
+        await adapter.user.get_user_by_id(created["id"]),
+        await adapter.user.get_user_by_email("alice@example.com"),
+        await adapter.user.get_user_by_email(" ALICE@example.com "),
+    ]
+    for found in lookups:
+        assert found is not None
+        assert found["id"] == created["id"]
+        assert found["email"] == "alice@example.com"
 
 
-async def test_get_user_by_id_not_found(adapter):
-    result = await adapter.user.get_user_by_id("nonexistent")
-    assert result is None
-
-
-async def test_get_user_by_email(adapter):
-    await adapter.user.create_user("alice@example.com")
-    found = await adapter.user.get_user_by_email("alice@example.com")
-    assert found is not None
-    assert found["email"] == "alice@example.com"
-
-
-async def test_get_user_by_email_case_insensitive(adapter):
-    await adapter.user.create_user("Alice@Example.COM")
-
-    found = await adapter.user.get_user_by_email(" alice@example.com ")
-
-    assert found is not None
-    assert found["email"] == "alice@example.com"
-
-
-async def test_get_user_by_email_not_found(adapter):
-    result = await adapter.user.get_user_by_email("nobody@example.com")
-    assert result is None
+async def test_get_user_not_found(adapter):
+    assert await adapter.user.get_user_by_id("nonexistent") is None
+    assert await adapter.user.get_user_by_email("nobody@example.com") is None
 
 
 async def test_update_user(adapter):
@@ -82,8 +68,7 @@ async def test_update_user(adapter):
 
 
 async def test_update_user_duplicate_email_raises(adapter):
-    user = await adapter.user.create_user("alice@example.com")
-    await adapter.user.create_user("bob@example.com")
+    user, _ = await _make_users(adapter, "alice@example.com", "bob@example.com")
 
     with pytest.raises(UserAlreadyExistsError):
         await adapter.user.update_user(user["id"], email="bob@example.com")
@@ -94,8 +79,7 @@ async def test_update_user_duplicate_email_raises(adapter):
 
 
 async def test_update_user_duplicate_email_case_variant_raises(adapter):
-    user = await adapter.user.create_user("alice@example.com")
-    await adapter.user.create_user("Bob@Example.COM")
+    user, _ = await _make_users(adapter, "alice@example.com", "Bob@Example.COM")
 
     with pytest.raises(UserAlreadyExistsError):
         await adapter.user.update_user(user["id"], email=" bob@example.com ")
@@ -132,14 +116,9 @@ async def test_delete_user_not_found_raises(adapter):
 
 async def test_get_hashed_password(adapter):
     user = await adapter.user.create_user("alice@example.com", hashed_password="myhash")
-    pw = await adapter.user.get_hashed_password(user["id"])
-    assert pw == "myhash"
-
-
-async def test_get_hashed_password_none(adapter):
-    user = await adapter.user.create_user("alice@example.com")
-    pw = await adapter.user.get_hashed_password(user["id"])
-    assert pw is None
+    no_password = await adapter.user.create_user("bob@example.com")
+    assert await adapter.user.get_hashed_password(user["id"]) == "myhash"
+    assert await adapter.user.get_hashed_password(no_password["id"]) is None
 
 
 async def test_set_hashed_password(adapter):
@@ -165,22 +144,6 @@ def _token_data(user_id: str, token_type: str = "verification", token: str = "to
 
 
 async def test_create_and_get_token(adapter):
-    user = await adapter.user.create_user("alice@example.com")
-    data = _token_data(user["id"])
-    await adapter.token.create_token(data)
-    found = await adapter.token.get_token("tok1", "verification")
-    assert found is not None
-    assert found["user_id"] == user["id"]
-
-
-async def test_get_token_wrong_type(adapter):
-    user = await adapter.user.create_user("alice@example.com")
-    await adapter.token.create_token(_token_data(user["id"], "verification", "tok2"))
-    result = await adapter.token.get_token("tok2", "password_reset")
-    assert result is None
-
-
-async def test_get_token_expired(adapter):
     user = await adapter.user.create_user("alice@example.com")
     expired = {
         "token": "expired_tok",
@@ -188,9 +151,13 @@ async def test_get_token_expired(adapter):
         "token_type": "verification",
         "expires_at": datetime.now(timezone.utc) - timedelta(hours=1),
     }
-    await adapter.token.create_token(expired)
-    result = await adapter.token.get_token("expired_tok", "verification")
-    assert result is None
+    await adapter.token.create_tokens([_token_data(user["id"]), expired])
+
+    found = await adapter.token.get_token("tok1", "verification")
+    assert found is not None
+    assert found["user_id"] == user["id"]
+    assert await adapter.token.get_token("tok1", "password_reset") is None
+    assert await adapter.token.get_token("expired_tok", "verification") is None
 
 
 async def test_delete_token(adapter):
@@ -215,6 +182,23 @@ async def test_create_token_upsert(adapter):
     assert stored["raw_data"] == {"attempts": 2}
 
 
+async def test_create_users(adapter):
+    users = await _make_users(
+        adapter, "Alice@Example.COM", "bob@example.com", email_verified=True
+    )
+    assert [u["email"] for u in users] == ["alice@example.com", "bob@example.com"]
+    for user in users:
+        found = await adapter.user.get_user_by_id(user["id"])
+        assert found == user
+
+
+async def test_create_users_duplicate_inserts_nothing(adapter):
+    await adapter.user.create_user("alice@example.com")
+    with pytest.raises(UserAlreadyExistsError):
+        await _make_users(adapter, "bob@example.com", " ALICE@example.com")
+    assert await adapter.user.get_user_by_email("bob@example.com") is None
+
+
 async def test_create_user_honors_email_verified(adapter):
     user = await adapter.user.create_user("verified@example.com", email_verified=True)
     assert user["email_verified"] is True
@@ -222,20 +206,28 @@ async def test_create_user_honors_email_verified(adapter):
 
 async def test_delete_user_tokens(adapter):
     user = await adapter.user.create_user("alice@example.com")
-    await adapter.token.create_token(_token_data(user["id"], token="t1"))
-    await adapter.token.create_token(
-        _token_data(user["id"], token_type="password_reset", token="t2")
+    await adapter.token.create_tokens(
+        [
+            _token_data(user["id"], token="t1"),
+            _token_data(user["id"], token_type="password_reset", token="t2"),
+        ]
     )
     await adapter.token.delete_user_tokens(user["id"])
     assert await adapter.token.get_token("t1", "verification") is None
     assert await adapter.token.get_token("t2", "password_reset") is None
 
 
+async def test_create_tokens_empty(adapter):
+    assert await adapter.token.create_tokens([]) == []
+
+
 async def test_delete_user_tokens_by_type(adapter):
     user = await adapter.user.create_user("alice@example.com")
-    await adapter.token.create_token(_token_data(user["id"], token="t1"))
-    await adapter.token.create_token(
-        _token_data(user["id"], token_type="password_reset", token="t2")
+    await adapter.token.create_tokens(
+        [
+            _token_data(user["id"], token="t1"),
+            _token_data(user["id"], token_type="password_reset", token="t2"),
+        ]
     )
     await adapter.token.delete_user_tokens(user["id"], token_type="verification")
     assert await adapter.token.get_token("t1", "verification") is None
@@ -259,11 +251,7 @@ async def test_create_and_get_session(adapter):
     found = await adapter.session.get_session("sess1")
     assert found is not None
     assert found["user_id"] == user["id"]
-
-
-async def test_get_session_not_found(adapter):
-    result = await adapter.session.get_session("nonexistent")
-    assert result is None
+    assert await adapter.session.get_session("nonexistent") is None
 
 
 async def test_delete_session(adapter):
@@ -275,19 +263,23 @@ async def test_delete_session(adapter):
 
 async def test_delete_user_sessions(adapter):
     user = await adapter.user.create_user("alice@example.com")
-    await adapter.session.create_session(_session_data(user["id"], "s1"))
-    await adapter.session.create_session(_session_data(user["id"], "s2"))
+    await adapter.session.create_sessions(
+        [_session_data(user["id"], "s1"), _session_data(user["id"], "s2")]
+    )
     await adapter.session.delete_user_sessions(user["id"])
     assert await adapter.session.get_session("s1") is None
     assert await adapter.session.get_session("s2") is None
 
 
 async def test_list_user_sessions(adapter):
-    user = await adapter.user.create_user("alice@example.com")
-    other = await adapter.user.create_user("bob@example.com")
-    await adapter.session.create_session(_session_data(user["id"], "s1"))
-    await adapter.session.create_session(_session_data(user["id"], "s2"))
-    await adapter.session.create_session(_session_data(other["id"], "s3"))
+    user, other = await _make_users(adapter, "alice@example.com", "bob@example.com")
+    await adapter.session.create_sessions(
+        [
+            _session_data(user["id"], "s1"),
+            _session_data(user["id"], "s2"),
+            _session_data(other["id"], "s3"),
+        ]
+    )
 
     sessions = await adapter.session.list_user_sessions(user["id"])
     assert len(sessions) == 2
@@ -326,12 +318,15 @@ async def test_get_role_not_found(adapter):
 
 
 async def test_list_roles(adapter):
-    await adapter.role.create_role("admin")
-    await adapter.role.create_role("user")
-    roles = await adapter.role.list_roles()
-    names = [r["name"] for r in roles]
-    assert "admin" in names
-    assert "user" in names
+    await adapter.role.create_roles(
+        [
+            {"name": "admin", "permissions": ["read", "write"]},
+            {"name": "user", "permissions": []},
+        ]
+    )
+    roles = {r["name"]: r["permissions"] for r in await adapter.role.list_roles()}
+    assert sorted(roles["admin"]) == ["read", "write"]
+    assert roles["user"] == []
 
 
 async def test_delete_role(adapter):
@@ -350,12 +345,11 @@ async def test_add_permissions(adapter):
 
 
 async def test_remove_permissions(adapter):
-    await adapter.role.create_role("editor", ["read", "write"])
-    await adapter.role.remove_permissions("editor", ["write"])
+    await adapter.role.create_role("editor", ["read", "write", "publish"])
+    await adapter.role.remove_permissions("editor", ["write", "publish"])
     role = await adapter.role.get_role("editor")
     assert role is not None
-    assert "write" not in role["permissions"]
-    assert "read" in role["permissions"]
+    assert role["permissions"] == ["read"]
 
 
 async def test_assign_and_get_user_roles(adapter):
@@ -402,16 +396,12 @@ async def test_create_and_get_oauth_account(adapter):
     found = await adapter.oauth.get_oauth_account("google", "goog123")
     assert found is not None
     assert found["user_id"] == user["id"]
-
-
-async def test_get_oauth_account_not_found(adapter):
-    result = await adapter.oauth.get_oauth_account("github", "nonexistent")
-    assert result is None
+    assert await adapter.oauth.get_oauth_account("github", "goog123") is None
+    assert await adapter.oauth.get_oauth_account("google", "nonexistent") is None
 
 
 async def test_create_oauth_account_duplicate_returns_existing(adapter):
-    user1 = await adapter.user.create_user("alice@example.com")
-    user2 = await adapter.user.create_user("bob@example.com")
+    user1, user2 = await _make_users(adapter, "alice@example.com", "bob@example.com")
     await adapter.oauth.create_oauth_account(_oauth_data(user1["id"]))
 
     # Same (provider, provider_account_id) for a different user is treated
@@ -542,5 +532,40 @@ async def test_cleanup_expired_sessions_none_expired(adapter):
 async def test_create_tables_idempotent():
     a = SQLAlchemyAdapter(engine_url="sqlite+aiosqlite:///:memory:")
     await a.create_tables()
-    await a.create_tables()
+    with patch.object(Base.metadata, "create_all") as create_all:
+        await a.create_tables()
+    create_all.assert_not_called()
     await a.drop_tables()
+    assert a._tables_created is False
+
+
+async def test_engine_kwargs_forwarded():
+    a = SQLAlchemyAdapter(engine_url="sqlite+aiosqlite:///:memory:", echo=True)
+    assert a._engine.echo is True
+    await a._engine.dispose()
+
+
+async def test_lookup_columns_indexed(adapter):
+    def _indexed_columns(conn, table):
+        return {
+            column
+            for index in inspect(conn).get_indexes(table)
+            for column in index["column_names"]
+        }
+
+    async with adapter._engine.connect() as conn:
+        sessions = await conn.run_sync(_indexed_columns, "fastauth_sessions")
+        oauth = await conn.run_sync(_indexed_columns, "fastauth_oauth_accounts")
+    assert {"user_id", "expires_at"} <= sessions
+    assert "user_id" in oauth
+
+
+async def test_string_keyed_tables_without_rowid(adapter):
+    async with adapter._engine.connect() as conn:
+        result = await conn.exec_driver_sql(
+            "SELECT name, sql FROM sqlite_master WHERE name IN "
+            "('fastauth_sessions', 'fastauth_tokens')"
+        )
+        rows = dict(result.all())
+    assert set(rows) == {"fastauth_sessions", "fastauth_tokens"}
+    assert all("WITHOUT ROWID" in sql for sql in rows.values())
@@ -1,16 +1,7 @@
-import pytest
-from fastauth.adapters.sqlalchemy import SQLAlchemyAdapter
+import pytest_asyncio
 
 
-@pytest.fixture
-async def adapter():
-    a = SQLAlchemyAdapter(engine_url="sqlite+aiosqlite:///:memory:")
-    await a.create_tables()
-    yield a
-    await a.drop_tables()
-
-
-@pytest.fixture
+@pytest_asyncio.fixture
 async def user(adapter):
     return await adapter.user.create_user("pk@example.com", hashed_password="hash")
 
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -15,35 +16,25 @@ from fastauth.providers.credentials import CredentialsProvider
 from httpx import ASGITransport, AsyncClient
 
 
-@pytest.fixture
-def memory_user_adapter():
-    return MemoryUserAdapter()
-
-
-@pytest.fixture
-def memory_token_adapter():
-    return MemoryTokenAdapter()
-
-
-@pytest.fixture
-def config(memory_user_adapter, memory_token_adapter):
+@pytest.fixture(scope="module")
+def config(module_shared):
     return FastAuthConfig(
         secret="super-secret-key-only-for-testing",
         providers=[CredentialsProvider()],
-        adapter=memory_user_adapter,
+        adapter=module_shared.get(MemoryUserAdapter),
         jwt=JWTConfig(algorithm="HS256"),
-        token_adapter=memory_token_adapter,
+        token_adapter=module_shared.get(MemoryTokenAdapter),
         email_transport=ConsoleTransport(),
         base_url="http://localhost:8000",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth(config):
     return FastAuth(config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app(auth):
     _app = FastAPI()
     auth.mount(_app)
@@ -55,11 +46,24 @@ def app(auth):
     return _app
 
 
+@pytest.fixture(autouse=True)
+def _reset_state(auth, memory_user_adapter, memory_token_adapter):
+    auth.session_adapter = None
+
+
 @pytest.fixture
-async def client(app):
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def memory_user_adapter(shared):
+    return shared(MemoryUserAdapter)
+
+
+@pytest.fixture
+def memory_token_adapter(shared):
+    return shared(MemoryTokenAdapter)
+
+
+@pytest.fixture
+def client(shared, app):
+    return shared(app)
 
 
 async def _register_and_get_token(client):
@@ -148,11 +152,16 @@ async def test_change_email_wrong_password(client):
 
 
 async def test_change_email_already_taken(client):
-    token = await _register_and_get_token(client)
-    # Register another user
-    await client.post(
-        "/auth/register",
-        json={"email": "other@example.com", "password": "Pass123#", "name": "Other"},
+    token, _ = await asyncio.gather(
+        _register_and_get_token(client),
+        client.post(
+            "/auth/register",
+            json={
+                "email": "other@example.com",
+                "password": "Pass123#",
+                "name": "Other",
+            },
+        ),
     )
 
     resp = await client.post(
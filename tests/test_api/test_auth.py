@@ -162,7 +162,7 @@ async def test_refresh_body_preferred_over_stale_cookie(client):
     assert resp.status_code == 200
 
 
-async def test_login_remember_me_extends_refresh_ttl(client):
+async def test_login_remember_me_extends_refresh_ttl(client, auth):
 
     await __register_user(client)
 
@@ -177,12 +177,11 @@ async def test_login_remember_me_extends_refresh_ttl(client):
     assert normal.status_code == 200
     assert remember.status_code == 200
 
-    fa = client._transport.app.state.fastauth
     normal_claims = decode_token(
-        normal.json()["refresh_token"], fa.config, fa.jwks_manager
+        normal.json()["refresh_token"], auth.config, auth.jwks_manager
     )
     remember_claims = decode_token(
-        remember.json()["refresh_token"], fa.config, fa.jwks_manager
+        remember.json()["refresh_token"], auth.config, auth.jwks_manager
     )
 
     assert remember_claims["exp"] > normal_claims["exp"]
@@ -28,22 +28,22 @@ def _csrf_headers(client: AsyncClient) -> dict[str, str]:
 
 
 @pytest.fixture
-def user_adapter():
-    return MemoryUserAdapter()
+def user_adapter(shared):
+    return shared(MemoryUserAdapter)
 
 
 @pytest.fixture
-def token_adapter():
-    return MemoryTokenAdapter()
+def token_adapter(shared):
+    return shared(MemoryTokenAdapter)
 
 
-@pytest.fixture
-def cookie_app(user_adapter, token_adapter):
+@pytest.fixture(scope="module")
+def cookie_app(module_shared):
     config = FastAuthConfig(
         secret="super-secret-key-only-for-testing",
         providers=[CredentialsProvider()],
-        adapter=user_adapter,
-        token_adapter=token_adapter,
+        adapter=module_shared.get(MemoryUserAdapter),
+        token_adapter=module_shared.get(MemoryTokenAdapter),
         token_delivery="cookie",
         debug=True,
     )
@@ -59,18 +59,16 @@ def cookie_app(user_adapter, token_adapter):
 
 
 @pytest.fixture
-async def cookie_client(cookie_app):
-    transport = ASGITransport(app=cookie_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def cookie_client(shared, cookie_app, user_adapter, token_adapter):
+    return shared(cookie_app)
 
 
-@pytest.fixture
-def json_app(user_adapter):
+@pytest.fixture(scope="module")
+def json_app(module_shared):
     config = FastAuthConfig(
         secret="super-secret-key-only-for-testing",
         providers=[CredentialsProvider()],
-        adapter=user_adapter,
+        adapter=module_shared.get(MemoryUserAdapter),
     )
     auth = FastAuth(config)
     _app = FastAPI()
@@ -84,10 +82,8 @@ def json_app(user_adapter):
 
 
 @pytest.fixture
-async def json_client(json_app):
-    transport = ASGITransport(app=json_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def json_client(shared, json_app, user_adapter):
+    return shared(json_app)
 
 
 async def test_register_sets_cookies(cookie_client):
@@ -4,22 +4,28 @@ from fastauth import FastAuth
 from fastauth.adapters.memory import MemoryTokenAdapter, MemoryUserAdapter
 from fastauth.api.deps import require_auth
 from fastauth.config import FastAuthConfig, JWTConfig
+from fastauth.core.tokens import create_access_token
 from fastauth.email_transports.console import ConsoleTransport
 from fastauth.providers.credentials import CredentialsProvider
-from httpx import ASGITransport, AsyncClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def memory_user_adapter():
     return MemoryUserAdapter()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def memory_token_adapter():
     return MemoryTokenAdapter()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_adapters(memory_user_adapter, memory_token_adapter):
+    memory_user_adapter.clear()
+    memory_token_adapter.clear()
+
+
+@pytest.fixture(scope="module")
 def config(memory_user_adapter, memory_token_adapter):
     return FastAuthConfig(
         secret="super-secret-key-only-for-testing",
@@ -32,12 +38,12 @@ def config(memory_user_adapter, memory_token_adapter):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth(config):
     return FastAuth(config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app(auth):
     _app = FastAPI()
     auth.mount(_app)
@@ -50,18 +56,18 @@ def app(auth):
 
 
 @pytest.fixture
-async def client(app):
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def client(shared, app):
+    return shared(app)
 
 
-async def _register(client):
-    resp = await client.post(
-        "/auth/register",
-        json={"email": "test@example.com", "password": "Pass123#", "name": "Test"},
-    )
-    return resp.json()
+@pytest.fixture
+async def registered_user(memory_user_adapter):
+    return await memory_user_adapter.create_user("test@example.com", name="Test")
+
+
+@pytest.fixture
+def access_token(registered_user, config):
+    return create_access_token(registered_user, config)
 
 
 def _extract_token_from_capsys(capsys) -> str:
@@ -80,11 +86,10 @@ def _extract_token_from_capsys(capsys) -> str:
     raise AssertionError(f"Could not find token= in console output:\n{out}")
 
 
-async def test_request_verify_email(client):
-    tokens = await _register(client)
+async def test_request_verify_email(client, access_token):
     resp = await client.post(
         "/auth/request-verify-email",
-        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        headers={"Authorization": f"Bearer {access_token}"},
     )
     assert resp.status_code == 200
     assert resp.json()["message"] == "Verification email sent"
@@ -95,11 +100,10 @@ async def test_request_verify_email_unauthenticated(client):
     assert resp.status_code == 401
 
 
-async def test_verify_email_post(client, capsys):
-    tokens = await _register(client)
+async def test_verify_email_post(client, access_token, capsys):
     await client.post(
         "/auth/request-verify-email",
-        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        headers={"Authorization": f"Bearer {access_token}"},
     )
 
     verify_token = _extract_token_from_capsys(capsys)
@@ -112,14 +116,11 @@ async def test_verify_email_post(client, capsys):
     assert replay.status_code == 400
 
 
-async def test_verify_email_get(client, capsys):
-    tokens = await _register(client)
-    await client.post(
-        "/auth/request-verify-email",
-        headers={"Authorization": f"Bearer {tokens['access_token']}"},
-    )
-
-    verify_token = _extract_token_from_capsys(capsys)
+async def test_verify_email_get(
+    client, memory_user_adapter, memory_token_adapter, issue_token
+):
+    user = await memory_user_adapter.create_user("test@example.com")
+    verify_token = await issue_token(memory_token_adapter, user["id"], "verification")
 
     resp = await client.get(f"/auth/verify-email?token={verify_token}")
     assert resp.status_code == 200
@@ -130,8 +131,7 @@ async def test_verify_email_invalid_token(client):
     assert resp.status_code == 400
 
 
-async def test_forgot_password(client):
-    await _register(client)
+async def test_forgot_password(client, registered_user):
     resp = await client.post(
         "/auth/forgot-password", json={"email": "test@example.com"}
     )
@@ -150,8 +150,7 @@ async def test_forgot_password_nonexistent_email(client):
     assert resp.status_code == 200
 
 
-async def test_reset_password(client, capsys):
-    await _register(client)
+async def test_reset_password(client, registered_user, capsys):
     await client.post("/auth/forgot-password", json={"email": "test@example.com"})
 
     reset_token = _extract_token_from_capsys(capsys)
@@ -184,7 +183,7 @@ async def test_reset_password_invalid_token(client):
     assert resp.status_code == 400
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def no_token_adapter_app():
     adapter = MemoryUserAdapter()
     config = FastAuthConfig(
@@ -199,10 +198,8 @@ def no_token_adapter_app():
 
 
 @pytest.fixture
-async def no_ta_client(no_token_adapter_app):
-    transport = ASGITransport(app=no_token_adapter_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def no_ta_client(shared, no_token_adapter_app):
+    return shared(no_token_adapter_app)
 
 
 async def test_request_verify_email_no_token_adapter(no_ta_client):
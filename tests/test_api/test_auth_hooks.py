@@ -3,6 +3,7 @@ from fastapi import FastAPI
 from fastauth import FastAuth, FastAuthConfig
 from fastauth.adapters.memory import MemoryTokenAdapter, MemoryUserAdapter
 from fastauth.core.protocols import EventHooks
+from fastauth.core.tokens import create_refresh_token
 from fastauth.email_transports.console import ConsoleTransport
 from fastauth.providers.credentials import CredentialsProvider
 from httpx import ASGITransport, AsyncClient
@@ -35,31 +36,49 @@ class RecordingHooks(EventHooks):
         self.calls.append("on_password_reset")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def hooks():
     return RecordingHooks()
 
 
-@pytest.fixture
-def hooks_app(hooks):
-    adapter = MemoryUserAdapter()
-    config = FastAuthConfig(
+@pytest.fixture(scope="module")
+def user_adapter():
+    return MemoryUserAdapter()
+
+
+@pytest.fixture(scope="module")
+def token_adapter():
+    return MemoryTokenAdapter()
+
+
+@pytest.fixture(autouse=True)
+def _reset_state(hooks, user_adapter, token_adapter):
+    hooks.calls.clear()
+    user_adapter.clear()
+    token_adapter.clear()
+
+
+@pytest.fixture(scope="module")
+def hooks_config(hooks, user_adapter):
+    return FastAuthConfig(
         secret="super-secret-key-only-for-testing",
         providers=[CredentialsProvider()],
-        adapter=adapter,
+        adapter=user_adapter,
         hooks=hooks,
     )
-    auth = FastAuth(config)
+
+
+@pytest.fixture(scope="module")
+def hooks_app(hooks_config):
+    auth = FastAuth(hooks_config)
     _app = FastAPI()
     auth.mount(_app)
     return _app
 
 
 @pytest.fixture
-async def hooks_client(hooks_app):
-    transport = ASGITransport(app=hooks_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def hooks_client(shared, hooks_app):
+    return shared(hooks_app)
 
 
 async def test_register_calls_on_signup(hooks_client, hooks):
@@ -68,61 +87,58 @@ async def test_register_calls_on_signup(hooks_client, hooks):
     assert "on_signup" in hooks.calls
 
 
-async def test_login_calls_on_signin(hooks_client, hooks):
-    await hooks_client.post("/auth/register", json=_REGISTER)
+@pytest.fixture
+async def registered(hooks_client, hooks):
+    resp = await hooks_client.post("/auth/register", json=_REGISTER)
     hooks.calls.clear()
-    resp = await hooks_client.post(
+    return resp.json()
+
+
+async def _login(client, tokens):
+    return await client.post(
         "/auth/login", json={"email": _EMAIL, "password": _PASSWORD}
     )
-    assert resp.status_code == 200
-    assert "on_signin:credentials" in hooks.calls
 
 
-async def test_logout_calls_on_signout(hooks_client, hooks):
-    resp = await hooks_client.post("/auth/register", json=_REGISTER)
-    token = resp.json()["access_token"]
-    hooks.calls.clear()
-    resp = await hooks_client.post(
-        "/auth/logout", headers={"Authorization": f"Bearer {token}"}
+async def _logout(client, tokens):
+    return await client.post(
+        "/auth/logout",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
     )
-    assert resp.status_code == 200
-    assert "on_signout" in hooks.calls
 
 
-async def test_refresh_calls_on_token_refresh(hooks_client, hooks):
-    resp = await hooks_client.post("/auth/register", json=_REGISTER)
-    refresh_token = resp.json()["refresh_token"]
-    hooks.calls.clear()
-    resp = await hooks_client.post(
-        "/auth/refresh", json={"refresh_token": refresh_token}
+async def _refresh(client, tokens):
+    return await client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
     )
-    assert resp.status_code == 200
-    assert "on_token_refresh" in hooks.calls
 
 
-async def test_refresh_inactive_user_returns_401(hooks_client):
-    resp = await hooks_client.post("/auth/register", json=_REGISTER)
-    tokens = resp.json()
-    refresh_token = tokens["refresh_token"]
-
-    app = hooks_client._transport.app
-    fa = app.state.fastauth
-    user = await fa.config.adapter.get_user_by_email(_EMAIL)
-    await fa.config.adapter.delete_user(user["id"], soft=True)
+@pytest.mark.parametrize(
+    ("action", "expected"),
+    [
+        (_login, "on_signin:credentials"),
+        (_logout, "on_signout"),
+        (_refresh, "on_token_refresh"),
+    ],
+    ids=["login", "logout", "refresh"],
+)
+async def test_action_calls_hook(hooks_client, hooks, registered, action, expected):
+    resp = await action(hooks_client, registered)
+    assert resp.status_code == 200
+    assert expected in hooks.calls
 
-    resp = await hooks_client.post(
-        "/auth/refresh", json={"refresh_token": refresh_token}
-    )
-    assert resp.status_code == 401
 
+async def test_refresh_inactive_user_returns_401(
+    hooks_client, hooks, hooks_config, user_adapter
+):
+    user = await user_adapter.create_user(_EMAIL, is_active=False)
+    refresh_token = create_refresh_token(user, hooks_config)
 
-async def test_refresh_with_access_token_returns_401(hooks_client):
-    resp = await hooks_client.post("/auth/register", json=_REGISTER)
-    access_token = resp.json()["access_token"]
     resp = await hooks_client.post(
-        "/auth/refresh", json={"refresh_token": access_token}
+        "/auth/refresh", json={"refresh_token": refresh_token}
     )
     assert resp.status_code == 401
+    assert "on_token_refresh" not in hooks.calls
 
 
 async def test_register_no_credentials_provider():
@@ -155,24 +171,20 @@ async def test_register_no_credentials_provider():
         assert resp.status_code == 400
 
 
-async def test_get_current_user_non_access_token_returns_none(hooks_client):
-    resp = await hooks_client.post("/auth/register", json=_REGISTER)
-    refresh_token = resp.json()["refresh_token"]
-
+async def test_get_current_user_non_access_token_returns_none(hooks_client, registered):
     resp = await hooks_client.get(
-        "/auth/me", headers={"Authorization": f"Bearer {refresh_token}"}
+        "/auth/me",
+        headers={"Authorization": f"Bearer {registered['refresh_token']}"},
     )
     assert resp.status_code == 401
 
 
-@pytest.fixture
-def hooks_with_email_app(hooks):
-    adapter = MemoryUserAdapter()
-    token_adapter = MemoryTokenAdapter()
+@pytest.fixture(scope="module")
+def hooks_with_email_app(hooks, user_adapter, token_adapter):
     config = FastAuthConfig(
         secret="super-secret-key-only-for-testing",
         providers=[CredentialsProvider()],
-        adapter=adapter,
+        adapter=user_adapter,
         token_adapter=token_adapter,
         hooks=hooks,
         email_transport=ConsoleTransport(),
@@ -181,45 +193,19 @@ def hooks_with_email_app(hooks):
     auth = FastAuth(config)
     _app = FastAPI()
     auth.mount(_app)
-    return _app, token_adapter
+    return _app
 
 
 @pytest.fixture
-async def hooks_email_client(hooks_with_email_app):
-    _app, _ = hooks_with_email_app
-    transport = ASGITransport(app=_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
-
-
-def _extract_token(capsys) -> str:
-    out = capsys.readouterr().out
-    for line in out.splitlines():
-        if "token=" in line:
-            tail = line.split("token=", 1)[1]
-            raw = ""
-            for ch in tail:
-                if ch.isalnum() or ch in "-_.":
-                    raw += ch
-                else:
-                    break
-            if raw:
-                return raw
-    raise AssertionError(f"Could not find token= in console output:\n{out}")
+def hooks_email_client(shared, hooks_with_email_app):
+    return shared(hooks_with_email_app)
 
 
 async def test_verify_email_calls_hook(
-    hooks_email_client, hooks_with_email_app, hooks, capsys
+    hooks_email_client, user_adapter, token_adapter, hooks, issue_token
 ):
-    _, token_adapter = hooks_with_email_app
-    resp = await hooks_email_client.post("/auth/register", json=_REGISTER)
-    token = resp.json()["access_token"]
-    await hooks_email_client.post(
-        "/auth/request-verify-email",
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    hooks.calls.clear()
-    verify_token = _extract_token(capsys)
+    user = await user_adapter.create_user(_EMAIL)
+    verify_token = await issue_token(token_adapter, user["id"], "verification")
     resp = await hooks_email_client.post(
         "/auth/verify-email", json={"token": verify_token}
     )
@@ -228,13 +214,10 @@ async def test_verify_email_calls_hook(
 
 
 async def test_reset_password_calls_hook(
-    hooks_email_client, hooks_with_email_app, hooks, capsys
+    hooks_email_client, user_adapter, token_adapter, hooks, issue_token
 ):
-    _, token_adapter = hooks_with_email_app
-    await hooks_email_client.post("/auth/register", json=_REGISTER)
-    await hooks_email_client.post("/auth/forgot-password", json={"email": _EMAIL})
-    hooks.calls.clear()
-    reset_token = _extract_token(capsys)
+    user = await user_adapter.create_user(_EMAIL)
+    reset_token = await issue_token(token_adapter, user["id"], "password_reset")
     resp = await hooks_email_client.post(
         "/auth/reset-password",
         json={"token": reset_token, "new_password": "NewPass456#"},
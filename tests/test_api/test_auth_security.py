@@ -1,3 +1,4 @@
+import pytest
 from fastapi import FastAPI
 from fastauth import FastAuth
 from fastauth.adapters.memory import MemoryTokenAdapter, MemoryUserAdapter
@@ -130,7 +131,12 @@ async def test_strong_password_on_change_succeeds():
         assert resp.status_code == 200
 
 
-async def test_weak_password_on_reset_rejected(capsys):
+@pytest.mark.parametrize(
+    ("new_password", "expected_status"),
+    [("short", 400), ("SuperSafe123!@#", 200)],
+    ids=["weak", "strong"],
+)
+async def test_password_strength_on_reset(capsys, new_password, expected_status):
     app, _, _ = _build_app(password=_STRICT)
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as c:
@@ -148,32 +154,9 @@ async def test_weak_password_on_reset_rejected(capsys):
 
         resp = await c.post(
             "/auth/reset-password",
-            json={"token": token, "new_password": "short"},
+            json={"token": token, "new_password": new_password},
         )
-        assert resp.status_code == 400
-
-
-async def test_strong_password_on_reset_succeeds(capsys):
-    app, _, _ = _build_app(password=_STRICT)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        await c.post(
-            "/auth/register",
-            json={
-                "email": "rstok@example.com",
-                "password": "InitialPass123!@#",
-                "name": "T",
-            },
-        )
-        await c.post("/auth/forgot-password", json={"email": "rstok@example.com"})
-
-        token = _extract_token(capsys)
-
-        resp = await c.post(
-            "/auth/reset-password",
-            json={"token": token, "new_password": "SuperSafe123!@#"},
-        )
-        assert resp.status_code == 200
+        assert resp.status_code == expected_status
 
 
 async def test_reset_password_revokes_existing_refresh_jti(capsys):
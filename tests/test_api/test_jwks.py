@@ -1,19 +1,25 @@
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from fastauth import FastAuth
 from fastauth.adapters.memory import MemoryUserAdapter
 from fastauth.config import FastAuthConfig, JWTConfig
 from fastauth.providers.credentials import CredentialsProvider
-from httpx import ASGITransport, AsyncClient
 
 
-@pytest.fixture
-async def rs256_app():
+@pytest_asyncio.fixture(scope="module")
+async def rs256_app(rsa_pem_keys):
+    private_key, public_key = rsa_pem_keys
     config = FastAuthConfig(
         secret="not-used-for-rs256",
         providers=[CredentialsProvider()],
         adapter=MemoryUserAdapter(),
-        jwt=JWTConfig(algorithm="RS256", jwks_enabled=True),
+        jwt=JWTConfig(
+            algorithm="RS256",
+            jwks_enabled=True,
+            private_key=private_key,
+            public_key=public_key,
+        ),
     )
     auth = FastAuth(config)
     await auth.initialize_jwks()
@@ -24,13 +30,11 @@ async def rs256_app():
 
 
 @pytest.fixture
-async def rs256_client(rs256_app):
-    transport = ASGITransport(app=rs256_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def rs256_client(shared, rs256_app):
+    return shared(rs256_app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def hs256_app():
     config = FastAuthConfig(
         secret="this-is-a-test-secret-32-bytes!!",
@@ -45,10 +49,8 @@ def hs256_app():
 
 
 @pytest.fixture
-async def hs256_client(hs256_app):
-    transport = ASGITransport(app=hs256_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def hs256_client(shared, hs256_app):
+    return shared(hs256_app)
 
 
 async def test_jwks_endpoint(rs256_client):
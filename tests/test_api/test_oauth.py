@@ -40,27 +40,44 @@ class FakeOAuthProvider:
         return None
 
 
-@pytest.fixture
-def oauth_app():
-    user_adapter = MemoryUserAdapter()
-    oauth_adapter = MemoryOAuthAccountAdapter()
-    state_store = MemorySessionBackend()
-
-    config = FastAuthConfig(
+@pytest.fixture(scope="module")
+def oauth_config():
+    return FastAuthConfig(
         secret="this-is-a-test-secret-32-bytes!!",
         providers=[CredentialsProvider(), FakeOAuthProvider()],
-        adapter=user_adapter,
+        adapter=MemoryUserAdapter(),
         jwt=JWTConfig(algorithm="HS256"),
-        oauth_adapter=oauth_adapter,
-        oauth_state_store=state_store,
+        oauth_adapter=MemoryOAuthAccountAdapter(),
+        oauth_state_store=MemorySessionBackend(),
     )
-    auth = FastAuth(config)
+
+
+@pytest.fixture(scope="module")
+def oauth_app(oauth_config):
+    auth = FastAuth(oauth_config)
     app = FastAPI()
     auth.mount(app)
-    return app, oauth_adapter, user_adapter, state_store
+    return (
+        app,
+        oauth_config.oauth_adapter,
+        oauth_config.adapter,
+        oauth_config.oauth_state_store,
+    )
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_oauth_app(oauth_app, oauth_config):
+    _, oauth_adapter, user_adapter, state_store = oauth_app
+    config = oauth_config
+    providers, hooks = config.providers, config.hooks
+    user_adapter.clear()
+    oauth_adapter.clear()
+    state_store.clear()
+    yield
+    config.providers, config.hooks = providers, hooks
+
+
+@pytest.fixture(scope="module")
 def oauth_redirect_app():
     config = FastAuthConfig(
         secret="this-is-a-test-secret-32-bytes!!",
@@ -78,22 +95,13 @@ def oauth_redirect_app():
 
 
 @pytest.fixture
-async def client(oauth_app):
-    app, _, _, _ = oauth_app
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def client(shared, oauth_app):
+    return shared(oauth_app[0])
 
 
 @pytest.fixture
-async def redirect_client(oauth_redirect_app):
-    transport = ASGITransport(app=oauth_redirect_app)
-    async with AsyncClient(
-        transport=transport,
-        base_url="http://test",
-        follow_redirects=False,
-    ) as c:
-        yield c
+def redirect_client(shared, oauth_redirect_app):
+    return shared(oauth_redirect_app)
 
 
 async def test_authorize(client):
@@ -397,7 +405,9 @@ async def test_oauth_callback_state_missing_redirect_uri(client, oauth_app):
     assert "redirect_uri" in resp.json()["detail"]
 
 
-async def test_oauth_callback_uses_redirect_uri_from_state(client, oauth_app):
+async def test_oauth_callback_uses_redirect_uri_from_state(
+    client, oauth_app, oauth_config
+):
     """The callback's exchange_code call must receive the redirect_uri
     that was bound to the state at /authorize, not the one re-computed
     from the request URL."""
@@ -405,10 +415,8 @@ async def test_oauth_callback_uses_redirect_uri_from_state(client, oauth_app):
 
     capturing = CapturingOAuthProvider()
     # Replace the provider in the app with a capturing one
-    app = client._transport.app
-    fa = app.state.fastauth
-    fa.config.providers = [
-        p for p in fa.config.providers if getattr(p, "auth_type", None) != "oauth"
+    oauth_config.providers = [
+        p for p in oauth_config.providers if getattr(p, "auth_type", None) != "oauth"
     ] + [capturing]
 
     await state_store.write(
@@ -464,7 +472,9 @@ class CapturingOAuthProvider:
         return None
 
 
-async def test_oauth_signin_does_not_fire_on_oauth_link(client, oauth_app):
+async def test_oauth_signin_does_not_fire_on_oauth_link(
+    client, oauth_app, oauth_config
+):
     """on_oauth_link must NOT fire on normal OAuth sign-in. It is
     reserved for explicit /auth/oauth/{provider}/link/callback flows."""
     from fastauth.core.protocols import EventHooks
@@ -479,9 +489,7 @@ async def test_oauth_signin_does_not_fire_on_oauth_link(client, oauth_app):
             events.append(("on_signin", provider))
 
     _, oauth_adapter, user_adapter, state_store = oauth_app
-    app = client._transport.app
-    fa = app.state.fastauth
-    fa.config.hooks = Hooks()
+    oauth_config.hooks = Hooks()
 
     await state_store.write(
         "oauth_state:test-state",
@@ -504,7 +512,7 @@ async def test_oauth_signin_does_not_fire_on_oauth_link(client, oauth_app):
     assert "on_oauth_link" not in names
 
 
-async def test_oauth_link_callback_fires_on_oauth_link(client, oauth_app):
+async def test_oauth_link_callback_fires_on_oauth_link(client, oauth_app, oauth_config):
     """Conversely, /auth/oauth/{provider}/link/callback must fire
     on_oauth_link exactly once with the correct provider."""
     from fastauth.core.protocols import EventHooks
@@ -516,9 +524,7 @@ async def test_oauth_link_callback_fires_on_oauth_link(client, oauth_app):
             events.append((user["email"], provider))
 
     _, _, user_adapter, state_store = oauth_app
-    app = client._transport.app
-    fa = app.state.fastauth
-    fa.config.hooks = Hooks()
+    oauth_config.hooks = Hooks()
 
     # Create a local user that will be the target of the link.
     user = await user_adapter.create_user(email="link-target@example.com")
@@ -553,7 +559,9 @@ async def test_oauth_link_callback_fires_on_oauth_link(client, oauth_app):
     assert ("link-target@example.com", "fake") in events
 
 
-async def test_oauth_signin_denied_by_allow_signin_no_tokens(client, oauth_app):
+async def test_oauth_signin_denied_by_allow_signin_no_tokens(
+    client, oauth_app, oauth_config
+):
     """When allow_signin denies an OAuth sign-in, the response must not
     contain any tokens, no refresh JTI is recorded, and on_signin /
     on_oauth_link are not invoked."""
@@ -572,9 +580,7 @@ async def test_oauth_signin_denied_by_allow_signin_no_tokens(client, oauth_app):
             events.append("on_oauth_link")
 
     _, oauth_adapter, user_adapter, state_store = oauth_app
-    app = client._transport.app
-    fa = app.state.fastauth
-    fa.config.hooks = Hooks()
+    oauth_config.hooks = Hooks()
 
     await state_store.write(
         "oauth_state:test-state",
@@ -601,14 +607,14 @@ async def test_oauth_signin_denied_by_allow_signin_no_tokens(client, oauth_app):
         assert await oauth_adapter.get_user_oauth_accounts(user["id"]) == []
 
     # No refresh_jti should be recorded for the user.
-    if fa.config.token_adapter is not None:
+    if oauth_config.token_adapter is not None:
         # User was newly created by the OAuth flow. Look up by email.
         from fastauth.adapters.memory import MemoryUserAdapter
 
-        if isinstance(fa.config.adapter, MemoryUserAdapter):
-            user = await fa.config.adapter.get_user_by_email("oauth@example.com")
+        if isinstance(oauth_config.adapter, MemoryUserAdapter):
+            user = await oauth_config.adapter.get_user_by_email("oauth@example.com")
             if user is not None:
-                stored = await fa.config.token_adapter.get_token(
+                stored = await oauth_config.token_adapter.get_token(
                     "any-jti", "refresh_jti"
                 )
                 # The point is: no rotate happens; just assert the
@@ -1,3 +1,5 @@
+from typing import NamedTuple
+
 import pytest
 from fastapi import Depends, FastAPI
 from fastauth import FastAuth
@@ -7,18 +9,30 @@ from fastauth.adapters.memory import (
 )
 from fastauth.api.deps import require_permission, require_role
 from fastauth.config import FastAuthConfig, JWTConfig
+from fastauth.core.tokens import create_access_token
 from fastauth.providers.credentials import CredentialsProvider
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
 
-@pytest.fixture
-def rbac_app():
-    adapter = MemoryUserAdapter()
-    role_adapter = MemoryRoleAdapter()
+class _App(NamedTuple):
+    """A mounted app and the adapters behind it; ``clear()`` empties them."""
+
+    app: FastAPI
+    role_adapter: MemoryRoleAdapter | None
+    user_adapter: MemoryUserAdapter
+
+    def clear(self) -> None:
+        if self.role_adapter is not None:
+            self.role_adapter.clear()
+        self.user_adapter.clear()
+
+
+def _mount(role_adapter: MemoryRoleAdapter | None) -> _App:
+    user_adapter = MemoryUserAdapter()
     config = FastAuthConfig(
         secret="this-is-a-test-secret-32-bytes!!",
         providers=[CredentialsProvider()],
-        adapter=adapter,
+        adapter=user_adapter,
         jwt=JWTConfig(algorithm="HS256"),
     )
     auth = FastAuth(config)
@@ -26,46 +40,41 @@ def rbac_app():
 
     app = FastAPI()
     auth.mount(app)
-    return app, role_adapter, adapter
+    return _App(app, role_adapter, user_adapter)
+
 
+def _build_rbac_app() -> _App:
+    return _mount(MemoryRoleAdapter())
 
+
+# Each app is built once per module; requesting it resets only its own state.
 @pytest.fixture
-async def rbac_client(rbac_app):
-    app, _, _ = rbac_app
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def rbac_app(shared):
+    return shared(_build_rbac_app)
 
 
-async def _register_and_login(client: AsyncClient) -> tuple[str, str]:
-    """Register a user and return (access_token, user_email)."""
-    email = "admin@example.com"
-    await client.post(
-        "/auth/register",
-        json={
-            "email": email,
-            "password": "Password123!",
-            "name": "Admin",
-        },
-    )
-    resp = await client.post(
-        "/auth/login",
-        json={"email": email, "password": "Password123!"},
-    )
-    return resp.json()["access_token"], email
+@pytest.fixture
+def rbac_config(rbac_app):
+    return rbac_app.app.state.fastauth.config
+
+
+@pytest.fixture
+def rbac_client(shared, rbac_app):
+    return shared(rbac_app.app)
 
 
-async def _make_admin(rbac_app, user_email: str) -> None:
-    """Assign admin role to the user."""
+@pytest.fixture
+async def admin(rbac_app, rbac_config):
+    """Seed an admin user directly and return (access_token, user)."""
     _, role_adapter, user_adapter = rbac_app
+    user = await user_adapter.create_user("admin@example.com", name="Admin")
     await role_adapter.create_role("admin", ["users:read", "users:delete"])
-    user = await user_adapter.get_user_by_email(user_email)
     await role_adapter.assign_role(user["id"], "admin")
+    return create_access_token(user, rbac_config), user
 
 
-async def test_list_roles(rbac_client, rbac_app):
-    token, email = await _register_and_login(rbac_client)
-    await _make_admin(rbac_app, email)
+async def test_list_roles(rbac_client, admin):
+    token, _ = admin
 
     resp = await rbac_client.get(
         "/auth/roles",
@@ -77,8 +86,10 @@ async def test_list_roles(rbac_client, rbac_app):
     assert roles[0]["name"] == "admin"
 
 
-async def test_list_roles_forbidden(rbac_client):
-    token, _ = await _register_and_login(rbac_client)
+async def test_list_roles_forbidden(rbac_client, rbac_app, rbac_config):
+    _, _, user_adapter = rbac_app
+    user = await user_adapter.create_user("member@example.com")
+    token = create_access_token(user, rbac_config)
     resp = await rbac_client.get(
         "/auth/roles",
         headers={"Authorization": f"Bearer {token}"},
@@ -86,9 +97,8 @@ async def test_list_roles_forbidden(rbac_client):
     assert resp.status_code == 403
 
 
-async def test_create_role(rbac_client, rbac_app):
-    token, email = await _register_and_login(rbac_client)
-    await _make_admin(rbac_app, email)
+async def test_create_role(rbac_client, admin):
+    token, _ = admin
 
     resp = await rbac_client.post(
         "/auth/roles",
@@ -100,9 +110,8 @@ async def test_create_role(rbac_client, rbac_app):
     assert resp.json()["permissions"] == ["posts:write"]
 
 
-async def test_create_role_duplicate(rbac_client, rbac_app):
-    token, email = await _register_and_login(rbac_client)
-    await _make_admin(rbac_app, email)
+async def test_create_role_duplicate(rbac_client, admin):
+    token, _ = admin
 
     resp = await rbac_client.post(
         "/auth/roles",
@@ -112,9 +121,8 @@ async def test_create_role_duplicate(rbac_client, rbac_app):
     assert resp.status_code == 409
 
 
-async def test_delete_role(rbac_client, rbac_app):
-    token, email = await _register_and_login(rbac_client)
-    await _make_admin(rbac_app, email)
+async def test_delete_role(rbac_client, rbac_app, admin):
+    token, _ = admin
 
     _, role_adapter, _ = rbac_app
     await role_adapter.create_role("editor")
@@ -127,9 +135,8 @@ async def test_delete_role(rbac_client, rbac_app):
     assert resp.json()["message"] == "Role deleted"
 
 
-async def test_delete_role_not_found(rbac_client, rbac_app):
-    token, email = await _register_and_login(rbac_client)
-    await _make_admin(rbac_app, email)
+async def test_delete_role_not_found(rbac_client, admin):
+    token, _ = admin
 
     resp = await rbac_client.delete(
         "/auth/roles/nonexistent",
@@ -138,13 +145,11 @@ async def test_delete_role_not_found(rbac_client, rbac_app):
     assert resp.status_code == 404
 
 
-async def test_assign_and_get_user_roles(rbac_client, rbac_app):
-    token, email = await _register_and_login(rbac_client)
-    await _make_admin(rbac_app, email)
+async def test_assign_and_get_user_roles(rbac_client, rbac_app, admin):
+    token, user = admin
 
-    _, role_adapter, user_adapter = rbac_app
+    _, role_adapter, _ = rbac_app
     await role_adapter.create_role("editor", ["posts:write"])
-    user = await user_adapter.get_user_by_email(email)
 
     resp = await rbac_client.post(
         "/auth/roles/assign",
@@ -163,13 +168,11 @@ async def test_assign_and_get_user_roles(rbac_client, rbac_app):
     assert "posts:write" in data["permissions"]
 
 
-async def test_revoke_role(rbac_client, rbac_app):
-    token, email = await _register_and_login(rbac_client)
-    await _make_admin(rbac_app, email)
+async def test_revoke_role(rbac_client, rbac_app, admin):
+    token, user = admin
 
-    _, role_adapter, user_adapter = rbac_app
+    _, role_adapter, _ = rbac_app
     await role_adapter.create_role("editor")
-    user = await user_adapter.get_user_by_email(email)
     await role_adapter.assign_role(user["id"], "editor")
 
     resp = await rbac_client.post(
@@ -181,9 +184,8 @@ async def test_revoke_role(rbac_client, rbac_app):
     assert resp.json()["message"] == "Role revoked"
 
 
-async def test_get_my_roles(rbac_client, rbac_app):
-    token, email = await _register_and_login(rbac_client)
-    await _make_admin(rbac_app, email)
+async def test_get_my_roles(rbac_client, admin):
+    token, _ = admin
 
     resp = await rbac_client.get(
         "/auth/roles/me",
@@ -194,9 +196,8 @@ async def test_get_my_roles(rbac_client, rbac_app):
     assert "admin" in data["roles"]
 
 
-async def test_add_permissions(rbac_client, rbac_app):
-    token, email = await _register_and_login(rbac_client)
-    await _make_admin(rbac_app, email)
+async def test_add_permissions(rbac_client, rbac_app, admin):
+    token, _ = admin
 
     _, role_adapter, _ = rbac_app
     await role_adapter.create_role("editor", ["posts:read"])
@@ -212,9 +213,8 @@ async def test_add_permissions(rbac_client, rbac_app):
     assert "posts:write" in role["permissions"]
 
 
-async def test_remove_permissions(rbac_client, rbac_app):
-    token, email = await _register_and_login(rbac_client)
-    await _make_admin(rbac_app, email)
+async def test_remove_permissions(rbac_client, rbac_app, admin):
+    token, _ = admin
 
     _, role_adapter, _ = rbac_app
     await role_adapter.create_role("editor", ["posts:read", "posts:write"])
@@ -233,41 +233,40 @@ async def test_remove_permissions(rbac_client, rbac_app):
     assert "posts:read" in role["permissions"]
 
 
-async def test_unauthenticated(rbac_client):
-    resp = await rbac_client.get("/auth/roles")
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [
+        ("GET", "/auth/roles"),
+        ("GET", "/auth/roles/me"),
+        ("GET", "/auth/roles/user/some-user-id"),
+        ("DELETE", "/auth/roles/editor"),
+    ],
+    ids=["list", "me", "user-roles", "delete"],
+)
+async def test_unauthenticated(rbac_client, method, path):
+    resp = await rbac_client.request(method, path)
     assert resp.status_code == 401
 
 
-@pytest.fixture
-def permission_app():
+def _build_permission_app() -> _App:
     """App with RBAC configured + routes using require_permission."""
-    adapter = MemoryUserAdapter()
-    role_adapter = MemoryRoleAdapter()
-    config = FastAuthConfig(
-        secret="this-is-a-test-secret-32-bytes!!",
-        providers=[CredentialsProvider()],
-        adapter=adapter,
-        jwt=JWTConfig(algorithm="HS256"),
-    )
-    auth = FastAuth(config)
-    auth.role_adapter = role_adapter
+    built = _mount(MemoryRoleAdapter())
 
-    _app = FastAPI()
-    auth.mount(_app)
-
-    @_app.get("/need-perm")
+    @built.app.get("/need-perm")
     async def need_perm(user=Depends(require_permission("posts:write"))):
         return {"ok": True}
 
-    return _app, role_adapter, adapter
+    return built
 
 
 @pytest.fixture
-async def perm_client(permission_app):
-    _app, _, _ = permission_app
-    transport = ASGITransport(app=_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def permission_app(shared):
+    return shared(_build_permission_app)
+
+
+@pytest.fixture
+def perm_client(shared, permission_app):
+    return shared(permission_app.app)
 
 
 async def _register_login_perm(client: AsyncClient, email: str = "perm@example.com"):
@@ -308,37 +307,29 @@ async def test_require_permission_unauthenticated(perm_client):
     assert resp.status_code == 401
 
 
-@pytest.fixture
-def no_rbac_app():
+def _build_no_rbac_app() -> _App:
     """App without RBAC configured but using require_role."""
-    adapter = MemoryUserAdapter()
-    config = FastAuthConfig(
-        secret="this-is-a-test-secret-32-bytes!!",
-        providers=[CredentialsProvider()],
-        adapter=adapter,
-        jwt=JWTConfig(algorithm="HS256"),
-    )
-    auth = FastAuth(config)
-
-    _app = FastAPI()
-    auth.mount(_app)
+    built = _mount(None)
 
-    @_app.get("/need-role")
+    @built.app.get("/need-role")
     async def need_role(user=Depends(require_role("admin"))):
         return {"ok": True}
 
-    @_app.get("/need-perm")
+    @built.app.get("/need-perm")
     async def need_perm(user=Depends(require_permission("admin:write"))):
         return {"ok": True}
 
-    return _app
+    return built
+
+
+@pytest.fixture
+def no_rbac_app(shared):
+    return shared(_build_no_rbac_app)
 
 
 @pytest.fixture
-async def no_rbac_client(no_rbac_app):
-    transport = ASGITransport(app=no_rbac_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def no_rbac_client(shared, no_rbac_app):
+    return shared(no_rbac_app.app)
 
 
 async def test_require_role_no_rbac_configured(no_rbac_client):
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from fastauth import FastAuth
 from fastauth.adapters.memory import (
@@ -8,47 +9,81 @@ from fastauth.adapters.memory import (
     MemoryUserAdapter,
 )
 from fastauth.config import FastAuthConfig, JWTConfig
+from fastauth.core.tokens import create_access_token
 from fastauth.providers.credentials import CredentialsProvider
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
 
-def _make_app_without_session_adapter():
+@pytest_asyncio.fixture(scope="module")
+async def _baseline_users():
     adapter = MemoryUserAdapter()
-    config = FastAuthConfig(
+    user = await adapter.create_user(email="user@example.com", name="Test User")
+    return adapter, user
+
+
+@pytest.fixture
+def session_user(_baseline_users):
+    return _baseline_users[1]
+
+
+@pytest.fixture(scope="module")
+def session_adapter():
+    return MemorySessionAdapter()
+
+
+@pytest.fixture(scope="module")
+def session_config(_baseline_users):
+    return FastAuthConfig(
         secret="this-is-a-test-secret-32-bytes!!",
         providers=[CredentialsProvider()],
-        adapter=adapter,
+        adapter=_baseline_users[0],
         jwt=JWTConfig(algorithm="HS256"),
     )
-    auth = FastAuth(config)
+
+
+@pytest.fixture(scope="module")
+def session_app(session_config, session_adapter):
+    auth = FastAuth(session_config)
+    auth.session_adapter = session_adapter
+
     app = FastAPI()
     auth.mount(app)
-    return app, auth
+    return app
 
 
 @pytest.fixture
-def session_app():
-    adapter = MemoryUserAdapter()
-    session_adapter = MemorySessionAdapter()
+def session_client(shared, session_app):
+    return shared(session_app)
+
+
+@pytest.fixture(scope="module")
+def no_session_user_adapter():
+    return MemoryUserAdapter()
+
+
+@pytest.fixture(scope="module")
+def no_session_app(no_session_user_adapter):
     config = FastAuthConfig(
         secret="this-is-a-test-secret-32-bytes!!",
         providers=[CredentialsProvider()],
-        adapter=adapter,
+        adapter=no_session_user_adapter,
         jwt=JWTConfig(algorithm="HS256"),
     )
     auth = FastAuth(config)
-    auth.session_adapter = session_adapter
-
     app = FastAPI()
     auth.mount(app)
     return app
 
 
 @pytest.fixture
-async def session_client(session_app):
-    transport = ASGITransport(app=session_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def no_session_client(shared, no_session_app):
+    return shared(no_session_app)
+
+
+@pytest.fixture(autouse=True)
+def _reset_state(session_adapter, no_session_user_adapter):
+    session_adapter.clear()
+    no_session_user_adapter.clear()
 
 
 async def _register_and_login(client: AsyncClient) -> str:
@@ -67,8 +102,17 @@ async def _register_and_login(client: AsyncClient) -> str:
     return resp.json()["access_token"]
 
 
-async def test_list_sessions(session_client):
-    token = await _register_and_login(session_client)
+@pytest.fixture
+def token(session_config, session_user):
+    return create_access_token(session_user, session_config)
+
+
+@pytest.fixture
+def user_id(session_user):
+    return session_user["id"]
+
+
+async def test_list_sessions(session_client, token):
     resp = await session_client.get(
         "/auth/sessions",
         headers={"Authorization": f"Bearer {token}"},
@@ -77,18 +121,11 @@ async def test_list_sessions(session_client):
     assert resp.json() == []
 
 
-async def test_list_sessions_unauthenticated(session_client):
-    resp = await session_client.get("/auth/sessions")
-    assert resp.status_code == 401
-
-
-async def test_revoke_session(session_client, session_app):
-    token = await _register_and_login(session_client)
-    user = await _user_id_from_token(session_app, token)
-    await session_app.state.fastauth.session_adapter.create_session(
+async def test_revoke_session(session_client, session_adapter, token, user_id):
+    await session_adapter.create_session(
         {
             "id": "owned-session",
-            "user_id": user,
+            "user_id": user_id,
             "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
             "ip_address": None,
             "user_agent": None,
@@ -102,13 +139,13 @@ async def test_revoke_session(session_client, session_app):
     assert resp.json()["message"] == "Session revoked"
 
 
-async def test_revoke_session_not_owned_returns_404(session_client, session_app):
-    token = await _register_and_login(session_client)
-    user = await _user_id_from_token(session_app, token)
-    await session_app.state.fastauth.session_adapter.create_session(
+async def test_revoke_session_not_owned_returns_404(
+    session_client, session_adapter, token, user_id
+):
+    await session_adapter.create_session(
         {
             "id": "other-session",
-            "user_id": f"not-{user}",
+            "user_id": f"not-{user_id}",
             "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
             "ip_address": None,
             "user_agent": None,
@@ -121,8 +158,7 @@ async def test_revoke_session_not_owned_returns_404(session_client, session_app)
     assert resp.status_code == 404
 
 
-async def test_revoke_session_missing_returns_404(session_client):
-    token = await _register_and_login(session_client)
+async def test_revoke_session_missing_returns_404(session_client, token):
     resp = await session_client.delete(
         "/auth/sessions/does-not-exist",
         headers={"Authorization": f"Bearer {token}"},
@@ -130,22 +166,7 @@ async def test_revoke_session_missing_returns_404(session_client):
     assert resp.status_code == 404
 
 
-async def _user_id_from_token(app, token: str) -> str:
-    from fastauth.core.tokens import decode_token
-
-    claims = decode_token(
-        token, app.state.fastauth.config, app.state.fastauth.jwks_manager
-    )
-    return claims["sub"]
-
-
-async def test_revoke_session_unauthenticated(session_client):
-    resp = await session_client.delete("/auth/sessions/some-session-id")
-    assert resp.status_code == 401
-
-
-async def test_revoke_all_sessions(session_client):
-    token = await _register_and_login(session_client)
+async def test_revoke_all_sessions(session_client, token):
     resp = await session_client.delete(
         "/auth/sessions/all",
         headers={"Authorization": f"Bearer {token}"},
@@ -154,39 +175,32 @@ async def test_revoke_all_sessions(session_client):
     assert resp.json()["message"] == "All sessions revoked"
 
 
-async def test_revoke_all_sessions_unauthenticated(session_client):
-    resp = await session_client.delete("/auth/sessions/all")
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [
+        ("GET", "/auth/sessions"),
+        ("DELETE", "/auth/sessions/some-session-id"),
+        ("DELETE", "/auth/sessions/all"),
+    ],
+    ids=["list", "revoke", "revoke-all"],
+)
+async def test_unauthenticated(session_client, method, path):
+    resp = await session_client.request(method, path)
     assert resp.status_code == 401
 
 
-async def test_list_sessions_no_adapter():
-    app, auth = _make_app_without_session_adapter()
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        token = await _register_and_login(c)
-        resp = await c.get(
-            "/auth/sessions", headers={"Authorization": f"Bearer {token}"}
-        )
-        assert resp.status_code == 400
-
-
-async def test_revoke_session_no_adapter():
-    app, auth = _make_app_without_session_adapter()
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        token = await _register_and_login(c)
-        resp = await c.delete(
-            "/auth/sessions/abc", headers={"Authorization": f"Bearer {token}"}
-        )
-        assert resp.status_code == 400
-
-
-async def test_revoke_all_sessions_no_adapter():
-    app, auth = _make_app_without_session_adapter()
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        token = await _register_and_login(c)
-        resp = await c.delete(
-            "/auth/sessions/all", headers={"Authorization": f"Bearer {token}"}
-        )
-        assert resp.status_code == 400
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [
+        ("GET", "/auth/sessions"),
+        ("DELETE", "/auth/sessions/abc"),
+        ("DELETE", "/auth/sessions/all"),
+    ],
+    ids=["list", "revoke", "revoke-all"],
+)
+async def test_no_session_adapter_returns_400(no_session_client, method, path):
+    token = await _register_and_login(no_session_client)
+    resp = await no_session_client.request(
+        method, path, headers={"Authorization": f"Bearer {token}"}
+    )
+    assert resp.status_code == 400
@@ -1,3 +1,5 @@
+from unittest.mock import AsyncMock, patch
+
 from fastapi import FastAPI
 from fastauth import FastAuth
 from fastauth.adapters.memory import (
@@ -6,7 +8,9 @@ from fastauth.adapters.memory import (
     MemoryUserAdapter,
 )
 from fastauth.config import FastAuthConfig, JWTConfig
+from fastauth.core.tokens import create_access_token, decode_token
 from fastauth.providers.credentials import CredentialsProvider
+from fastauth.providers.google import GoogleProvider
 from fastauth.providers.magic_links import MagicLinksProvider
 from httpx import ASGITransport, AsyncClient
 
@@ -72,15 +76,23 @@ async def test_initialize_roles_idempotent():
     assert len([r for r in roles if r["name"] == "admin"]) == 1
 
 
-async def test_jwks_route_registered_when_mount_called_before_initialize_jwks():
+async def test_jwks_route_registered_when_mount_called_before_initialize_jwks(
+    rsa_pem_keys,
+):
     """The bug: mount() checked self.jwks_manager (None at mount time).
     Fix: mount() checks config.jwt.jwks_enabled so the route is always
     registered when enabled, regardless of initialization order."""
+    private_key, public_key = rsa_pem_keys
     config = FastAuthConfig(
         secret="not-used-for-rs256",
         providers=[CredentialsProvider()],
         adapter=MemoryUserAdapter(),
-        jwt=JWTConfig(algorithm="RS256", jwks_enabled=True),
+        jwt=JWTConfig(
+            algorithm="RS256",
+            jwks_enabled=True,
+            private_key=private_key,
+            public_key=public_key,
+        ),
     )
     auth = FastAuth(config)
     app = FastAPI()
@@ -309,3 +321,63 @@ async def test_magic_link_signup_assigns_default_role():
     assert user is not None
     roles = await role_adapter.get_user_roles(user["id"])
     assert "member" in roles
+
+
+async def test_verified_token_cache_skips_repeat_decode():
+    config = _make_config(
+        jwt=JWTConfig(algorithm="HS256", verified_token_cache_size=16)
+    )
+    auth = FastAuth(config)
+    app = FastAPI()
+    auth.mount(app)
+    user = await config.adapter.create_user("cached@example.com")
+    headers = {"Authorization": f"Bearer {create_access_token(user, config)}"}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        with patch("fastauth.api.deps.decode_token", wraps=decode_token) as spy:
+            first = await c.get("/auth/me", headers=headers)
+            second = await c.get("/auth/me", headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert spy.call_count == 1
+
+
+def test_verified_token_cache_disabled_by_default():
+    assert FastAuth(_make_config()).token_cache is None
+
+
+def test_email_template_auto_reload_passed_to_dispatcher():
+    auth = FastAuth(
+        _make_config(email_transport=AsyncMock(), email_template_auto_reload=True)
+    )
+    assert auth.email_dispatcher._env.auto_reload is True
+
+
+async def test_shutdown_closes_email_transport():
+    transport = AsyncMock()
+    auth = FastAuth(_make_config(email_transport=transport))
+
+    await auth.shutdown()
+
+    transport.close.assert_awaited_once()
+
+
+async def test_shutdown_closes_providers():
+    provider = GoogleProvider(client_id="id", client_secret="secret")
+    auth = FastAuth(
+        FastAuthConfig(
+            secret="this-is-a-test-secret-32-bytes!!",
+            providers=[CredentialsProvider(), provider],
+            adapter=MemoryUserAdapter(),
+        )
+    )
+
+    with patch.object(provider, "close", AsyncMock()) as close:
+        await auth.shutdown()
+
+    close.assert_awaited_once()
+
+
+async def test_shutdown_without_email_transport():
+    await FastAuth(_make_config()).shutdown()
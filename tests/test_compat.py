@@ -11,6 +11,16 @@ def test_has_package_missing():
     assert _has_package("nonexistent_package_xyz_abc_123") is False
 
 
+def test_has_package_cached():
+    _has_package.cache_clear()
+    _has_package("nonexistent_package_xyz_abc_123")
+    _has_package("nonexistent_package_xyz_abc_123")
+
+    info = _has_package.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
 def test_require_existing_does_not_raise():
     require("sys", "test")
 
@@ -18,6 +18,11 @@ def _make(**kwargs: Any) -> FastAuthConfig:
     return FastAuthConfig(**defaults)
 
 
+@pytest.fixture(scope="module")
+def default_config() -> FastAuthConfig:
+    return _make()
+
+
 def test_empty_secret_raises():
     with pytest.raises(ConfigError, match="secret"):
         _make(secret="")
@@ -94,33 +99,28 @@ def test_effective_cookie_secure_explicit_true():
     assert config.effective_cookie_secure is True
 
 
-def test_token_delivery_default():
-    config = _make()
-    assert config.token_delivery == "json"
+def test_token_delivery_default(default_config):
+    assert default_config.token_delivery == "json"
 
 
-def test_cookie_name_defaults():
-    config = _make()
-    assert config.cookie_name_access == "access_token"
-    assert config.cookie_name_refresh == "refresh_token"
+def test_cookie_name_defaults(default_config):
+    assert default_config.cookie_name_access == "access_token"
+    assert default_config.cookie_name_refresh == "refresh_token"
 
 
-def test_cookie_defaults():
-    config = _make()
-    assert config.cookie_httponly is True
-    assert config.cookie_samesite == "lax"
-    assert config.cookie_domain is None
-    assert config.cookie_secure is None
+def test_cookie_defaults(default_config):
+    assert default_config.cookie_httponly is True
+    assert default_config.cookie_samesite == "lax"
+    assert default_config.cookie_domain is None
+    assert default_config.cookie_secure is None
 
 
-def test_csrf_defaults():
-    config = _make()
-    assert config.csrf_enabled is True
-    assert config.csrf_cookie_name == "csrf_token"
-    assert config.csrf_header_name == "X-CSRF-Token"
+def test_csrf_defaults(default_config):
+    assert default_config.csrf_enabled is True
+    assert default_config.csrf_cookie_name == "csrf_token"
+    assert default_config.csrf_header_name == "X-CSRF-Token"
 
 
-def test_valid_config_ok():
-    config = _make()
-    assert config.secret == "this-is-a-test-secret-32-bytes!!"
-    assert len(config.providers) == 1
+def test_valid_config_ok(default_config):
+    assert default_config.secret == "this-is-a-test-secret-32-bytes!!"
+    assert len(default_config.providers) == 1
@@ -2,27 +2,27 @@ import pytest
 from fastauth.config import PasswordConfig
 from fastauth.core.credentials import hash_password, validate_password, verify_password
 
+pytestmark = pytest.mark.real_hashing
 
-def test_hash_and_verify_password():
-    password = "mysecretpassword"
-    hashed_password = hash_password(password)
+_PASSWORD = "mysecretpassword"
 
-    assert verify_password(password, hashed_password) is True
 
+@pytest.fixture(scope="module")
+def stored_hash() -> str:
+    # One real Argon2 hash shared by the tests that only check verification.
+    return hash_password(_PASSWORD)
 
-def test_verify_wrong_password():
-    hashed_password = hash_password("correct")
 
-    assert verify_password("wrong", hashed_password) is False
+def test_hash_and_verify_password(stored_hash):
+    assert verify_password(_PASSWORD, stored_hash) is True
 
 
-def test_hash_produces_different_hashes():
-    password = "mysecretpassword"
+def test_verify_wrong_password(stored_hash):
+    assert verify_password("wrong", stored_hash) is False
 
-    hash_1 = hash_password(password)
-    hash_2 = hash_password(password)
 
-    assert not hash_1 == hash_2
+def test_hash_produces_different_hashes(stored_hash):
+    assert hash_password(_PASSWORD) != stored_hash
 
 
 class TestValidatePassword:
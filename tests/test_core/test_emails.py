@@ -1,3 +1,4 @@
+import os
 import textwrap
 from unittest.mock import AsyncMock
 
@@ -6,13 +7,12 @@ import pytest
 jinja2 = pytest.importorskip("jinja2")
 
 from fastauth.core.emails import EmailDispatcher  # noqa: E402
+from fastauth.core.protocols import EmailTransport  # noqa: E402
 
 
 @pytest.fixture
 def mock_transport():
-    transport = AsyncMock()
-    transport.send = AsyncMock()
-    return transport
+    return AsyncMock(spec=EmailTransport)
 
 
 @pytest.fixture
@@ -110,3 +110,34 @@ async def test_noop_when_no_transport(user):
     await dispatcher.send_welcome_email(user)
     await dispatcher.send_email_change_email(user, "new@example.com", "tok", 30)
     await dispatcher.send_magic_link_login_request(user, "tok")
+
+
+async def test_template_compiled_once_per_dispatcher(dispatcher, user):
+    await dispatcher.send_welcome_email(user)
+    template = dispatcher._env.get_template("welcome.jinja2")
+    await dispatcher.send_welcome_email(user)
+    assert dispatcher._env.get_template("welcome.jinja2") is template
+    assert dispatcher._env.auto_reload is False
+
+
+async def test_auto_reload_picks_up_template_edits(mock_transport, user, tmp_path):
+    custom = tmp_path / "welcome.jinja2"
+    custom.write_text("<p>FIRST</p>")
+    dispatcher = EmailDispatcher(
+        transport=mock_transport,
+        base_url="http://localhost:8000",
+        template_dir=tmp_path,
+        auto_reload=True,
+    )
+    await dispatcher.send_welcome_email(user)
+    custom.write_text("<p>SECOND</p>")
+    stat = custom.stat()
+    os.utime(custom, (stat.st_atime, stat.st_mtime + 10))
+    await dispatcher.send_welcome_email(user)
+    assert "SECOND" in mock_transport.send.call_args.kwargs["body_html"]
+
+
+def test_template_environment_not_shared_between_dispatchers(mock_transport):
+    first = EmailDispatcher(transport=mock_transport, base_url="http://a")
+    second = EmailDispatcher(transport=mock_transport, base_url="http://b")
+    assert first._env is not second._env
@@ -1,9 +1,25 @@
 import time
 
+import pytest_asyncio
 from fastauth.config import JWTConfig
 from fastauth.core.jwks import JWKSManager
 
 
+def _pem_config(rsa_pem_keys, **kwargs) -> JWTConfig:
+    private_key, public_key = rsa_pem_keys
+    return JWTConfig(
+        algorithm="RS256", private_key=private_key, public_key=public_key, **kwargs
+    )
+
+
+@pytest_asyncio.fixture(scope="module")
+async def pem_manager(rsa_pem_keys):
+    # Read-only tests share one manager; anything that rotates builds its own.
+    manager = JWKSManager(_pem_config(rsa_pem_keys))
+    await manager.initialize()
+    return manager
+
+
 async def test_initialize_generates_key():
     config = JWTConfig(algorithm="RS256")
     manager = JWKSManager(config)
@@ -13,13 +29,8 @@ async def test_initialize_generates_key():
     assert len(manager._keys) == 1
 
 
-async def test_initialize_with_pem_keys():
-    from joserfc.jwk import RSAKey
-
-    key = RSAKey.generate_key(2048)
-    private_pem = key.as_pem(private=True).decode()
-    public_pem = key.as_pem(private=False).decode()
-
+async def test_initialize_with_pem_keys(rsa_pem_keys):
+    private_pem, public_pem = rsa_pem_keys
     config = JWTConfig(
         algorithm="RS256",
         private_key=private_pem,
@@ -32,8 +43,8 @@ async def test_initialize_with_pem_keys():
     assert len(manager._keys) == 1
 
 
-async def test_rotate_creates_new_key():
-    config = JWTConfig(algorithm="RS256")
+async def test_rotate_adds_verification_key(rsa_pem_keys):
+    config = _pem_config(rsa_pem_keys)
     manager = JWKSManager(config)
     await manager.initialize()
     first_kid = manager._current_kid
@@ -42,33 +53,31 @@ async def test_rotate_creates_new_key():
 
     assert manager._current_kid != first_kid
     assert len(manager._keys) == 2
+    assert len(manager.get_verification_keys()) == 2
+    jwks = manager.get_jwks()
+    assert len(jwks["keys"]) == 2
+    assert {k["kid"] for k in jwks["keys"]} == {first_kid, manager._current_kid}
 
 
-async def test_get_signing_key():
-    config = JWTConfig(algorithm="RS256")
-    manager = JWKSManager(config)
-    await manager.initialize()
-
-    key = manager.get_signing_key()
+async def test_get_signing_key(pem_manager):
+    key = pem_manager.get_signing_key()
     assert key is not None
-    assert key.kid == manager._current_kid
+    assert key.kid == pem_manager._current_kid
 
 
-async def test_get_signing_kid():
-    config = JWTConfig(algorithm="RS256")
-    manager = JWKSManager(config)
-    await manager.initialize()
+async def test_get_signing_kid(pem_manager):
+    kid = pem_manager.get_signing_kid()
+    assert kid == pem_manager._current_kid
 
-    kid = manager.get_signing_kid()
-    assert kid == manager._current_kid
 
+async def test_get_verification_key_by_kid(pem_manager):
+    kid = pem_manager.get_signing_kid()
+    assert pem_manager.get_verification_key(kid) is pem_manager.get_signing_key()
+    assert pem_manager.get_verification_key("unknown") is None
 
-async def test_get_jwks_format():
-    config = JWTConfig(algorithm="RS256")
-    manager = JWKSManager(config)
-    await manager.initialize()
 
-    jwks = manager.get_jwks()
+async def test_get_jwks_format(pem_manager):
+    jwks = pem_manager.get_jwks()
     assert "keys" in jwks
     assert len(jwks["keys"]) == 1
 
@@ -86,30 +95,8 @@ async def test_get_jwks_format():
     assert "q" not in pub_key
 
 
-async def test_get_jwks_after_rotation():
-    config = JWTConfig(algorithm="RS256")
-    manager = JWKSManager(config)
-    await manager.initialize()
-    await manager.rotate()
-
-    jwks = manager.get_jwks()
-    assert len(jwks["keys"]) == 2
-    kids = {k["kid"] for k in jwks["keys"]}
-    assert len(kids) == 2
-
-
-async def test_get_verification_keys():
-    config = JWTConfig(algorithm="RS256")
-    manager = JWKSManager(config)
-    await manager.initialize()
-    await manager.rotate()
-
-    keys = manager.get_verification_keys()
-    assert len(keys) == 2
-
-
-async def test_prune_old_keys():
-    config = JWTConfig(algorithm="RS256", key_rotation_interval=3600)
+async def test_prune_old_keys(rsa_pem_keys):
+    config = _pem_config(rsa_pem_keys, key_rotation_interval=3600)
     manager = JWKSManager(config)
     await manager.initialize()
 
@@ -120,10 +107,11 @@ async def test_prune_old_keys():
 
     assert len(manager._keys) == 1
     assert manager._keys[0][1] == manager._current_kid
+    assert manager.get_verification_key(old_kid) is None
 
 
-async def test_prune_keeps_recent_keys():
-    config = JWTConfig(algorithm="RS256", key_rotation_interval=3600)
+async def test_prune_keeps_recent_keys(rsa_pem_keys):
+    config = _pem_config(rsa_pem_keys, key_rotation_interval=3600)
     manager = JWKSManager(config)
     await manager.initialize()
 
@@ -4,6 +4,7 @@ from fastauth.adapters.memory import (
     MemoryUserAdapter,
 )
 from fastauth.core.oauth import (
+    _code_challenge,
     complete_oauth_flow,
     initiate_oauth_flow,
     link_oauth_account,
@@ -12,6 +13,15 @@ from fastauth.exceptions import ProviderError
 from fastauth.session_backends.memory import MemorySessionBackend
 from fastauth.types import UserData
 
+DEFAULT_USER_INFO: UserData = {
+    "id": "provider-uid-1",
+    "email": "oauth@example.com",
+    "name": "OAuth User",
+    "image": None,
+    "email_verified": True,
+    "is_active": True,
+}
+
 
 class FakeOAuthProvider:
     id = "fake"
@@ -19,14 +29,7 @@ class FakeOAuthProvider:
     auth_type = "oauth"
 
     def __init__(self, user_info: UserData | None = None) -> None:
-        self._user_info = user_info or {
-            "id": "provider-uid-1",
-            "email": "oauth@example.com",
-            "name": "OAuth User",
-            "image": None,
-            "email_verified": True,
-            "is_active": True,
-        }
+        self._user_info = user_info or DEFAULT_USER_INFO
         self.last_auth_url_kwargs: dict = {}
 
     async def get_authorization_url(
@@ -46,18 +49,18 @@ class FakeOAuthProvider:
 
 
 @pytest.fixture
-def state_store():
-    return MemorySessionBackend()
+def state_store(shared):
+    return shared(MemorySessionBackend)
 
 
 @pytest.fixture
-def user_adapter():
-    return MemoryUserAdapter()
+def user_adapter(shared):
+    return shared(MemoryUserAdapter)
 
 
 @pytest.fixture
-def oauth_adapter():
-    return MemoryOAuthAccountAdapter()
+def oauth_adapter(shared):
+    return shared(MemoryOAuthAccountAdapter)
 
 
 @pytest.fixture
@@ -65,6 +68,11 @@ def provider():
     return FakeOAuthProvider()
 
 
+@pytest.fixture
+def unverified_provider():
+    return FakeOAuthProvider({**DEFAULT_USER_INFO, "email_verified": False})
+
+
 async def test_initiate_stores_state(provider, state_store):
     url, state = await initiate_oauth_flow(
         provider=provider,
@@ -81,15 +89,23 @@ async def test_initiate_stores_state(provider, state_store):
 
 
 async def test_initiate_passes_pkce(provider, state_store):
-    await initiate_oauth_flow(
+    _, state = await initiate_oauth_flow(
         provider=provider,
         redirect_uri="http://localhost/callback",
         state_store=state_store,
     )
-    assert "code_challenge" in provider.last_auth_url_kwargs
+    stored = await state_store.read(f"oauth_state:{state}")
+    assert provider.last_auth_url_kwargs["code_challenge"] == _code_challenge(
+        stored["code_verifier"]
+    )
     assert provider.last_auth_url_kwargs["code_challenge_method"] == "S256"
 
 
+def test_code_challenge_matches_rfc7636_example():
+    verifier = "dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk"
+    assert _code_challenge(verifier) == "E9Melhoa2OwvFrEMTJguCHaoeK1t8URWbuGJSstw-cM"
+
+
 async def test_complete_new_user(provider, state_store, user_adapter, oauth_adapter):
     _, state = await initiate_oauth_flow(
         provider=provider,
@@ -118,26 +134,16 @@ async def test_complete_new_user(provider, state_store, user_adapter, oauth_adap
 
 
 async def test_complete_new_user_with_unverified_email(
-    state_store, user_adapter, oauth_adapter
+    unverified_provider, state_store, user_adapter, oauth_adapter
 ):
-    provider = FakeOAuthProvider(
-        {
-            "id": "provider-uid-1",
-            "email": "oauth@example.com",
-            "name": "OAuth User",
-            "image": None,
-            "email_verified": False,
-            "is_active": True,
-        }
-    )
     _, state = await initiate_oauth_flow(
-        provider=provider,
+        provider=unverified_provider,
         redirect_uri="http://localhost/callback",
         state_store=state_store,
     )
 
     user, is_new, email_verified_now = await complete_oauth_flow(
-        provider=provider,
+        provider=unverified_provider,
         code="auth-code",
         state=state,
         redirect_uri="http://localhost/callback",
@@ -151,33 +157,35 @@ async def test_complete_new_user_with_unverified_email(
     assert user["email_verified"] is False
 
 
-async def test_complete_existing_oauth_account(
-    provider, state_store, user_adapter, oauth_adapter
-):
-    _, state1 = await initiate_oauth_flow(
-        provider=provider,
-        redirect_uri="http://localhost/callback",
-        state_store=state_store,
-    )
-    user1, _, _ = await complete_oauth_flow(
-        provider=provider,
-        code="code1",
-        state=state1,
-        redirect_uri="http://localhost/callback",
-        state_store=state_store,
-        user_adapter=user_adapter,
-        oauth_adapter=oauth_adapter,
+@pytest.fixture
+async def linked_user(user_adapter, oauth_adapter):
+    """A user already linked to the fake provider's account."""
+    user = await user_adapter.create_user(email="oauth@example.com")
+    await oauth_adapter.create_oauth_account(
+        {
+            "provider": "fake",
+            "provider_account_id": "provider-uid-1",
+            "user_id": user["id"],
+            "access_token": None,
+            "refresh_token": None,
+            "expires_at": None,
+        }
     )
+    return user
+
 
-    _, state2 = await initiate_oauth_flow(
+async def test_complete_existing_oauth_account(
+    provider, state_store, user_adapter, oauth_adapter, linked_user
+):
+    _, state = await initiate_oauth_flow(
         provider=provider,
         redirect_uri="http://localhost/callback",
         state_store=state_store,
     )
-    user2, is_new, _ = await complete_oauth_flow(
+    user, is_new, _ = await complete_oauth_flow(
         provider=provider,
-        code="code2",
-        state=state2,
+        code="auth-code",
+        state=state,
         redirect_uri="http://localhost/callback",
         state_store=state_store,
         user_adapter=user_adapter,
@@ -185,41 +193,19 @@ async def test_complete_existing_oauth_account(
     )
 
     assert is_new is False
-    assert user2["id"] == user1["id"]
+    assert user["id"] == linked_user["id"]
 
 
 async def test_complete_existing_oauth_account_does_not_verify_unverified_email(
-    state_store, user_adapter, oauth_adapter
+    unverified_provider, state_store, user_adapter, oauth_adapter, linked_user
 ):
-    provider = FakeOAuthProvider(
-        {
-            "id": "provider-uid-1",
-            "email": "oauth@example.com",
-            "name": "OAuth User",
-            "image": None,
-            "email_verified": False,
-            "is_active": True,
-        }
-    )
-    user = await user_adapter.create_user(email="oauth@example.com")
-    await oauth_adapter.create_oauth_account(
-        {
-            "provider": "fake",
-            "provider_account_id": "provider-uid-1",
-            "user_id": user["id"],
-            "access_token": None,
-            "refresh_token": None,
-            "expires_at": None,
-        }
-    )
-
     _, state = await initiate_oauth_flow(
-        provider=provider,
+        provider=unverified_provider,
         redirect_uri="http://localhost/callback",
         state_store=state_store,
     )
     user, is_new, email_verified_now = await complete_oauth_flow(
-        provider=provider,
+        provider=unverified_provider,
         code="auth-code",
         state=state,
         redirect_uri="http://localhost/callback",
@@ -325,31 +311,21 @@ async def test_complete_denied_existing_email_user_has_no_link_or_verification(
 
 
 async def test_complete_rejects_unverified_email_link_to_existing_user(
-    state_store, user_adapter, oauth_adapter
+    unverified_provider, state_store, user_adapter, oauth_adapter
 ):
-    provider = FakeOAuthProvider(
-        {
-            "id": "provider-uid-1",
-            "email": "oauth@example.com",
-            "name": "OAuth User",
-            "image": None,
-            "email_verified": False,
-            "is_active": True,
-        }
-    )
     existing = await user_adapter.create_user(
         email="oauth@example.com", hashed_password="hashed", email_verified=True
     )
 
     _, state = await initiate_oauth_flow(
-        provider=provider,
+        provider=unverified_provider,
         redirect_uri="http://localhost/callback",
         state_store=state_store,
     )
 
     with pytest.raises(ProviderError, match="email is not verified"):
         await complete_oauth_flow(
-            provider=provider,
+            provider=unverified_provider,
             code="auth-code",
             state=state,
             redirect_uri="http://localhost/callback",
@@ -461,10 +437,8 @@ async def test_link_oauth_account_does_not_store_provider_tokens_by_default(
 
 
 async def test_complete_oauth_state_provider_mismatch(
-    state_store, user_adapter, oauth_adapter
+    provider, state_store, user_adapter, oauth_adapter
 ):
-    provider_b = FakeOAuthProvider()
-
     await state_store.write(
         "oauth_state:s1",
         {
@@ -477,7 +451,7 @@ async def test_complete_oauth_state_provider_mismatch(
 
     with pytest.raises(ProviderError, match="provider mismatch"):
         await complete_oauth_flow(
-            provider=provider_b,
+            provider=provider,
             code="code",
             state="s1",
             redirect_uri="http://localhost/callback",
@@ -488,10 +462,8 @@ async def test_complete_oauth_state_provider_mismatch(
 
 
 async def test_complete_oauth_state_missing_redirect_uri(
-    state_store, user_adapter, oauth_adapter
+    provider, state_store, user_adapter, oauth_adapter
 ):
-    provider = FakeOAuthProvider()
-
     await state_store.write(
         "oauth_state:s1",
         {"code_verifier": "v", "provider": "fake"},
@@ -511,10 +483,9 @@ async def test_complete_oauth_state_missing_redirect_uri(
 
 
 async def test_link_oauth_state_provider_mismatch(
-    state_store, user_adapter, oauth_adapter
+    provider, state_store, user_adapter, oauth_adapter
 ):
     user = await user_adapter.create_user(email="link-mismatch@example.com")
-    provider_b = FakeOAuthProvider()
 
     await state_store.write(
         "oauth_state:link-state",
@@ -530,7 +501,7 @@ async def test_link_oauth_state_provider_mismatch(
 
     with pytest.raises(ProviderError, match="provider mismatch"):
         await link_oauth_account(
-            provider=provider_b,
+            provider=provider,
             code="code",
             state="link-state",
             redirect_uri="http://localhost/callback",
@@ -1,3 +1,4 @@
+import pytest
 from fastauth.adapters.memory import MemoryRoleAdapter
 from fastauth.core.rbac import (
     assign_default_role,
@@ -6,17 +7,22 @@ from fastauth.core.rbac import (
     seed_roles,
 )
 
+SEED_ROLES = [
+    {"name": "admin", "permissions": ["users:read", "users:delete"]},
+    {"name": "user", "permissions": ["profile:read"]},
+]
 
-async def test_seed_roles():
+
+@pytest.fixture
+async def seeded_roles():
     adapter = MemoryRoleAdapter()
-    roles = [
-        {"name": "admin", "permissions": ["users:read", "users:delete"]},
-        {"name": "user", "permissions": ["profile:read"]},
-    ]
-    await seed_roles(adapter, roles)
+    await seed_roles(adapter, SEED_ROLES)
+    return adapter
+
 
-    assert await adapter.get_role("admin") is not None
-    assert await adapter.get_role("user") is not None
+async def test_seed_roles(seeded_roles):
+    assert await seeded_roles.get_role("admin") is not None
+    assert await seeded_roles.get_role("user") is not None
 
 
 async def test_seed_roles_no_duplicates():
@@ -29,28 +35,22 @@ async def test_seed_roles_no_duplicates():
     assert role["permissions"] == ["existing:perm"]
 
 
-async def test_assign_default_role():
-    adapter = MemoryRoleAdapter()
-    await adapter.create_role("user")
-    await assign_default_role(adapter, "u1", "user")
+async def test_assign_default_role(seeded_roles):
+    await assign_default_role(seeded_roles, "u1", "user")
 
-    roles = await adapter.get_user_roles("u1")
+    roles = await seeded_roles.get_user_roles("u1")
     assert "user" in roles
 
 
-async def test_check_user_role():
-    adapter = MemoryRoleAdapter()
-    await adapter.create_role("admin")
-    await adapter.assign_role("u1", "admin")
+async def test_check_user_role(seeded_roles):
+    await seeded_roles.assign_role("u1", "admin")
 
-    assert await check_user_role(adapter, "u1", "admin") is True
-    assert await check_user_role(adapter, "u1", "editor") is False
+    assert await check_user_role(seeded_roles, "u1", "admin") is True
+    assert await check_user_role(seeded_roles, "u1", "editor") is False
 
 
-async def test_check_user_permission():
-    adapter = MemoryRoleAdapter()
-    await adapter.create_role("admin", ["users:read", "users:delete"])
-    await adapter.assign_role("u1", "admin")
+async def test_check_user_permission(seeded_roles):
+    await seeded_roles.assign_role("u1", "admin")
 
-    assert await check_user_permission(adapter, "u1", "users:read") is True
-    assert await check_user_permission(adapter, "u1", "posts:write") is False
+    assert await check_user_permission(seeded_roles, "u1", "users:read") is True
+    assert await check_user_permission(seeded_roles, "u1", "posts:write") is False
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from fastauth.config import FastAuthConfig, JWTConfig
 from fastauth.core.tokens import (
@@ -24,15 +26,21 @@ def user() -> UserData:
 
 
 @pytest.fixture
-async def rs256_config():
+async def rs256_config(rsa_pem_keys):
     from fastauth.adapters.memory import MemoryUserAdapter
     from fastauth.providers.credentials import CredentialsProvider
 
+    private_key, public_key = rsa_pem_keys
     return FastAuthConfig(
         secret="unused",
         providers=[CredentialsProvider()],
         adapter=MemoryUserAdapter(),
-        jwt=JWTConfig(algorithm="RS256", jwks_enabled=True),
+        jwt=JWTConfig(
+            algorithm="RS256",
+            jwks_enabled=True,
+            private_key=private_key,
+            public_key=public_key,
+        ),
     )
 
 
@@ -75,6 +83,8 @@ def test_create_token_pair(user, config):
 
     assert access_claims["type"] == "access"
     assert refresh_claims["type"] == "refresh"
+    assert access_claims["iat"] == refresh_claims["iat"]
+    assert access_claims["jti"] != refresh_claims["jti"]
 
 
 def test_decode_expired_token(user, config):
@@ -162,3 +172,82 @@ async def test_rs256_decode_after_rotation(user, rs256_config, jwks_manager):
 
     claims = decode_token(token, rs256_config, jwks_manager)
     assert claims["sub"] == user["id"]
+
+
+async def test_rs256_decode_picks_key_by_kid(user, rs256_config, jwks_manager):
+    from unittest.mock import patch
+
+    await jwks_manager.rotate()
+    token = create_access_token(user, rs256_config, jwks_manager)
+    await jwks_manager.rotate()
+
+    with patch("fastauth.core.tokens.jwt.decode", wraps=jwt_lib.decode) as decode:
+        claims = decode_token(token, rs256_config, jwks_manager)
+    assert claims["sub"] == user["id"]
+    decode.assert_called_once()
+
+
+def test_hmac_key_imported_once_per_secret(config, user):
+    from fastauth.core.tokens import _oct_key
+
+    _oct_key.cache_clear()
+    token = create_access_token(user, config)
+    decode_token(token, config)
+    create_access_token(user, config)
+
+    info = _oct_key.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_claims_registry_built_once_per_shape(config, user):
+    from fastauth.core.tokens import _claims_registry
+
+    _claims_registry.cache_clear()
+    token = create_access_token(user, config)
+    decode_token(token, config)
+    decode_token(token, config)
+
+    info = _claims_registry.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_cached_claims_registry_checks_exp_at_decode_time(config, user):
+    from unittest.mock import patch
+
+    from fastauth.core.tokens import _claims_registry
+
+    _claims_registry.cache_clear()
+    token = create_access_token(user, config)
+    exp = decode_token(token, config)["exp"]
+
+    with patch("time.time", return_value=exp + 60):
+        with pytest.raises(InvalidTokenError):
+            decode_token(token, config)
+    assert _claims_registry.cache_info().hits == 1
+
+
+def test_verified_token_cache_evicts_least_recently_used():
+    from fastauth.core.tokens import VerifiedTokenCache
+
+    cache = VerifiedTokenCache(maxsize=2)
+    exp = int(time.time()) + 60
+    cache.put("a", {"exp": exp})
+    cache.put("b", {"exp": exp})
+    cache.get("a")
+    cache.put("c", {"exp": exp})
+
+    assert cache.get("a") == {"exp": exp}
+    assert cache.get("b") is None
+    assert cache.get("c") == {"exp": exp}
+
+
+def test_verified_token_cache_drops_expired_entries():
+    from fastauth.core.tokens import VerifiedTokenCache
+
+    cache = VerifiedTokenCache(maxsize=2)
+    cache.put("old", {"exp": int(time.time()) - 1})
+
+    assert cache.get("old") is None
+    assert cache._entries == {}
@@ -0,0 +1,63 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from fastauth.email_transports.background import BackgroundTransport
+
+
+@pytest.fixture
+def inner():
+    transport = AsyncMock()
+    transport.send = AsyncMock()
+    return transport
+
+
+async def test_send_returns_before_delivery(inner):
+    release = asyncio.Event()
+
+    async def slow_send(**kwargs):
+        await release.wait()
+
+    inner.send.side_effect = slow_send
+    transport = BackgroundTransport(inner)
+
+    await transport.send(to="a@example.com", subject="Hi", body_html="<p>Hi</p>")
+    assert len(transport._tasks) == 1
+
+    release.set()
+    await transport.drain()
+    assert not transport._tasks
+
+
+async def test_drain_delivers_all(inner):
+    transport = BackgroundTransport(inner)
+    for i in range(3):
+        await transport.send(to=f"r{i}@example.com", subject="Hi", body_html="x")
+    await transport.drain()
+
+    assert inner.send.await_count == 3
+    assert inner.send.call_args.kwargs == {
+        "to": "r2@example.com",
+        "subject": "Hi",
+        "body_html": "x",
+        "body_text": None,
+    }
+
+
+async def test_failures_are_logged_not_raised(inner, caplog):
+    inner.send.side_effect = ConnectionError("down")
+    transport = BackgroundTransport(inner)
+
+    await transport.send(to="a@example.com", subject="Hi", body_html="x")
+    await transport.drain()
+
+    assert "a@example.com" in caplog.text
+
+
+async def test_close_drains_then_closes_inner(inner):
+    transport = BackgroundTransport(inner)
+    await transport.send(to="a@example.com", subject="Hi", body_html="x")
+    await transport.close()
+
+    inner.send.assert_awaited_once()
+    inner.close.assert_awaited_once()
@@ -1,6 +1,8 @@
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiosmtplib import SMTPRecipientsRefused
 from fastauth.email_transports.smtp import SMTPTransport
 
 
@@ -15,64 +17,255 @@ def smtp():
     )
 
 
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.is_connected = True
+    client.connect = AsyncMock()
+    client.send_message = AsyncMock()
+    client.noop = AsyncMock(return_value=MagicMock(code=250))
+    client.quit = AsyncMock()
+    return client
+
+
 @pytest.fixture
-def smtp_no_tls():
-    return SMTPTransport(
+def mock_smtp():
+    clients: list[MagicMock] = []
+
+    def connect(**_):
+        clients.append(_client())
+        return clients[-1]
+
+    with patch("aiosmtplib.SMTP", side_effect=connect) as mock:
+        mock.clients = clients
+        yield mock
+
+
+@pytest.mark.parametrize(
+    ("port", "use_tls", "body_text"),
+    [(587, True, None), (587, True, "Hello"), (25, False, None)],
+    ids=["html-only", "with-plain-text", "no-tls"],
+)
+async def test_send(mock_smtp, port, use_tls, body_text):
+    smtp = SMTPTransport(
         host="smtp.example.com",
-        port=25,
+        port=port,
         username="user@example.com",
         password="secret",
         from_email="noreply@example.com",
-        use_tls=False,
+        use_tls=use_tls,
     )
-
-
-@patch("aiosmtplib.send", new_callable=AsyncMock)
-async def test_send_html_only(mock_send, smtp):
     await smtp.send(
         to="recipient@example.com",
         subject="Hello",
         body_html="<p>Hello</p>",
+        body_text=body_text,
     )
-    mock_send.assert_called_once()
-    kwargs = mock_send.call_args.kwargs
+    mock_smtp.assert_called_once()
+    kwargs = mock_smtp.call_args.kwargs
     assert kwargs["hostname"] == "smtp.example.com"
-    assert kwargs["port"] == 587
+    assert kwargs["port"] == port
     assert kwargs["username"] == "user@example.com"
-    assert kwargs["use_tls"] is True
+    assert kwargs["use_tls"] is use_tls
+    mock_smtp.clients[0].send_message.assert_awaited_once()
+    msg = mock_smtp.clients[0].send_message.call_args.args[0]
+    assert len(msg.get_payload()) == (2 if body_text else 1)
 
 
-@patch("aiosmtplib.send", new_callable=AsyncMock)
-async def test_send_with_plain_text(mock_send, smtp):
+async def test_send_sets_correct_headers(mock_smtp, smtp):
     await smtp.send(
         to="recipient@example.com",
-        subject="Hello",
-        body_html="<p>Hello</p>",
-        body_text="Hello",
+        subject="Subject Line",
+        body_html="<b>body</b>",
     )
-    mock_send.assert_called_once()
+    msg = mock_smtp.clients[0].send_message.call_args.args[0]
+    assert msg["To"] == "recipient@example.com"
+    assert msg["From"] == "noreply@example.com"
+    assert msg["Subject"] == "Subject Line"
 
 
-@patch("aiosmtplib.send", new_callable=AsyncMock)
-async def test_send_no_tls(mock_send, smtp_no_tls):
-    await smtp_no_tls.send(
-        to="recipient@example.com",
-        subject="Test",
-        body_html="<p>Test</p>",
+async def test_connection_reused_across_sends(mock_smtp, smtp):
+    for i in range(5):
+        await smtp.send(to=f"r{i}@example.com", subject="Hi", body_html="<p>Hi</p>")
+    assert mock_smtp.call_count == 1
+    assert mock_smtp.clients[0].send_message.await_count == 5
+
+
+async def test_reconnects_when_noop_fails(mock_smtp, smtp):
+    await smtp.send(to="a@example.com", subject="Hi", body_html="<p>Hi</p>")
+    stale = mock_smtp.clients[0]
+    stale.noop.side_effect = ConnectionError
+    await smtp.send(to="b@example.com", subject="Hi", body_html="<p>Hi</p>")
+    assert mock_smtp.call_count == 2
+    mock_smtp.clients[1].send_message.assert_awaited_once()
+    stale.quit.assert_awaited_once()
+
+
+async def test_reconnects_after_max_messages(mock_smtp):
+    smtp = SMTPTransport(
+        host="smtp.example.com",
+        port=587,
+        username="user@example.com",
+        password="secret",
+        from_email="noreply@example.com",
+        max_messages=2,
     )
-    mock_send.assert_called_once()
-    kwargs = mock_send.call_args.kwargs
-    assert kwargs["use_tls"] is False
+    for i in range(3):
+        await smtp.send(to=f"r{i}@example.com", subject="Hi", body_html="<p>Hi</p>")
+    assert mock_smtp.call_count == 2
 
 
-@patch("aiosmtplib.send", new_callable=AsyncMock)
-async def test_send_sets_correct_headers(mock_send, smtp):
-    await smtp.send(
-        to="recipient@example.com",
-        subject="Subject Line",
-        body_html="<b>body</b>",
+async def test_connection_error_drops_connection(mock_smtp, smtp):
+    await smtp.send(to="a@example.com", subject="Hi", body_html="<p>Hi</p>")
+    mock_smtp.clients[0].send_message.side_effect = ConnectionError
+    with pytest.raises(ConnectionError):
+        await smtp.send(to="b@example.com", subject="Hi", body_html="<p>Hi</p>")
+    mock_smtp.clients[0].close.assert_called_once()
+    assert smtp._idle == []
+
+
+async def test_rejected_message_keeps_connection(mock_smtp, smtp):
+    await smtp.send(to="a@example.com", subject="Hi", body_html="<p>Hi</p>")
+    client = mock_smtp.clients[0]
+    client.send_message.side_effect = [SMTPRecipientsRefused([]), None]
+    with pytest.raises(SMTPRecipientsRefused):
+        await smtp.send(to="bad@example.com", subject="Hi", body_html="<p>Hi</p>")
+    await smtp.send(to="b@example.com", subject="Hi", body_html="<p>Hi</p>")
+    assert mock_smtp.call_count == 1
+    client.close.assert_not_called()
+
+
+async def test_concurrent_sends_share_a_bounded_pool(mock_smtp):
+    smtp = SMTPTransport(
+        host="smtp.example.com",
+        port=587,
+        username="user@example.com",
+        password="secret",
+        from_email="noreply@example.com",
+        max_connections=2,
     )
-    msg = mock_send.call_args.args[0]
-    assert msg["To"] == "recipient@example.com"
-    assert msg["From"] == "noreply@example.com"
-    assert msg["Subject"] == "Subject Line"
+    in_flight = peak = 0
+
+    async def slow_send(_msg):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    def connect(**_):
+        client = _client()
+        client.send_message.side_effect = slow_send
+        return client
+
+    mock_smtp.side_effect = connect
+    await asyncio.gather(
+        *(
+            smtp.send(to=f"r{i}@example.com", subject="Hi", body_html="<p>Hi</p>")
+            for i in range(6)
+        )
+    )
+    assert peak == 2
+    assert mock_smtp.call_count == 2
+
+
+async def test_close(mock_smtp, smtp):
+    await smtp.send(to="a@example.com", subject="Hi", body_html="<p>Hi</p>")
+    await smtp.close()
+    mock_smtp.clients[0].quit.assert_awaited_once()
+    assert smtp._idle == []
+
+
+async def test_send_batch_uses_one_connection(mock_smtp, smtp):
+    items = [(f"r{i}@example.com", "Hi", "<p>Hi</p>") for i in range(10)]
+    results = await smtp.send_batch(items)
+    assert mock_smtp.call_count == 1
+    assert results == [(to, "sent") for to, _, _ in items]
+
+
+async def test_send_batch_reports_failures(mock_smtp, smtp):
+    await smtp.send(to="warmup@example.com", subject="Hi", body_html="<p>Hi</p>")
+    mock_smtp.clients[0].send_message.side_effect = [ConnectionError, None]
+    results = await smtp.send_batch(
+        [
+            ("a@example.com", "Hi", "<p>Hi</p>"),
+            ("b@example.com", "Hi", "<p>Hi</p>"),
+        ]
+    )
+    assert results == [("a@example.com", "failed"), ("b@example.com", "sent")]
+
+
+async def test_send_batch_keeps_connection_after_rejected_recipient(mock_smtp, smtp):
+    await smtp.send(to="warmup@example.com", subject="Hi", body_html="<p>Hi</p>")
+    mock_smtp.clients[0].send_message.side_effect = [SMTPRecipientsRefused([]), None]
+    results = await smtp.send_batch(
+        [
+            ("a@example.com", "Hi", "<p>Hi</p>"),
+            ("b@example.com", "Hi", "<p>Hi</p>"),
+        ]
+    )
+    assert results == [("a@example.com", "failed"), ("b@example.com", "sent")]
+    assert mock_smtp.call_count == 1
+
+
+async def test_send_batch_includes_plain_text_body(mock_smtp, smtp):
+    await smtp.send_batch([("a@example.com", "Hi", "<p>Hi</p>", "Hi")])
+    msg = mock_smtp.clients[0].send_message.call_args[0][0]
+    parts = msg.get_payload()
+    assert [p.get_content_type() for p in parts] == ["text/plain", "text/html"]
+
+
+async def test_send_batch_reports_every_failure_by_default(mock_smtp, smtp):
+    with patch.object(smtp, "_acquire", AsyncMock(side_effect=ConnectionError)):
+        results = await smtp.send_batch(
+            [(f"r{i}@example.com", "Hi", "<p>Hi</p>") for i in range(30)]
+        )
+    assert [status for _, status in results] == ["failed"] * 30
+
+
+async def test_send_batch_stops_after_max_failures(mock_smtp, smtp):
+    with patch.object(smtp, "_acquire", AsyncMock(side_effect=ConnectionError)):
+        results = await smtp.send_batch(
+            [(f"r{i}@example.com", "Hi", "<p>Hi</p>") for i in range(30)],
+            max_failures=10,
+        )
+    statuses = [status for _, status in results]
+    assert statuses.count("failed") == 10
+    assert statuses.count("skipped") == 20
+
+
+def test_pool_is_rebuilt_for_a_new_event_loop(mock_smtp, run_in_new_loop):
+    smtp = SMTPTransport(
+        host="smtp.example.com",
+        port=587,
+        username="user@example.com",
+        password="secret",
+        from_email="noreply@example.com",
+        max_connections=1,
+    )
+
+    async def yielding_send(_msg):
+        await asyncio.sleep(0)
+
+    def connect(**_):
+        client = _client()
+        client.send_message.side_effect = yielding_send
+        mock_smtp.clients.append(client)
+        return client
+
+    mock_smtp.side_effect = connect
+
+    async def send_two():
+        await asyncio.gather(
+            smtp.send(to="a@example.com", subject="Hi", body_html="<p>Hi</p>"),
+            smtp.send(to="b@example.com", subject="Hi", body_html="<p>Hi</p>"),
+        )
+
+    run_in_new_loop(send_two())
+    first = mock_smtp.clients[0]
+    first.close.side_effect = RuntimeError("Event loop is closed")
+    run_in_new_loop(send_two())
+
+    assert mock_smtp.call_count == 2
+    first.close.assert_called_once()
+    first.quit.assert_not_awaited()
+    assert mock_smtp.clients[1].send_message.await_count == 2
@@ -1,17 +1,32 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
+from fastauth.exceptions import ProviderError
 from fastauth.providers.github import GitHubProvider
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def provider():
     return GitHubProvider(
         client_id="test-client-id",
         client_secret="test-client-secret",
+        http_client=AsyncMock(),
     )
 
 
+@pytest.fixture
+def http_client(provider):
+    # The provider is shared across the module; give each test a fresh client.
+    provider._http_client = AsyncMock()
+    return provider._http_client
+
+
+def _response(payload, status_code=200):
+    return SimpleNamespace(status_code=status_code, json=lambda: payload, text="")
+
+
 async def test_authorization_url(provider):
     url = await provider.get_authorization_url(
         state="test-state",
@@ -23,6 +38,22 @@ async def test_authorization_url(provider):
     assert "user%3Aemail" in url or "user:email" in url
 
 
+async def test_authorization_url_params(provider):
+    url = await provider.get_authorization_url(
+        state="test-state", redirect_uri="http://localhost/callback"
+    )
+    parts = urlsplit(url)
+    assert f"{parts.scheme}://{parts.netloc}{parts.path}" == (
+        GitHubProvider.AUTHORIZATION_URL
+    )
+    assert parse_qs(parts.query) == {
+        "client_id": ["test-client-id"],
+        "scope": ["user:email"],
+        "redirect_uri": ["http://localhost/callback"],
+        "state": ["test-state"],
+    }
+
+
 async def test_no_pkce(provider):
     url = await provider.get_authorization_url(
         state="s",
@@ -32,164 +63,198 @@ async def test_no_pkce(provider):
     assert "code_challenge" not in url
 
 
-async def test_exchange_code(provider):
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "access_token": "gh-token",
-        "token_type": "bearer",
-        "scope": "user:email",
-    }
+async def test_authorization_url_follows_client_id_and_scopes(provider):
+    await provider.get_authorization_url(state="s", redirect_uri="http://localhost")
+    provider.client_id = "rotated-id"
+    provider.scopes.append("extra")
 
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        result = await provider.exchange_code(
-            code="auth-code",
-            redirect_uri="http://localhost/callback",
-        )
-        assert result["access_token"] == "gh-token"
-
-        call_kwargs = mock_client.post.call_args
-        assert call_kwargs.kwargs["headers"]["Accept"] == "application/json"
-
-
-async def test_get_user_info_with_email(provider):
-    user_response = MagicMock()
-    user_response.status_code = 200
-    user_response.json.return_value = {
-        "id": 12345,
-        "login": "testuser",
-        "name": "Test User",
-        "email": "user@github.com",
-        "avatar_url": "https://avatars.githubusercontent.com/u/12345",
-    }
+    url = await provider.get_authorization_url(
+        state="s", redirect_uri="http://localhost"
+    )
+    query = parse_qs(urlsplit(url).query)
+    assert query["client_id"] == ["rotated-id"]
+    assert query["scope"][0].endswith(" extra")
 
-    emails_response = MagicMock()
-    emails_response.status_code = 200
-    emails_response.json.return_value = [
-        {"email": "user@github.com", "primary": True, "verified": True}
-    ]
 
-    mock_client = AsyncMock()
-    mock_client.get.side_effect = [user_response, emails_response]
-
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        user = await provider.get_user_info("gh-token")
-        assert user["id"] == "12345"
-        assert user["email"] == "user@github.com"
-        assert user["name"] == "Test User"
-        assert user["email_verified"] is True
-
-
-async def test_get_user_info_with_public_unverified_email(provider):
-    user_response = MagicMock()
-    user_response.status_code = 200
-    user_response.json.return_value = {
-        "id": 12345,
-        "login": "testuser",
-        "name": "Test User",
-        "email": "user@github.com",
-        "avatar_url": "https://avatars.githubusercontent.com/u/12345",
-    }
+async def test_exchange_code(provider, http_client):
+    mock_response = _response(
+        {
+            "access_token": "gh-token",
+            "token_type": "bearer",
+            "scope": "user:email",
+        }
+    )
 
-    emails_response = MagicMock()
-    emails_response.status_code = 200
-    emails_response.json.return_value = [
-        {"email": "user@github.com", "primary": True, "verified": False}
-    ]
+    http_client.post.return_value = mock_response
+
+    result = await provider.exchange_code(
+        code="auth-code",
+        redirect_uri="http://localhost/callback",
+    )
+    assert result["access_token"] == "gh-token"
+
+    call_kwargs = http_client.post.call_args
+    assert call_kwargs.kwargs["headers"]["Accept"] == "application/json"
 
-    mock_client = AsyncMock()
-    mock_client.get.side_effect = [user_response, emails_response]
-
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        user = await provider.get_user_info("gh-token")
-        assert user["email"] == "user@github.com"
-        assert user["email_verified"] is False
-
-
-async def test_get_user_info_email_fallback(provider):
-    user_response = MagicMock()
-    user_response.status_code = 200
-    user_response.json.return_value = {
-        "id": 12345,
-        "login": "testuser",
-        "name": None,
-        "email": None,
-        "avatar_url": None,
-    }
 
-    emails_response = MagicMock()
-    emails_response.status_code = 200
-    emails_response.json.return_value = [
+async def test_get_user_info_with_email(provider, http_client):
+    user_response = _response(
         {
-            "email": "secondary@example.com",
-            "primary": False,
-            "verified": True,
-        },
+            "id": 12345,
+            "login": "testuser",
+            "name": "Test User",
+            "email": "user@github.com",
+            "avatar_url": "https://avatars.githubusercontent.com/u/12345",
+        }
+    )
+
+    emails_response = _response(
+        [{"email": "user@github.com", "primary": True, "verified": True}]
+    )
+
+    http_client.get.side_effect = [user_response, emails_response]
+
+    user = await provider.get_user_info("gh-token")
+    assert user["id"] == "12345"
+    assert user["email"] == "user@github.com"
+    assert user["name"] == "Test User"
+    assert user["email_verified"] is True
+
+
+async def test_get_user_info_with_public_unverified_email(provider, http_client):
+    user_response = _response(
         {
-            "email": "primary@example.com",
-            "primary": True,
-            "verified": True,
-        },
-    ]
+            "id": 12345,
+            "login": "testuser",
+            "name": "Test User",
+            "email": "user@github.com",
+            "avatar_url": "https://avatars.githubusercontent.com/u/12345",
+        }
+    )
+
+    emails_response = _response(
+        [{"email": "user@github.com", "primary": True, "verified": False}]
+    )
+
+    http_client.get.side_effect = [user_response, emails_response]
+
+    user = await provider.get_user_info("gh-token")
+    assert user["email"] == "user@github.com"
+    assert user["email_verified"] is False
 
-    mock_client = AsyncMock()
-    mock_client.get.side_effect = [user_response, emails_response]
-
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        user = await provider.get_user_info("gh-token")
-        assert user["email"] == "primary@example.com"
-        assert user["email_verified"] is True
-        assert user["name"] == "testuser"
-
-
-async def test_get_user_info_email_fallback_unverified_primary(provider):
-    user_response = MagicMock()
-    user_response.status_code = 200
-    user_response.json.return_value = {
-        "id": 12345,
-        "login": "testuser",
-        "name": None,
-        "email": None,
-        "avatar_url": None,
-    }
 
-    emails_response = MagicMock()
-    emails_response.status_code = 200
-    emails_response.json.return_value = [
+async def test_get_user_info_email_fallback(provider, http_client):
+    user_response = _response(
         {
-            "email": "primary@example.com",
-            "primary": True,
-            "verified": False,
+            "id": 12345,
+            "login": "testuser",
+            "name": None,
+            "email": None,
+            "avatar_url": None,
         }
-    ]
+    )
 
-    mock_client = AsyncMock()
-    mock_client.get.side_effect = [user_response, emails_response]
+    emails_response = _response(
+        [
+            {
+                "email": "secondary@example.com",
+                "primary": False,
+                "verified": True,
+            },
+            {
+                "email": "primary@example.com",
+                "primary": True,
+                "verified": True,
+            },
+        ]
+    )
 
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+    http_client.get.side_effect = [user_response, emails_response]
 
-        user = await provider.get_user_info("gh-token")
-        assert user["email"] == "primary@example.com"
-        assert user["email_verified"] is False
+    user = await provider.get_user_info("gh-token")
+    assert user["email"] == "primary@example.com"
+    assert user["email_verified"] is True
+    assert user["name"] == "testuser"
+
+
+async def test_get_user_info_email_fallback_unverified_primary(provider, http_client):
+    user_response = _response(
+        {
+            "id": 12345,
+            "login": "testuser",
+            "name": None,
+            "email": None,
+            "avatar_url": None,
+        }
+    )
+
+    emails_response = _response(
+        [
+            {
+                "email": "primary@example.com",
+                "primary": True,
+                "verified": False,
+            }
+        ]
+    )
+
+    http_client.get.side_effect = [user_response, emails_response]
+
+    user = await provider.get_user_info("gh-token")
+    assert user["email"] == "primary@example.com"
+    assert user["email_verified"] is False
+
+
+@pytest.mark.parametrize(
+    ("emails", "expected"),
+    [
+        ([], None),
+        (
+            [
+                {"email": "a@example.com", "primary": False, "verified": False},
+                {"email": "b@example.com", "primary": False, "verified": True},
+            ],
+            ("a@example.com", False),
+        ),
+    ],
+    ids=["no-emails", "no-primary"],
+)
+async def test_get_user_info_email_fallback_without_primary(
+    provider, http_client, emails, expected
+):
+    user_response = _response(
+        {"id": 1, "login": "testuser", "email": None, "avatar_url": None}
+    )
+    http_client.get.side_effect = [user_response, _response(emails)]
+
+    if expected is None:
+        with pytest.raises(ProviderError, match="No email"):
+            await provider.get_user_info("gh-token")
+        return
+    user = await provider.get_user_info("gh-token")
+    assert (user["email"], user["email_verified"]) == expected
 
 
 async def test_refresh_returns_none(provider):
     result = await provider.refresh_access_token("token")
     assert result is None
+
+
+async def test_http_client_reused_across_calls():
+    provider = GitHubProvider(client_id="id", client_secret="secret")
+    mock_client = AsyncMock()
+    with patch("httpx.AsyncClient", return_value=mock_client) as mock_cls:
+        assert provider._get_client() is provider._get_client()
+        await provider.close()
+    mock_cls.assert_called_once()
+    mock_client.aclose.assert_awaited_once()
+
+
+async def test_injected_http_client_not_closed():
+    http_client = AsyncMock()
+    provider = GitHubProvider(
+        client_id="id", client_secret="secret", http_client=http_client
+    )
+    assert provider._get_client() is http_client
+    await provider.close()
+    http_client.aclose.assert_not_called()
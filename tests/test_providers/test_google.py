@@ -1,17 +1,31 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
 from fastauth.providers.google import GoogleProvider
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def provider():
     return GoogleProvider(
         client_id="test-client-id",
         client_secret="test-client-secret",
+        http_client=AsyncMock(),
     )
 
 
+@pytest.fixture
+def http_client(provider):
+    # The provider is shared across the module; give each test a fresh client.
+    provider._http_client = AsyncMock()
+    return provider._http_client
+
+
+def _response(payload, status_code=200):
+    return SimpleNamespace(status_code=status_code, json=lambda: payload, text="")
+
+
 async def test_authorization_url(provider):
     url = await provider.get_authorization_url(
         state="test-state",
@@ -36,6 +50,25 @@ async def test_authorization_url_with_pkce(provider):
     assert "code_challenge_method=S256" in url
 
 
+async def test_authorization_url_params(provider):
+    url = await provider.get_authorization_url(
+        state="test-state", redirect_uri="http://localhost/callback"
+    )
+    parts = urlsplit(url)
+    assert f"{parts.scheme}://{parts.netloc}{parts.path}" == (
+        GoogleProvider.AUTHORIZATION_URL
+    )
+    assert parse_qs(parts.query) == {
+        "client_id": ["test-client-id"],
+        "response_type": ["code"],
+        "scope": ["openid email profile"],
+        "access_type": ["offline"],
+        "prompt": ["consent"],
+        "redirect_uri": ["http://localhost/callback"],
+        "state": ["test-state"],
+    }
+
+
 async def test_custom_scopes():
     provider = GoogleProvider(
         client_id="id",
@@ -48,51 +81,67 @@ async def test_custom_scopes():
     assert "openid+email" in url or "openid%20email" in url
 
 
-async def test_exchange_code(provider):
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "access_token": "google-token",
-        "refresh_token": "google-refresh",
-    }
+async def test_authorization_url_follows_client_id_and_scopes(provider):
+    await provider.get_authorization_url(state="s", redirect_uri="http://localhost")
+    provider.client_id = "rotated-id"
+    provider.scopes.append("extra")
 
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        result = await provider.exchange_code(
-            code="auth-code",
-            redirect_uri="http://localhost/callback",
-            code_verifier="verifier",
-        )
-        assert result["access_token"] == "google-token"
-        mock_client.post.assert_called_once()
-
-
-async def test_get_user_info(provider):
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "sub": "google-uid-123",
-        "email": "user@gmail.com",
-        "name": "Test User",
-        "picture": "https://example.com/photo.jpg",
-        "email_verified": True,
-    }
+    url = await provider.get_authorization_url(
+        state="s", redirect_uri="http://localhost"
+    )
+    query = parse_qs(urlsplit(url).query)
+    assert query["client_id"] == ["rotated-id"]
+    assert query["scope"][0].endswith(" extra")
+
+
+async def test_exchange_code(provider, http_client):
+    http_client.post.return_value = _response(
+        {"access_token": "google-token", "refresh_token": "google-refresh"}
+    )
 
+    result = await provider.exchange_code(
+        code="auth-code",
+        redirect_uri="http://localhost/callback",
+        code_verifier="verifier",
+    )
+    assert result["access_token"] == "google-token"
+    http_client.post.assert_called_once()
+
+
+async def test_get_user_info(provider, http_client):
+    http_client.get.return_value = _response(
+        {
+            "sub": "google-uid-123",
+            "email": "user@gmail.com",
+            "name": "Test User",
+            "picture": "https://example.com/photo.jpg",
+            "email_verified": True,
+        }
+    )
+
+    user = await provider.get_user_info("google-token")
+    assert user["id"] == "google-uid-123"
+    assert user["email"] == "user@gmail.com"
+    assert user["name"] == "Test User"
+    assert user["image"] == "https://example.com/photo.jpg"
+    assert user["email_verified"] is True
+
+
+async def test_http_client_reused_across_calls():
+    provider = GoogleProvider(client_id="id", client_secret="secret")
     mock_client = AsyncMock()
-    mock_client.get.return_value = mock_response
-
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        user = await provider.get_user_info("google-token")
-        assert user["id"] == "google-uid-123"
-        assert user["email"] == "user@gmail.com"
-        assert user["name"] == "Test User"
-        assert user["image"] == "https://example.com/photo.jpg"
-        assert user["email_verified"] is True
+    with patch("httpx.AsyncClient", return_value=mock_client) as mock_cls:
+        assert provider._get_client() is provider._get_client()
+        await provider.close()
+    mock_cls.assert_called_once()
+    mock_client.aclose.assert_awaited_once()
+
+
+async def test_injected_http_client_not_closed():
+    http_client = AsyncMock()
+    provider = GoogleProvider(
+        client_id="id", client_secret="secret", http_client=http_client
+    )
+    assert provider._get_client() is http_client
+    await provider.close()
+    http_client.aclose.assert_not_called()
@@ -0,0 +1,41 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastauth.providers.github import GitHubProvider
+from fastauth.providers.google import GoogleProvider
+
+
+@pytest.fixture(params=[GoogleProvider, GitHubProvider], ids=["google", "github"])
+def provider_cls(request):
+    return request.param
+
+
+def test_new_client_for_a_new_event_loop(provider_cls, run_in_new_loop):
+    provider = provider_cls(client_id="id", client_secret="secret")
+
+    async def get_client():
+        return provider._get_client()
+
+    with patch("httpx.AsyncClient", side_effect=lambda **_: AsyncMock()) as mock_cls:
+        first = run_in_new_loop(get_client())
+        second = run_in_new_loop(get_client())
+        run_in_new_loop(provider.close())
+
+    assert mock_cls.call_count == 2
+    assert first is not second
+    first.aclose.assert_not_called()
+    second.aclose.assert_not_called()
+    assert provider._http_client is None
+
+
+def test_injected_client_kept_across_event_loops(provider_cls, run_in_new_loop):
+    http_client = AsyncMock()
+    provider = provider_cls(
+        client_id="id", client_secret="secret", http_client=http_client
+    )
+
+    async def get_client():
+        return provider._get_client()
+
+    assert run_in_new_loop(get_client()) is http_client
+    assert run_in_new_loop(get_client()) is http_client
@@ -25,10 +25,7 @@ async def test_google_exchange_code_uses_timeout():
     mock_client = AsyncMock()
     mock_client.post.return_value = mock_response
 
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("httpx.AsyncClient", return_value=mock_client) as mock_cls:
         await provider.exchange_code(code="c", redirect_uri="http://localhost/cb")
         timeout = _timeout_seconds(mock_cls.call_args.kwargs)
         assert timeout is not None
@@ -49,10 +46,7 @@ async def test_google_get_user_info_uses_timeout():
     mock_client = AsyncMock()
     mock_client.get.return_value = mock_response
 
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("httpx.AsyncClient", return_value=mock_client) as mock_cls:
         await provider.get_user_info("tok")
         timeout = _timeout_seconds(mock_cls.call_args.kwargs)
         assert timeout is not None
@@ -69,10 +63,7 @@ async def test_google_refresh_access_token_uses_timeout():
     mock_client = AsyncMock()
     mock_client.post.return_value = mock_response
 
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("httpx.AsyncClient", return_value=mock_client) as mock_cls:
         await provider.refresh_access_token("rt")
         timeout = _timeout_seconds(mock_cls.call_args.kwargs)
         assert timeout is not None
@@ -89,10 +80,7 @@ async def test_github_exchange_code_uses_timeout():
     mock_client = AsyncMock()
     mock_client.post.return_value = mock_response
 
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("httpx.AsyncClient", return_value=mock_client) as mock_cls:
         await provider.exchange_code(code="c", redirect_uri="http://localhost/cb")
         timeout = _timeout_seconds(mock_cls.call_args.kwargs)
         assert timeout is not None
@@ -120,10 +108,7 @@ async def test_github_get_user_info_uses_timeout():
     mock_client = AsyncMock()
     mock_client.get.side_effect = [mock_response, emails_response]
 
-    with patch("httpx.AsyncClient") as mock_cls:
-        mock_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_cls.return_value.__aexit__ = AsyncMock(return_value=False)
-
+    with patch("httpx.AsyncClient", return_value=mock_client) as mock_cls:
         await provider.get_user_info("tok")
         timeout = _timeout_seconds(mock_cls.call_args.kwargs)
         assert timeout is not None
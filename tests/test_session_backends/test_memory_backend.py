@@ -45,3 +45,30 @@ async def test_overwrite():
     data = await backend.read("s1")
     assert data is not None
     assert "user_id" in data and data["user_id"] == "u2"
+
+
+async def test_clear():
+    backend = MemorySessionBackend()
+    await backend.write("s1", {"user_id": "u1"}, ttl=3600)
+    backend.clear()
+    assert await backend.read("s1") is None
+
+
+async def test_write_evicts_expired_entries():
+    backend = MemorySessionBackend()
+    await backend.write("old", {"user_id": "u1"}, ttl=1)
+    await backend.write("fresh", {"user_id": "u2"}, ttl=3600)
+    with patch("fastauth.session_backends.memory.time") as mock_time:
+        mock_time.time.return_value = time.time() + 10
+        await backend.write("new", {"user_id": "u3"}, ttl=3600)
+    assert set(backend._store) == {"fresh", "new"}
+
+
+async def test_overwritten_entry_not_evicted_by_stale_expiry():
+    backend = MemorySessionBackend()
+    await backend.write("s1", {"user_id": "u1"}, ttl=1)
+    await backend.write("s1", {"user_id": "u2"}, ttl=3600)
+    with patch("fastauth.session_backends.memory.time") as mock_time:
+        mock_time.time.return_value = time.time() + 10
+        await backend.write("s2", {"user_id": "u3"}, ttl=3600)
+    assert backend._store["s1"][0] == {"user_id": "u2"}